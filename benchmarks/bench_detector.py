@@ -0,0 +1,150 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Benchmark of the detection latency of the phase detector.
+
+A flight with the given number of parabolas (10 Hz, g-levels with noise,
+announcements lagging the measured g-levels) is replayed by
+:class:`NovespaceStreamEmulator` (see
+:mod:`novespace_stream_data.scripts.novespace_emulator`) to a
+:class:`novespace_stream_data.receive.NoSpaStream` with a
+:class:`novespace_stream_data.receive.PhaseDetector`.
+
+Reported are the processing latency (local receive timestamp to event)
+and the lead of the detected phases over the announcements in the time
+of the data.
+
+Example:
+
+    python3 benchmarks/bench_detector.py -parabolas 5 -sleeptime 0.001
+"""
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from novespace_stream_data.receive import NoSpaStream, PhaseDetector
+from novespace_stream_data.scripts.novespace_emulator import (
+    NovespaceStreamEmulator)
+
+# phase, duration (s), g-level at start and at end
+PROFILE = (('STEADY FLIGHT', 20, 1.0, 1.0),
+           ('PULL UP', 20, 1.8, 1.8),
+           ('INJECTION', 3, 1.8, 0.0),
+           ('0G', 22, 0.0, 0.0),
+           ('PULL OUT', 3, 0.0, 1.8),
+           ('PULL OUT', 17, 1.8, 1.8),
+           ('STEADY FLIGHT', 3, 1.8, 1.0))
+
+
+def flight_samples(parabolas):
+    """
+    :return: list of tuples (ms, parabola, phase, g-level) at 10 Hz
+    """
+    milliseconds = 9 * 3600000
+    samples = []
+    for parabola in range(1, parabolas + 1):
+        for phase, duration, start, end in PROFILE:
+            number = 10 * duration
+            for i in range(number):
+                samples.append(
+                    (milliseconds, parabola, phase,
+                     start + (end - start) * i / number))
+                milliseconds += 100
+    return samples
+
+
+def create_flight(filepath, parabolas, delay, noise=0.02):
+    """
+    Create a flight of the given number of parabolas at 10 Hz.
+
+    :param delay: delay of the announcements in seconds
+    :return: list of tuples (ms, phase) of the announced phase changes
+    """
+    random.seed(0)
+    samples = flight_samples(parabolas)
+    changes = []
+    lag = int(10 * delay)
+    with open(filepath, 'w', encoding='utf-8') as filedescriptor:
+        for i, (milliseconds, _, _, level) in enumerate(samples):
+            _, announced_parabola, phase, _ = samples[max(0, i - lag)]
+            if (i >= lag) and (samples[i - lag - 1][2] != phase):
+                changes.append((milliseconds, phase))
+            jz = level + random.gauss(0, noise)
+            filedescriptor.write(
+                f'{milliseconds};'
+                f'{milliseconds // 60000 % 60:02d}:'
+                f'{milliseconds % 60000 / 1000:04.1f};'
+                f'{random.gauss(0, noise):.5f};{random.gauss(0, noise):.5f};'
+                f'{jz:.5f};19;46.2;944;{announced_parabola};{phase}\n')
+    return changes
+
+
+def main():
+    """
+    run the benchmark and print the latencies
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark of the detection latency of the phase "
+        "detector.")
+    parser.add_argument(
+        '-parabolas', default=3, type=int, dest='parabolas',
+        help='number of parabolas (default: %(default)s)')
+    parser.add_argument(
+        '-sleeptime', default=0.001, type=float, dest='sleeptime',
+        help='seconds between datagrams of the replay (default: '
+        '%(default)s)')
+    parser.add_argument(
+        '-delay', default=1.0, type=float, dest='delay',
+        help='delay of the announcements in seconds of the data '
+        '(default: %(default)s)')
+    parser.add_argument(
+        '-window', default=3, type=int, dest='window',
+        help='window of the phase detector (default: %(default)s)')
+    parser.add_argument(
+        '-port', default=31313, type=int, dest='port',
+        help='port used for the replay (default: %(default)s)')
+    args = parser.parse_args()
+    events = []
+    detector = PhaseDetector(args.window, callback=events.append)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filepath = Path(tmpdir, 'flight.csv')
+        changes = create_flight(filepath, args.parabolas, args.delay)
+        datastream = NoSpaStream(tmpdir, args.port)
+        datastream.do_exit = False
+        datastream.add_record_handler(detector)
+        datastream.start_streaming()
+        time.sleep(0.2)
+        NovespaceStreamEmulator(
+            str(filepath), 'localhost', args.port, args.sleeptime)()
+        time.sleep(0.2)
+        datastream.end_streaming()
+    latencies = [1000 * event['latency'] for event in events]
+    leads = {}
+    for event in events:
+        announced = [milliseconds for milliseconds, phase in changes
+                     if (phase == event['phase']) and
+                     (abs(milliseconds - int(event['ms'])) < 10000)]
+        if announced:
+            leads.setdefault(event['phase'], []).append(
+                (announced[0] - int(event['ms'])) / 1000)
+    print(f"received records       : {datastream.received}")
+    print(f"announced phase changes: {len(changes)}")
+    print(f"detected events        : {len(events)}")
+    if latencies:
+        print(f"processing latency (ms): mean "
+              f"{statistics.mean(latencies):.3f}, "
+              f"max {max(latencies):.3f}")
+    print("lead of the detection over the announcement (s):")
+    for phase, values in leads.items():
+        print(f"  {phase:15s}: mean {statistics.mean(values):6.2f}, "
+              f"min {min(values):6.2f}, max {max(values):6.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Benchmark of the bulk reader for the csv files of the receiver.
+
+A log with the given number of rows (1000000 rows are about 28 hours
+at 10 Hz) is created from the example data and read by a row-by-row
+parser with the csv module and by
+:func:`novespace_stream_data.analysis.read_log`. For comparison the
+same data is read from a binary capture (memory map, no parsing).
+
+Example:
+
+    python3 benchmarks/bench_reader.py -rows 1000000
+"""
+
+import argparse
+import csv
+import tempfile
+import time
+from importlib.resources import files
+from pathlib import Path
+
+from novespace_stream_data.analysis import read_log
+from novespace_stream_data.receive import (
+    CSV_FIELDNAMES, BinaryCaptureWriter, BufferedCSVWriter)
+
+
+def create_log(csv_file, number, writer_class=BufferedCSVWriter):
+    """
+    create a log of the receiver with number rows
+    """
+    filepath = files("novespace_stream_data").joinpath(
+        "data/example_data.csv")
+    with open(filepath, newline='', encoding='utf-8') as csvfile:
+        rows = [",".join(row) for row in csv.reader(csvfile)]
+    writer = writer_class(csv_file, CSV_FIELDNAMES, flush_rows=0,
+                          flush_interval=None)
+    writer.open()
+    unixtime = time.time()
+    for i in range(number):
+        writer.write_record(unixtime + 0.1 * i, rows[i % len(rows)])
+    writer.close()
+
+
+def row_by_row(csv_file):
+    """
+    typical row-by-row parser
+    """
+    columns = {name: [] for name in CSV_FIELDNAMES}
+    with open(csv_file, newline='', encoding='utf-8') as filedescriptor:
+        filedescriptor.readline()
+        for row in csv.reader(filedescriptor):
+            fields = row[0].split(';')
+            for name, value in zip(CSV_FIELDNAMES, fields):
+                if name in (' Time', ' Announcement'):
+                    columns[name].append(value)
+                else:
+                    columns[name].append(float(value))
+    return columns
+
+
+def main():
+    """
+    run the benchmark and print rows/s for every parser
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark of the bulk reader of the receiver logs.")
+    parser.add_argument(
+        '-rows', default=1000000, type=int, dest='rows',
+        help='number of rows of the log (default: %(default)s)')
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        csv_file = Path(tmpdir, 'log.csv')
+        create_log(csv_file, args.rows)
+        capture = Path(tmpdir, 'log.nsb')
+        create_log(capture, args.rows, BinaryCaptureWriter)
+        print(f'log with {args.rows} rows: '
+              f'{csv_file.stat().st_size / 2**20:.1f} MiB (csv), '
+              f'{capture.stat().st_size / 2**20:.1f} MiB (binary)')
+        for name, function, path in (
+                ('row by row (csv module)', row_by_row, csv_file),
+                ('read_log (csv)', read_log, csv_file),
+                ('read_log (binary capture)', read_log, capture)):
+            start = time.perf_counter()
+            function(path)
+            duration = time.perf_counter() - start
+            print(f'{name:26s}: {duration:6.2f} s, '
+                  f'{args.rows / duration:10.0f} rows/s')
+
+
+if __name__ == "__main__":
+    main()
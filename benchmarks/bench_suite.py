@@ -0,0 +1,365 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Benchmark suite of the hot paths of the receiver and the emulator.
+
+Everything runs offline on loopback:
+
+* receiver: maximal sustained rate without loss (rate steps of
+  :class:`novespace_stream_data.emulate.LoadGenerator` until datagrams
+  are lost) and CPU time per record of the receiving process
+* latency: p50/p99 of the time from receiving a datagram until its row
+  is flushed to the operating system (from the latency histogram of the
+  metrics of the receiver)
+* pacing: rate, jitter and lateness of
+  :class:`NovespaceStreamEmulator` at 10 Hz, 1 kHz and as fast as
+  possible
+* write_path: CPU time per record of the write path of the receiver
+  per capture format (e. g. csv against the raw capture, which stores
+  the datagrams without decoding)
+* reader: rows/s of :func:`novespace_stream_data.analysis.read_log`
+  (needs numpy)
+
+The results are printed and written as JSON (`-output`); `-compare`
+shows the change against the results of an earlier version.
+
+Example:
+
+    python3 benchmarks/bench_suite.py -output results-0.3.1.json
+    python3 benchmarks/bench_suite.py -compare results-0.3.1.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import platform
+import socket
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from bench_reader import create_log
+
+import novespace_stream_data
+from novespace_stream_data.emulate import LoadGenerator
+from novespace_stream_data.emulate.load import synthetic_datagram
+from novespace_stream_data.receive import (
+    WRITERS, BinaryCaptureWriter, BufferedCSVWriter, NoSpaStream,
+    SequenceTracker)
+from novespace_stream_data.scripts.novespace_emulator import (
+    NovespaceStreamEmulator)
+
+BENCHMARKS = ('receiver', 'latency', 'pacing', 'write_path', 'reader')
+
+
+def percentile(histogram, fraction):
+    """
+    :param histogram: :class:`novespace_stream_data.receive.Histogram`
+    :return: percentile of the observed values (linear within a bucket
+             like the histogram_quantile of Prometheus) or nan
+    """
+    if histogram.count == 0:
+        return math.nan
+    rank = fraction * histogram.count
+    cumulative = 0
+    lower = 0.0
+    for upper, count in zip(histogram.buckets, histogram.counts):
+        if count and cumulative + count >= rank:
+            return lower + (upper - lower) * (rank - cumulative) / count
+        cumulative += count
+        lower = upper
+    # in the bucket +Inf
+    return histogram.buckets[-1]
+
+
+def start_receiver(tmpdir, port, **kwargs):
+    """
+    start a receiver in this process without exiting at the end
+    """
+    receiver = NoSpaStream(tmpdir, port, **kwargs)
+    receiver.do_exit = False
+    receiver.start_streaming()
+    time.sleep(0.2)
+    return receiver
+
+
+def receiver_step(receiver, generator, tracker, rate, duration):
+    """
+    :return: dictionary with the sent, received and lost datagrams and
+             the CPU time per record of a rate step
+    """
+    tracker.reset()
+    dropped = receiver.get_stage_dropped()
+    cpu = time.process_time()
+    result = generator.run_step(rate, duration)
+    time.sleep(0.5)
+    cpu = time.process_time() - cpu
+    received = tracker.get_statistics()['received']
+    return {'rate': rate, 'achieved_rate': result['rate'],
+            'sent': result['sent'], 'received': received,
+            'lost': (result['sent'] - received +
+                     receiver.get_stage_dropped() - dropped),
+            'cpu_per_record_us': 1e6 * cpu / max(received, 1)}
+
+
+def bench_receiver(port, rates, duration, queue_size):
+    """
+    Increase the rate until datagrams are lost.
+
+    :return: dictionary with the maximal rate without loss, the CPU time
+             per record at this rate and the results of all steps
+    """
+    generator = LoadGenerator('localhost', port, 1, workers=1)
+    tracker = SequenceTracker()
+    steps = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        receiver = start_receiver(tmpdir, port, queue_size=queue_size,
+                                  overflow='drop-newest')
+        receiver.add_record_handler(tracker)
+        try:
+            for rate in rates:
+                steps.append(receiver_step(
+                    receiver, generator, tracker, rate, duration))
+                if steps[-1]['lost'] > 0:
+                    break
+        finally:
+            generator.close()
+            receiver.end_streaming()
+    lossless = [step for step in steps if step['lost'] == 0]
+    return {'max_sustained_rate': (lossless[-1]['achieved_rate']
+                                   if lossless else 0.0),
+            'cpu_per_record_us': (lossless[-1]['cpu_per_record_us']
+                                  if lossless else math.nan),
+            'steps': steps}
+
+
+def bench_latency(port, rate, duration, flush_rows):
+    """
+    Measure the time from the receive timestamp of a datagram until its
+    row is flushed with the latency histogram of the metrics of the
+    receiver.
+
+    :return: dictionary with p50, p99 and mean in ms
+    """
+    generator = LoadGenerator('localhost', port, 1, workers=1)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        receiver = start_receiver(
+            tmpdir, port, flush_rows=flush_rows,
+            metrics=str(Path(tmpdir, 'metrics.sock')))
+        try:
+            generator.run_step(rate, duration)
+            time.sleep(0.2)
+        finally:
+            generator.close()
+            receiver.end_streaming()
+    latency = receiver.metrics.latency
+    return {'rate': rate, 'flush_rows': flush_rows,
+            'rows': latency.count,
+            'p50_ms': 1000 * percentile(latency, 0.5),
+            'p99_ms': 1000 * percentile(latency, 0.99),
+            'mean_ms': (1000 * latency.sum / latency.count
+                        if latency.count else math.nan)}
+
+
+def bench_pacing(port, duration, maximum):
+    """
+    Run the emulator at 10 Hz, 1 kHz and as fast as possible.
+
+    :return: dictionary with the report of the pacer per rate
+    """
+    results = {}
+    # a bound socket nobody reads: the kernel drops the datagrams
+    sink = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sink.bind(('localhost', port))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name, interval in (('10Hz', 0.1), ('1kHz', 0.001),
+                               ('max', 0.0)):
+            number = int(duration / interval) if interval else maximum
+            filepath = Path(tmpdir, f'{name}.csv')
+            filepath.write_bytes(b'\n'.join(
+                synthetic_datagram(100 * i) for i in range(number)))
+            emulator = NovespaceStreamEmulator(
+                str(filepath), 'localhost', port, interval)
+            emulator()
+            report = emulator.pacer.get_report()
+            results[name] = {
+                'target_rate': 1 / interval if interval else math.inf,
+                'rate': report['rate'],
+                'jitter_ms': 1000 * report['jitter'],
+                'lateness_mean_ms': 1000 * report['lateness_mean'],
+                'lateness_max_ms': 1000 * report['lateness_max']}
+    sink.close()
+    return results
+
+
+def bench_write_path(port, rows):
+    """
+    Pass datagrams to the write path of the receiver (without sockets)
+    for every capture format.
+
+    :return: dictionary with the CPU time per record per format and the
+             speed-up of the raw capture against csv
+    """
+    datagrams = [synthetic_datagram(100 * i) for i in range(1000)]
+    results = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for capture_format in WRITERS:
+            receiver = NoSpaStream(tmpdir, port,
+                                   capture_format=capture_format)
+            receiver.csv_file = Path(tmpdir, f'{capture_format}.csv')
+            receiver.open_writers()
+            cpu = time.process_time()
+            for i in range(rows):
+                receiver.write_data(time.time(), datagrams[i % 1000], port)
+            receiver.close_writer()
+            results[f'{capture_format}_cpu_per_record_us'] = \
+                1e6 * (time.process_time() - cpu) / rows
+    results['raw_speedup'] = (results['csv_cpu_per_record_us'] /
+                              results['raw_cpu_per_record_us'])
+    return results
+
+
+def bench_reader(rows):
+    """
+    Read a csv log and a binary capture with read_log.
+
+    :return: dictionary with rows/s per format
+    """
+    try:
+        # pylint: disable=import-outside-toplevel
+        from novespace_stream_data.analysis import read_log
+    except ImportError as msg:
+        return {'skipped': str(msg)}
+    results = {'rows': rows}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name, filename, writer_class in (
+                ('csv', 'log.csv', BufferedCSVWriter),
+                ('binary', 'log.nsb', BinaryCaptureWriter)):
+            path = Path(tmpdir, filename)
+            create_log(path, rows, writer_class)
+            start = time.perf_counter()
+            read_log(path)
+            results[f'{name}_rows_per_second'] = rows / (
+                time.perf_counter() - start)
+    return results
+
+
+def finite(results):
+    """
+    :return: copy of the results with None instead of nan and inf
+             (valid JSON)
+    """
+    if isinstance(results, dict):
+        return {key: finite(value) for key, value in results.items()}
+    if isinstance(results, list):
+        return [finite(value) for value in results]
+    if isinstance(results, float) and not math.isfinite(results):
+        return None
+    return results
+
+
+def flatten(results, prefix=''):
+    """
+    :return: dictionary of the numbers in the results (without the
+             single steps) with the path as key
+    """
+    values = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            values.update(flatten(value, f'{prefix}{key}.'))
+        elif isinstance(value, (int, float)) and key != 'steps':
+            values[f'{prefix}{key}'] = value
+    return values
+
+
+def compare(old, new):
+    """
+    print the results next to the results of an earlier run
+    """
+    print(f"\ncompared with version {old['version']} "
+          f"({old['date']}):")
+    old_values = flatten(old['results'])
+    for key, value in flatten(new['results']).items():
+        if key in old_values:
+            change = (value / old_values[key] - 1
+                      if old_values[key] else math.nan)
+            print(f"{key:40s} {old_values[key]:14.3f} {value:14.3f} "
+                  f"{100 * change:+8.1f} %")
+
+
+def main():
+    """
+    run the benchmarks, print the results and write them as JSON
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark suite of the receiver and the emulator "
+        "(loopback, offline).")
+    parser.add_argument(
+        '-benchmarks', nargs='+', default=list(BENCHMARKS),
+        choices=BENCHMARKS, dest='benchmarks',
+        help='benchmarks to run (default: all)')
+    parser.add_argument(
+        '-rates', nargs='+', type=float,
+        default=[1000, 5000, 10000, 20000, 40000, 80000], dest='rates',
+        help='datagrams per second of the receiver steps '
+        '(default: %(default)s)')
+    parser.add_argument(
+        '-duration', default=2.0, type=float, dest='duration',
+        help='seconds per measurement (default: %(default)s)')
+    parser.add_argument(
+        '-queue_size', default=4096, type=int, dest='queue_size',
+        help='queue_size of the receiver (default: %(default)s)')
+    parser.add_argument(
+        '-flush_rows', default=10, type=int, dest='flush_rows',
+        help='flush_rows of the receiver for the latency '
+        '(default: %(default)s)')
+    parser.add_argument(
+        '-rows', default=200000, type=int, dest='rows',
+        help='rows of the log for the reader and datagrams for the '
+        'emulator as fast as possible (default: %(default)s)')
+    parser.add_argument(
+        '-port', default=31400, type=int, dest='port',
+        help='first port used on loopback (default: %(default)s)')
+    parser.add_argument(
+        '-output', default=None, type=str, dest='output',
+        help='write the results as JSON to this file')
+    parser.add_argument(
+        '-compare', default=None, type=str, dest='compare',
+        help='JSON file of an earlier run to compare with')
+    args = parser.parse_args()
+    runs = {
+        'receiver': lambda: bench_receiver(
+            args.port, args.rates, args.duration, args.queue_size),
+        'latency': lambda: bench_latency(
+            args.port + 1, 1000, args.duration, args.flush_rows),
+        'pacing': lambda: bench_pacing(
+            args.port + 2, args.duration, args.rows),
+        'write_path': lambda: bench_write_path(args.port + 3, args.rows),
+        'reader': lambda: bench_reader(args.rows)}
+    results = {}
+    for name in args.benchmarks:
+        with contextlib.redirect_stdout(io.StringIO()):
+            results[name] = runs[name]()
+        print(f"{name}: " + ", ".join(
+            f"{key}: {value:.3f}" for key, value in
+            flatten(results[name]).items()))
+    output = {'version': novespace_stream_data.__version__,
+              'python': sys.version.split()[0],
+              'platform': platform.platform(),
+              'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+              'results': finite(results)}
+    if args.output is not None:
+        with open(args.output, 'w', encoding='utf-8') as filedescriptor:
+            json.dump(output, filedescriptor, indent=1)
+    if args.compare is not None:
+        with open(args.compare, encoding='utf-8') as filedescriptor:
+            compare(json.load(filedescriptor), output)
+
+
+if __name__ == "__main__":
+    main()
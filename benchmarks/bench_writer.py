@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Benchmark of the csv write path of the receiver.
+
+The former implementation opened the csv file, created a csv writer,
+wrote one row and closed the file for every datagram. This is compared
+with :class:`novespace_stream_data.receive.BufferedCSVWriter` using
+different flush policies.
+
+Example:
+
+    python3 benchmarks/bench_writer.py -rows 100000
+"""
+
+import argparse
+import csv
+import tempfile
+import time
+from importlib.resources import files
+from pathlib import Path
+
+from novespace_stream_data.receive import BufferedCSVWriter
+
+
+def example_rows():
+    """
+    :return: datagrams of the example data
+    """
+    filepath = files("novespace_stream_data").joinpath(
+        "data/example_data.csv")
+    with open(filepath, newline='', encoding='utf-8') as csvfile:
+        return [",".join(row) for row in csv.reader(csvfile)]
+
+
+def open_per_row(csv_file, rows, number):
+    """
+    write rows like the former implementation (open/close per datagram)
+    """
+    for i in range(number):
+        data_str = str(time.time()) + ';' + rows[i % len(rows)]
+        with open(csv_file, mode='a',
+                  newline='', encoding='utf-8') as filedescriptor:
+            csv.writer(filedescriptor).writerow([data_str])
+
+
+def buffered(csv_file, rows, number, **kwargs):
+    """
+    write rows with BufferedCSVWriter
+    """
+    writer = BufferedCSVWriter(csv_file, [], **kwargs)
+    writer.open(write_header=False)
+    for i in range(number):
+        writer.write_record(time.time(), rows[i % len(rows)])
+    writer.close()
+
+
+def main():
+    """
+    run the benchmark and print rows/s for every variant
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark of the csv write path of the receiver.")
+    parser.add_argument(
+        '-rows', default=100000, type=int, dest='rows',
+        help='number of rows to write (default: %(default)s)')
+    args = parser.parse_args()
+    rows = example_rows()
+    variants = [
+        ('open per row (former)', open_per_row, {}),
+        ('buffered, flush every row', buffered, {'flush_rows': 1}),
+        ('buffered, flush every 10 rows', buffered, {'flush_rows': 10}),
+        ('buffered, flush every 1 s', buffered,
+         {'flush_rows': 0, 'flush_interval': 1.0}),
+        ('buffered, fsync every 100 rows', buffered,
+         {'flush_rows': 100, 'fsync': True}),
+    ]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for i, (name, function, kwargs) in enumerate(variants):
+            csv_file = Path(tmpdir, f'{i}.csv')
+            start = time.perf_counter()
+            function(csv_file, rows, args.rows, **kwargs)
+            duration = time.perf_counter() - start
+            print(f'{name:32s}: {args.rows / duration:12.0f} rows/s')
+
+
+if __name__ == "__main__":
+    main()
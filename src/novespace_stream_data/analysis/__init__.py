@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+:mod:`novespace_stream_data.analysis`
+=====================================
+   :synopsis: :mod:`novespace_stream_data.analysis` is a python submodule to
+              analyse the logged stream from Novespace/AirZeroG after
+              scientific research flights.
+
+.. contents::
+
+description
+===========
+
+`novespace_stream_data.analysis` reads the files of the receiver in bulk
+into numpy arrays, keeps the latest measurements for live plots and aligns
+the stream time with the local clock. It needs numpy (`pip3 install
+novespace_stream_data[analysis]`); pandas is only needed for
+:func:`to_dataframe`.
+
+Available functions are:
+
+.. autofunction:: read_log
+
+.. autofunction:: to_dataframe
+
+.. autoclass:: LiveTraces
+   :members:
+
+.. autofunction:: decimate_minmax
+
+.. autofunction:: read_clock_log
+
+.. autofunction:: fit_clock
+
+.. autofunction:: align_clock
+
+copyright + license
+===================
+:Author: Daniel Maier, Daniel Mohr, Thomas Villatte
+:Date: 2026-10-17
+:License: GPL-3.0-or-later
+:Copyright: (C) 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+"""
+
+from .clock import align_clock, fit_clock, read_clock_log
+from .live import LiveTraces, decimate_minmax
+from .reader import read_log, to_dataframe
+
+__all__ = ["LiveTraces", "align_clock", "decimate_minmax", "fit_clock",
+           "read_clock_log", "read_log", "to_dataframe"]
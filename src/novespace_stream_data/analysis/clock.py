@@ -0,0 +1,155 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Conversion of the stream time of logs to local unix time.
+
+Copyright (C) 2026 Daniel Maier (University of Greifswald),
+                   Daniel Mohr (University of Greifswald),
+                   Thomas Villatte (Novespace)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+The clock model is described in
+:mod:`novespace_stream_data.receive.clock_sync`.
+"""
+
+import numpy
+
+from novespace_stream_data.receive.clock_sync import CLOCK_COLUMNS
+from novespace_stream_data.receive.loss_monitor import DAY
+
+
+def read_clock_log(path):
+    """
+    Read a clock log of the receiver.
+
+    :param path: path of the clock log
+    :return: dictionary of numpy arrays, keys CLOCK_COLUMNS plus 'drift'
+    """
+    table = numpy.genfromtxt(path, delimiter=';', skip_header=1,
+                             dtype=numpy.float64, ndmin=2)
+    models = {name: table[:, column] if len(table) else
+              numpy.empty(0) for column, name in enumerate(CLOCK_COLUMNS)}
+    models['reference_ms'] = models['reference_ms'].astype(numpy.int64)
+    models['drift'] = 1e-6 * models['drift_ppm']
+    return models
+
+
+def _elapsed(milliseconds):
+    """
+    :param milliseconds: column 'miliseconds since 00:00:00'
+    :return: stream time in seconds since the first row (over midnight)
+    """
+    steps = numpy.diff(milliseconds)
+    return numpy.concatenate(([0], numpy.cumsum(
+        (steps + DAY // 2) % DAY - DAY // 2))) / 1000
+
+
+def _least_delays(elapsed, delay, block_seconds):
+    """
+    :param elapsed: stream time in seconds
+    :param delay: local time minus stream time
+    :param block_seconds: length of a block of stream time in seconds
+    :return: tuple (stream times, delays) of the row with the least
+             delay of every block
+    """
+    blocks = numpy.floor((elapsed - elapsed.min()) / block_seconds)
+    order = numpy.lexsort((delay, blocks))
+    first = order[numpy.concatenate(
+        ([True], numpy.diff(blocks[order]) != 0))]
+    return elapsed[first], delay[first]
+
+
+def _theil_sen(x, y):
+    """
+    Fit a line robustly, see
+    :func:`novespace_stream_data.receive.clock_sync.theil_sen`.
+
+    :return: tuple (slope, intercept)
+    """
+    pairs = numpy.triu_indices(len(x), 1)
+    run = x[pairs[1]] - x[pairs[0]]
+    distinct = run != 0
+    slope = numpy.median(
+        (y[pairs[1]] - y[pairs[0]])[distinct] / run[distinct]) \
+        if distinct.any() else 0.0
+    return slope, numpy.median(y - slope * x)
+
+
+def fit_clock(milliseconds, unixtime, block_seconds=10.0):
+    """
+    Fit a clock model to a whole log at once, like
+    :class:`novespace_stream_data.receive.ClockSync` but with all blocks.
+
+    :param milliseconds: column 'miliseconds since 00:00:00' (ms)
+    :param unixtime: local timestamps (unixtime)
+    :param block_seconds: length of a block of stream time in seconds
+    :return: dictionary with arrays of length 1 (as
+             :func:`read_clock_log`) or None without valid rows
+    """
+    milliseconds = numpy.asarray(milliseconds, dtype=numpy.int64)
+    unixtime = numpy.asarray(unixtime, dtype=numpy.float64)
+    # invalid values are marked by -1 (see read_log)
+    valid = (milliseconds >= 0) & numpy.isfinite(unixtime)
+    milliseconds, unixtime = milliseconds[valid], unixtime[valid]
+    if len(milliseconds) == 0:
+        return None
+    elapsed = _elapsed(milliseconds)
+    delay = unixtime - elapsed
+    x, y = _least_delays(elapsed, delay, block_seconds)
+    slope, intercept = _theil_sen(x, y)
+    reference = x.max()
+    return {'unixtime': unixtime[-1:],
+            'reference_ms': numpy.array(
+                [(milliseconds[0] + round(1000 * reference)) % DAY]),
+            'reference_time': numpy.array(
+                [reference * (1 + slope) + intercept]),
+            'drift_ppm': numpy.array([1e6 * slope]),
+            'delay_ms': numpy.array(
+                [1e3 * (delay - intercept - slope * elapsed).mean()]),
+            'blocks': numpy.array([float(len(x))]),
+            'drift': numpy.array([slope])}
+
+
+def align_clock(log, models=None):
+    """
+    Convert the stream time of a log to local unix time without the
+    jitter of the network.
+
+    Every row is converted with the first model written after its local
+    timestamp, so the row was part of the fit (the last model is used
+    for later rows).
+
+    :param log: dictionary returned by
+                :func:`novespace_stream_data.analysis.read_log` (columns
+                'ms' and 'unixtime' are used)
+    :param models: dictionary returned by :func:`read_clock_log` or
+                   :func:`fit_clock` (default: fit to the log)
+    :return: numpy array of the aligned local unix times (NaN for
+             invalid rows)
+    """
+    if models is None:
+        models = fit_clock(log['ms'], log['unixtime'])
+        if models is None:
+            return numpy.full(len(log['ms']), numpy.nan)
+    milliseconds = numpy.asarray(log['ms'], dtype=numpy.int64)
+    select = numpy.minimum(numpy.searchsorted(
+        models['unixtime'], log['unixtime']), len(models['unixtime']) - 1)
+    delta = (milliseconds - models['reference_ms'][select] + DAY // 2) % \
+        DAY - DAY // 2
+    aligned = models['reference_time'][select] + \
+        delta / 1000 * (1 + models['drift'][select])
+    return numpy.where(milliseconds >= 0, aligned, numpy.nan)
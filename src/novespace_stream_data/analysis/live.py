@@ -0,0 +1,142 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Ring buffers of the latest measurements for live plots.
+
+Copyright (C) 2026 Daniel Maier (University of Greifswald),
+                   Daniel Mohr (University of Greifswald),
+                   Thomas Villatte (Novespace)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from threading import Lock
+
+import numpy
+
+from novespace_stream_data.receive.sequence import split_sequence
+
+# index of the columns in the last 10 fields of a datagram
+CHANNELS = {'jx': 2, 'jy': 3, 'jz': 4, 'temperature': 5, 'humidity': 6,
+            'pressure': 7}
+
+
+def decimate_minmax(values, width):
+    """
+    Reduce traces to the minimum and maximum per pixel column, so peaks
+    are kept at any length of the traces.
+
+    :param values: array of shape (channels, samples)
+    :param width: number of columns
+    :return: tuple (minima, maxima), arrays of shape
+             (channels, min(width, samples)); NaN is ignored
+    """
+    samples = values.shape[1]
+    if samples <= width:
+        return values, values
+    starts = (numpy.arange(width) * samples) // width
+    return (numpy.fmin.reduceat(values, starts, axis=1),
+            numpy.fmax.reduceat(values, starts, axis=1))
+
+
+class LiveTraces():
+    """
+    This class keeps the latest `capacity` samples of some columns in
+    fixed-size numpy ring buffers, so the memory and the time to plot
+    them do not grow during a flight.
+
+    An instance is called with every record; it can be given to
+    :meth:`novespace_stream_data.receive.NoSpaStream.add_record_handler`.
+    :meth:`add_record` takes typed records instead (see
+    :meth:`novespace_stream_data.receive.NoSpaStream.add_parsed_handler`).
+    """
+
+    def __init__(self, capacity=3000,
+                 channels=('jx', 'jy', 'jz', 'pressure')):
+        """
+        :param capacity: number of samples kept
+        :param channels: names of the columns, keys of CHANNELS
+        """
+        self.channels = tuple(channels)
+        self.columns = [CHANNELS[channel] for channel in self.channels]
+        self.times = numpy.full(capacity, numpy.nan)
+        self.values = numpy.full((len(self.channels), capacity), numpy.nan)
+        self.count = 0
+        self.invalid = 0
+        self.lock = Lock()
+
+    def __call__(self, unixtime, data_str, port=None):
+        """
+        Add a record.
+
+        :param unixtime: local timestamp of the record
+        :param data_str: decoded datagram (the port of the tagged layout
+                         may be in front, a sequence number behind)
+        :param port: port the datagram was received on (not used)
+        """
+        if split_sequence(data_str) is not None:
+            data_str = data_str.rpartition(';')[0]
+        fields = data_str.rsplit(';', 9)
+        try:
+            values = [float(fields[column]) for column in self.columns]
+        except (ValueError, IndexError):
+            self.invalid += 1
+            return
+        self.append(unixtime, values)
+
+    def add_record(self, record):
+        """
+        Add a typed record.
+
+        :param record: :class:`novespace_stream_data.receive.Record`
+        """
+        self.append(record.unixtime,
+                    [getattr(record, channel) for channel in self.channels])
+
+    def append(self, unixtime, values):
+        """
+        Store a sample in the ring buffers.
+
+        :param unixtime: local timestamp of the sample
+        :param values: values of the channels
+        """
+        with self.lock:
+            index = self.count % len(self.times)
+            self.times[index] = unixtime
+            self.values[:, index] = values
+            self.count += 1
+
+    def get_recent(self):
+        """
+        :return: tuple (local timestamps, values of shape
+                 (channels, samples)) of the kept samples, oldest first
+        """
+        with self.lock:
+            capacity = len(self.times)
+            if self.count <= capacity:
+                return (self.times[:self.count].copy(),
+                        self.values[:, :self.count].copy())
+            order = numpy.roll(numpy.arange(capacity),
+                               -(self.count % capacity))
+            return self.times[order], self.values[:, order]
+
+    def decimate(self, width):
+        """
+        :param width: number of pixel columns
+        :return: tuple (minima, maxima) of the kept samples, see
+                 :func:`decimate_minmax`
+        """
+        return decimate_minmax(self.get_recent()[1], width)
@@ -0,0 +1,273 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Bulk reader for the files written by the receiver.
+
+Copyright (C) 2026 Daniel Maier (University of Greifswald),
+                   Daniel Mohr (University of Greifswald),
+                   Thomas Villatte (Novespace)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from pathlib import Path
+
+import numpy
+
+from novespace_stream_data.receive import get_index, load_binary_capture
+
+FLOAT_COLUMNS = ('unixtime', 'ms', None, 'jx', 'jy', 'jz',
+                 'temperature', 'humidity', 'pressure', 'parabola')
+INTEGER_COLUMNS = ('ms', 'parabola')
+
+
+def _to_float(values):
+    """
+    Convert a list of strings to float64.
+
+    The fast path converts all values at once; if this fails, every
+    value is converted separately (decimal comma allowed, NaN for
+    invalid values).
+    """
+    try:
+        return numpy.array(values, dtype=numpy.float64)
+    except ValueError:
+        pass
+    result = numpy.empty(len(values), dtype=numpy.float64)
+    for index, value in enumerate(values):
+        try:
+            result[index] = float(value.replace(',', '.'))
+        except ValueError:
+            result[index] = numpy.nan
+    return result
+
+
+def _to_seconds(values):
+    """
+    Convert the column ' Time' (mm:ss.f) to seconds.
+    """
+    parts = ':'.join(values).split(':')
+    if len(parts) == 2 * len(values):
+        minutes = _to_float(parts[0::2])
+        seconds = _to_float(parts[1::2])
+        return 60 * minutes + seconds
+    result = numpy.full(len(values), numpy.nan)
+    for index, value in enumerate(values):
+        minutes, _, seconds = value.partition(':')
+        result[index] = 60 * _to_float([minutes])[0] + \
+            _to_float([seconds])[0]
+    return result
+
+
+def _separators_per_line(text):
+    """
+    :param text: complete lines
+    :return: numpy array with the number of ';' of every line
+    """
+    data = numpy.frombuffer(text.encode('utf-8'), dtype=numpy.uint8)
+    separators = numpy.searchsorted(numpy.flatnonzero(data == ord(';')),
+                                    numpy.flatnonzero(data == ord('\n')))
+    return numpy.diff(separators, prepend=0)
+
+
+def _parse_chunk(text, columns, announcement_codes):
+    """
+    Parse a chunk of complete data lines.
+
+    :param text: data lines
+    :param columns: number of fields per line
+    :param announcement_codes: dictionary announcement -> code,
+                               extended by new announcements
+    :return: tuple (dictionary of arrays, number of skipped lines)
+    """
+    if '"' in text:
+        # quoted layout: the csv writer quoted the whole row
+        text = text.replace('""', '\0').replace('"', '').replace('\0', '"')
+    skipped = 0
+    lines = text.count('\n')
+    fields = []
+    if (_separators_per_line(text) == columns - 1).all():
+        # fast path: every line has the expected number of fields
+        fields = text.replace('\r\n', ';').replace('\n', ';').split(';')
+        fields.pop()
+    if len(fields) != columns * lines:
+        valid = [line for line in text.splitlines()
+                 if line.count(';') == columns - 1]
+        skipped = lines - len(valid)
+        fields = ';'.join(valid).split(';') if valid else []
+    offset = columns - 11  # 1 for the tagged layout with ' Port'
+    arrays = {}
+    for index, name in enumerate(FLOAT_COLUMNS):
+        if name is not None:
+            column = index + offset if index > 0 else 0
+            arrays[name] = _to_float(fields[column::columns])
+    arrays['time'] = _to_seconds(fields[2 + offset::columns])
+    if offset:
+        arrays['port'] = _to_float(fields[1::columns])
+    announcements = fields[10 + offset::columns]
+    for name in set(announcements):
+        announcement_codes.setdefault(name, len(announcement_codes))
+    arrays['announcement'] = numpy.array(
+        list(map(announcement_codes.__getitem__, announcements)),
+        dtype=numpy.int32)
+    return arrays, skipped
+
+
+def _read_capture(path, segments=None):
+    """
+    Read a binary capture (see
+    :mod:`novespace_stream_data.receive.binary_capture`).
+
+    :param segments: If given, only the records of these segments of the
+                     index are read.
+    """
+    capture, strings = load_binary_capture(path)
+    if segments is not None:
+        capture = numpy.concatenate(
+            [capture[segment['first_row']:
+                     segment['first_row'] + segment['rows']]
+             for segment in segments] +
+            [numpy.zeros(0, dtype=capture.dtype)])
+    log = {name: capture[name] for name in capture.dtype.names
+           if name != 'raw'}
+    log['announcements'] = numpy.array(strings)
+    log['skipped'] = 0
+    return log
+
+
+def _read_chunks(filedescriptor, chunk_size):
+    """
+    :return: iterator over chunks of complete lines
+    """
+    rest = ''
+    while True:
+        text = filedescriptor.read(chunk_size)
+        if not text:
+            break
+        text = rest + text
+        end = text.rfind('\n') + 1
+        text, rest = text[:end], text[end:]
+        if text:
+            yield text
+    if rest:
+        yield rest + '\n'
+
+
+def _read_segments(path, segments):
+    """
+    :return: iterator over the text of the given segments of the index
+    """
+    with open(path, 'rb') as filedescriptor:
+        for segment in segments:
+            filedescriptor.seek(segment['offset'])
+            yield filedescriptor.read(
+                segment['end'] - segment['offset']).decode('utf-8')
+
+
+def _concatenate(chunks, tagged):
+    """
+    Concatenate the arrays of the parsed chunks.
+
+    :param chunks: list of dictionaries of arrays
+    :param tagged: If True, the column 'port' exists.
+    :return: dictionary of arrays
+    """
+    names = [name for name in FLOAT_COLUMNS if name is not None] + \
+        ['time', 'announcement'] + (['port'] if tagged else [])
+    log = {}
+    for name in names:
+        log[name] = numpy.concatenate(
+            [chunk[name] for chunk in chunks]) if chunks else \
+            numpy.zeros(0)
+    for name in INTEGER_COLUMNS + (('port',) if tagged else ()):
+        # invalid values are marked by -1
+        log[name] = numpy.where(
+            numpy.isnan(log[name]), -1, log[name]).astype(numpy.int64)
+    log['announcement'] = log['announcement'].astype(numpy.int32)
+    return log
+
+
+def read_log(path, chunk_size=16777216, *, parabola=None,
+             announcement=None):
+    """
+    Read a file of the receiver into numpy arrays.
+
+    Both the layout of the csv writer (every row as one field, quoted
+    if necessary) and plain ';'-separated rows are handled, as well as
+    the tagged layout with the column ' Port' and binary captures
+    (`*.nsb`). The file is parsed in chunks of about `chunk_size`
+    characters.
+
+    The result is a dictionary with the float64 arrays 'unixtime',
+    'time' (column ' Time' in seconds), 'jx', 'jy', 'jz',
+    'temperature', 'humidity', 'pressure', the int64 arrays 'ms' and
+    'parabola' (-1 for invalid values), the int32 array 'announcement'
+    with the index into the array 'announcements' and 'skipped', the
+    number of invalid lines.
+    For the tagged layout the array 'port' is added.
+
+    If `parabola` is given, only its records are read; the index of the
+    file (see :class:`novespace_stream_data.receive.ParabolaIndex`) is
+    used to seek to them and built if necessary.
+
+    :param path: path of the file
+    :param chunk_size: number of characters parsed at once
+    :param parabola: If given, only the records of this parabola are read.
+    :param announcement: If given together with `parabola`, only the
+                         records of this flight phase (e. g.
+                         'STEADY FLIGHT') are read.
+    :return: dictionary of numpy arrays
+    """
+    segments = None
+    if parabola is not None:
+        segments = get_index(path).find(parabola, announcement)
+    if Path(path).suffix == '.nsb':
+        return _read_capture(path, segments)
+    chunks = []
+    skipped = 0
+    announcement_codes = {}
+    with open(path, encoding='utf-8', newline='') as filedescriptor:
+        columns = filedescriptor.readline().count(';') + 1
+        if segments is None:
+            texts = _read_chunks(filedescriptor, chunk_size)
+        else:
+            texts = _read_segments(path, segments)
+        for text in texts:
+            arrays, invalid = _parse_chunk(
+                text, columns, announcement_codes)
+            chunks.append(arrays)
+            skipped += invalid
+    log = _concatenate(chunks, columns > 11)
+    log['announcements'] = numpy.array(list(announcement_codes))
+    log['skipped'] = skipped
+    return log
+
+
+def to_dataframe(log):
+    """
+    Convert the result of :func:`read_log` to a pandas.DataFrame.
+
+    The announcements are stored as categorical column. This needs pandas.
+
+    :param log: dictionary returned by :func:`read_log`
+    :return: pandas.DataFrame
+    """
+    import pandas  # pylint: disable=import-outside-toplevel
+    columns = {name: values for name, values in log.items()
+               if name not in ('announcement', 'announcements', 'skipped')}
+    columns['announcement'] = pandas.Categorical.from_codes(
+        log['announcement'], categories=list(log['announcements']))
+    return pandas.DataFrame(columns)
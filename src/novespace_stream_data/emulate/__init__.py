@@ -0,0 +1,46 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+:mod:`novespace_stream_data.emulate`
+====================================
+   :synopsis: :mod:`novespace_stream_data.emulate` is a python submodule to
+              emulate the stream from Novespace/AirZeroG for testing
+              receivers.
+
+.. contents::
+
+description
+===========
+
+`novespace_stream_data.emulate` provides the building blocks of the
+emulators in :mod:`novespace_stream_data.scripts`.
+
+Available classes are:
+
+.. autoclass:: Pacer
+   :members:
+
+.. autoclass:: Replay
+   :members:
+
+.. autoclass:: LoadGenerator
+   :members:
+
+.. autofunction:: parse_start_time
+
+copyright + license
+===================
+:Author: Daniel Maier, Daniel Mohr, Thomas Villatte
+:Date: 2026-10-17
+:License: GPL-3.0-or-later
+:Copyright: (C) 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+"""
+
+from .load import LOAD_MODES, LoadGenerator
+from .pacing import PACING_POLICIES, Pacer
+from .replay import Replay, parse_start_time
+
+__all__ = ["LOAD_MODES", "LoadGenerator", "PACING_POLICIES", "Pacer",
+           "Replay", "parse_start_time"]
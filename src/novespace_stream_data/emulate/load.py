@@ -0,0 +1,197 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Load generator with several concurrent streams for capacity tests.
+
+Copyright (C) 2026 Daniel Maier (University of Greifswald),
+                   Daniel Mohr (University of Greifswald),
+                   Thomas Villatte (Novespace)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import multiprocessing
+import os
+import socket
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from novespace_stream_data.receive.sequence import add_sequence
+
+from .pacing import Pacer
+
+LOAD_MODES = ('ports', 'addresses')
+
+
+def synthetic_datagram(milliseconds):
+    """
+    :param milliseconds: miliseconds since 00:00:00
+    :return: datagram in the format of the stream from Novespace (bytes)
+    """
+    milliseconds %= 86400000
+    return (f'{milliseconds};{milliseconds // 60000 % 60:02d}:'
+            f'{milliseconds % 60000 / 1000:04.1f};0.18307;-0.013731;'
+            '0.950486;19;46.2;944;0;STEADY FLIGHT').encode()
+
+
+def send_streams(targets, rate, duration, busy_wait=0.001, first=0):
+    """
+    Send synthetic streams with sequence numbers; this runs in a worker
+    process of :class:`LoadGenerator`.
+
+    :param targets: list of tuples (stream, source address or None,
+                    destination (host, port))
+    :param rate: datagrams per second and stream
+    :param duration: seconds to send
+    :param busy_wait: seconds before a deadline spent in a busy loop
+    :param first: sequence number of the first datagram
+    :return: dictionary with the number of sent datagrams, send errors
+             and the report of the pacer
+    """
+    sockets = []
+    for stream, source, destination in targets:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        if source is not None:
+            sock.bind((source, 0))
+        sockets.append((stream, sock, destination))
+    counters = {'sent': 0, 'errors': 0}
+    milliseconds = int(1000 * (time.time() % 86400))
+    pacer = Pacer(1 / rate, 'catch-up', busy_wait)
+    pacer.start()
+    for number in range(int(rate * duration)):
+        data = synthetic_datagram(milliseconds + int(1000 * number / rate))
+        pacer.wait()
+        for stream, sock, destination in sockets:
+            try:
+                sock.sendto(add_sequence(data, stream, first + number),
+                            destination)
+                counters['sent'] += 1
+            except OSError:
+                counters['errors'] += 1
+    for _, sock, _ in sockets:
+        sock.close()
+    return {**counters, 'pacer': pacer.get_report()}
+
+
+class LoadGenerator():
+    """
+    This class sends several synthetic streams concurrently (like
+    several data units) to find the capacity of a receiver.
+
+    The streams are distributed over a pool of worker processes; every
+    worker paces its streams with a
+    :class:`novespace_stream_data.emulate.Pacer` like
+    :class:`NovespaceStreamEmulator`. Every datagram carries the sequence
+    number field `#<stream>:<number>` (see
+    :mod:`novespace_stream_data.receive.sequence`), so the receiver can
+    count the lost datagrams with
+    :class:`novespace_stream_data.receive.SequenceTracker`.
+
+    The streams are sent to consecutive ports (mode 'ports') or to one
+    port from different source addresses (mode 'addresses'; by default
+    127.0.0.2, 127.0.0.3, ... which only works for a receiver on this
+    host).
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(  # pylint: disable=too-many-arguments
+            self, ip_address='localhost', port=3131, streams=4, *,
+            mode='ports', source_addresses=None, workers=None,
+            busy_wait=0.001):
+        """
+        :param ip_address: ip address of the receiver
+        :param port: (first) port of the receiver
+        :param streams: number of streams
+        :param mode: 'ports' or 'addresses', see LOAD_MODES
+        :param source_addresses: source addresses for mode 'addresses'
+        :param workers: number of worker processes
+                        (default: number of cpus, at most streams)
+        :param busy_wait: seconds before a deadline spent in a busy loop
+        """
+        if mode not in LOAD_MODES:
+            raise ValueError(
+                f'unknown mode "{mode}", use one of {LOAD_MODES}')
+        self.ip_address = ip_address
+        self.port = port
+        self.streams = streams
+        self.mode = mode
+        if (mode == 'addresses') and (source_addresses is None):
+            source_addresses = [f'127.0.0.{2 + stream}'
+                                for stream in range(streams)]
+        self.source_addresses = source_addresses
+        self.workers = min(streams, workers or os.cpu_count() or 1)
+        self.busy_wait = busy_wait
+        self.pool = None
+        # the sequence numbers continue over the rate steps, so a remote
+        # receiver does not count the next step as duplicates
+        self.first = 0
+
+    def get_ports(self):
+        """
+        :return: list of the ports of the receiver
+        """
+        if self.mode == 'ports':
+            return [self.port + stream for stream in range(self.streams)]
+        return [self.port]
+
+    def get_targets(self):
+        """
+        :return: list of tuples (stream, source address or None,
+                 destination (host, port))
+        """
+        if self.mode == 'ports':
+            return [(stream, None, (self.ip_address, self.port + stream))
+                    for stream in range(self.streams)]
+        return [(stream, self.source_addresses[stream],
+                 (self.ip_address, self.port))
+                for stream in range(self.streams)]
+
+    def run_step(self, rate, duration):
+        """
+        Send all streams at the given rate.
+
+        :param rate: datagrams per second and stream
+        :param duration: seconds to send
+        :return: dictionary with the number of sent datagrams, send
+                 errors, the achieved total rate and the maximal
+                 lateness of the workers
+        """
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(
+                self.workers,
+                mp_context=multiprocessing.get_context('spawn'))
+        targets = self.get_targets()
+        futures = [
+            self.pool.submit(send_streams, targets[worker::self.workers],
+                             rate, duration, self.busy_wait, self.first)
+            for worker in range(self.workers)]
+        results = [future.result() for future in futures]
+        self.first += int(rate * duration)
+        return {'sent': sum(result['sent'] for result in results),
+                'errors': sum(result['errors'] for result in results),
+                'rate': sum(result['pacer']['rate'] *
+                            len(targets[worker::self.workers])
+                            for worker, result in enumerate(results)),
+                'lateness_max': max(result['pacer']['lateness_max']
+                                    for result in results)}
+
+    def close(self):
+        """
+        Stop the worker processes.
+        """
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
@@ -0,0 +1,189 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Drift-free pacing of the emulated stream.
+
+Copyright (C) 2026 Daniel Maier (University of Greifswald),
+                   Daniel Mohr (University of Greifswald),
+                   Thomas Villatte (Novespace)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import math
+import time
+
+PACING_POLICIES = ('catch-up', 'skip')
+
+
+class Pacer():
+    """
+    This class paces datagrams at absolute deadlines of a monotonic
+    clock (:func:`time.perf_counter`).
+
+    The deadline of the n-th datagram is `start + n * interval` (or
+    `start + offset` if an offset is given to :meth:`wait`), so the time
+    needed to read and send a datagram does not add up and the rate does
+    not drift.
+
+    If a deadline is missed by more than one interval (e. g. the process
+    was not scheduled), the policy decides:
+
+    * 'catch-up': the late datagrams are sent immediately until the
+      schedule is reached again; the mean rate is kept.
+    * 'skip': the missed deadlines are skipped and the schedule continues
+      from now; no burst is sent.
+
+    The operating system usually sleeps longer than requested. Therefore
+    the last `busy_wait` seconds before a deadline are spent in a busy
+    loop, which allows intervals below a millisecond at the cost of CPU
+    time.
+
+    With `interval` set to None or 0 and no offsets the datagrams are
+    sent as fast as possible.
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, interval=0.1, policy='catch-up', busy_wait=0.001):
+        """
+        :param interval: seconds between datagrams
+                         (None or 0: as fast as possible)
+        :param policy: 'catch-up' or 'skip', see PACING_POLICIES
+        :param busy_wait: seconds before a deadline spent in a busy loop
+        """
+        if policy not in PACING_POLICIES:
+            raise ValueError(
+                f'unknown pacing policy "{policy}", '
+                f'use one of {PACING_POLICIES}')
+        self.interval = interval or 0.0
+        self.policy = policy
+        self.busy_wait = busy_wait
+        self.start_time = None
+        self.shift = 0.0
+        self.deadline = None
+        self.first_offset = None
+        self.last_offset = None
+        self.unpaced = False
+        self.count = 0
+        self.skipped = 0
+        self.last_send = None
+        self.lateness_sum = 0.0
+        self.lateness_max = 0.0
+        self.gap_sum = 0.0
+        self.gap_sum_squares = 0.0
+
+    def start(self):
+        """
+        Start the schedule now.
+        """
+        self.start_time = time.perf_counter()
+        self.shift = 0.0
+        self.deadline = None
+        self.first_offset = None
+        self.last_offset = None
+        self.unpaced = False
+        self.count = 0
+        self.skipped = 0
+        self.last_send = None
+        self.lateness_sum = 0.0
+        self.lateness_max = 0.0
+        self.gap_sum = 0.0
+        self.gap_sum_squares = 0.0
+
+    def wait(self, offset=None):
+        """
+        Wait for the deadline of the next datagram.
+
+        :param offset: If given, the deadline is `offset` seconds after
+                       the start instead of the next multiple of
+                       `interval`.
+        :return: seconds the deadline was missed by
+        """
+        if self.start_time is None:
+            self.start()
+        previous = self.deadline
+        now = time.perf_counter()
+        if offset is None:
+            offset = self.count * self.interval
+            if not self.interval:
+                # as fast as possible
+                offset = now - self.start_time - self.shift
+                self.unpaced = True
+        deadline = self.start_time + self.shift + offset
+        if self.first_offset is None:
+            self.first_offset = offset
+        self.last_offset = offset
+        if (self.policy == 'skip') and (previous is not None) and \
+                (now - deadline > max(deadline - previous, 0.0)):
+            # continue the schedule from now
+            self.shift += now - deadline
+            self.skipped += 1
+            deadline = now
+        remaining = deadline - now
+        if remaining > self.busy_wait:
+            time.sleep(remaining - self.busy_wait)
+        while time.perf_counter() < deadline:
+            pass
+        now = time.perf_counter()
+        self.deadline = deadline
+        self.count += 1
+        lateness = now - deadline
+        self.lateness_sum += lateness
+        self.lateness_max = max(self.lateness_max, lateness)
+        if self.last_send is not None:
+            self.gap_sum += now - self.last_send
+            self.gap_sum_squares += (now - self.last_send) ** 2
+        self.last_send = now
+        return lateness
+
+    def get_report(self):
+        """
+        :return: dictionary with the achieved rate (1/s), the target rate
+                 of the schedule,
+                 the jitter (standard deviation of the intervals in s),
+                 the mean and maximal lateness (s) and the number of
+                 skipped deadlines
+        """
+        gaps = self.count - 1
+        report = {'sent': self.count, 'rate': math.nan,
+                  'target_rate': math.nan,
+                  'jitter': math.nan,
+                  'lateness_mean': (self.lateness_sum / self.count
+                                    if self.count else math.nan),
+                  'lateness_max': self.lateness_max,
+                  'skipped': self.skipped}
+        if gaps > 0:
+            mean = self.gap_sum / gaps
+            report['rate'] = 1 / mean if mean > 0 else math.inf
+            report['jitter'] = math.sqrt(
+                max(0.0, self.gap_sum_squares / gaps - mean * mean))
+            duration = self.last_offset - self.first_offset
+            report['target_rate'] = (
+                gaps / duration if (duration > 0) and not self.unpaced
+                else math.inf)
+        return report
+
+    def print_report(self):
+        """
+        Print the achieved rate and jitter.
+        """
+        report = self.get_report()
+        print(f"sent {report['sent']} datagrams: "
+              f"{report['rate']:.1f}/s (target {report['target_rate']:.1f}/s)"
+              f", jitter {1000 * report['jitter']:.3f} ms, "
+              f"lateness mean {1000 * report['lateness_mean']:.3f} ms "
+              f"max {1000 * report['lateness_max']:.3f} ms, "
+              f"skipped deadlines {report['skipped']}")
@@ -0,0 +1,213 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Replay of a recorded stream with its original timing.
+
+Copyright (C) 2026 Daniel Maier (University of Greifswald),
+                   Daniel Mohr (University of Greifswald),
+                   Thomas Villatte (Novespace)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import mmap
+import os
+from array import array
+
+DAY = 86400000  # miliseconds
+
+
+def parse_start_time(text):
+    """
+    Convert a time of day to miliseconds since 00:00:00.
+
+    :param text: 'hh:mm:ss.f', 'hh:mm' or miliseconds since 00:00:00
+    :return: miliseconds since 00:00:00
+    """
+    if ':' not in text:
+        return int(text)
+    parts = [float(part) for part in text.split(':')]
+    parts += [0.0] * (3 - len(parts))
+    return round(1000 * (3600 * parts[0] + 60 * parts[1] + parts[2]))
+
+
+def index_lines(buffer, chunk_size=16777216):
+    """
+    Find the lines of a recorded stream and read their recorded times.
+
+    The buffer is processed in chunks of about `chunk_size` bytes, so no
+    copy of the whole recording is held. Empty lines are ignored. The
+    first column is the time in miliseconds since 00:00:00; a jump back
+    by more than 12 hours is taken as midnight and a line without a
+    valid time gets the time of the line before.
+
+    :param buffer: content of the recording (bytes or mmap)
+    :param chunk_size: number of bytes processed at once
+    :return: tuple of arrays (starts, lengths, times) with the byte
+             offset and length (without line break) of every line and
+             the recorded time in miliseconds (continuing after midnight)
+    """
+    starts = array('q')
+    lengths = array('I')
+    times = array('q')
+    last = 0
+    day = 0
+    position = 0
+    size = len(buffer)
+    while position < size:
+        end = min(position + chunk_size, size)
+        if end < size:
+            newline = buffer.rfind(b'\n', position, end)
+            if newline < 0:
+                newline = buffer.find(b'\n', end)
+            end = size if newline < 0 else newline + 1
+        line_start = position
+        for line in buffer[position:end].split(b'\n'):
+            length = len(line.rstrip(b'\r'))
+            if length:
+                try:
+                    value = int(line.partition(b';')[0]) + day
+                except ValueError:
+                    value = last
+                if value < last - DAY // 2:
+                    day += DAY
+                    value += DAY
+                starts.append(line_start)
+                lengths.append(length)
+                times.append(value)
+                last = value
+            line_start += len(line) + 1
+        position = end
+    return starts, lengths, times
+
+
+class Replay():
+    """
+    This class holds a recorded stream (as the example data) for a
+    replay.
+
+    The file is mapped into memory (or read at once with `preload`) and
+    indexed in one pass before sending: the byte offsets of the lines and
+    the column 'miliseconds since 00:00:00' are stored in arrays. The
+    sending loop gets the exact original bytes of every line as a
+    memoryview slice of the buffer, so nothing is parsed, encoded or
+    copied while sending (see :class:`novespace_stream_data.emulate.Pacer`).
+
+    :meth:`close` releases the buffer; slices passed out before have to
+    be released first.
+    """
+
+    def __init__(self, filepath, preload=False):
+        """
+        :param filepath: path of the recorded stream
+        :param preload: If set to True, the file is read into memory
+                        instead of mapping it.
+        """
+        self.mmap = None
+        with open(filepath, 'rb') as filedescriptor:
+            if preload or (os.fstat(filedescriptor.fileno()).st_size == 0):
+                buffer = filedescriptor.read()
+            else:
+                self.mmap = mmap.mmap(
+                    filedescriptor.fileno(), 0, access=mmap.ACCESS_READ)
+                buffer = self.mmap
+        self.view = memoryview(buffer)
+        self.starts, self.lengths, self.times = index_lines(buffer)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def message(self, index):
+        """
+        :param index: number of the datagram
+        :return: memoryview of the original bytes of the line
+        """
+        start = self.starts[index]
+        return self.view[start:start + self.lengths[index]]
+
+    def find_start(self, start_time=None, parabola=None):
+        """
+        Find the first datagram to send.
+
+        :param start_time: If given, the first datagram at or after this
+                           time (miliseconds since 00:00:00) is used.
+        :param parabola: If given, the first datagram of this parabola
+                         (at or after `start_time`) is used.
+        :return: index of the first datagram
+        """
+        start = 0
+        if (start_time is not None) and len(self):
+            first = self.times[0]
+            target = first - first % DAY + start_time
+            if (target < first) and (self.times[-1] >= target + DAY):
+                # the recording reaches this time after midnight
+                target += DAY
+            start = next((index for index, value in enumerate(self.times)
+                          if value >= target), len(self))
+        if parabola is not None:
+            field = [str(parabola).encode()]
+            start = next((index for index in range(start, len(self))
+                          if bytes(self.message(index)).rsplit(
+                              b';', 2)[-2:-1] == field), len(self))
+        return start
+
+    def schedule(self, start=0, speed=1.0, loops=1):
+        """
+        :param start: index of the first datagram
+        :param speed: speed-up factor (e. g. 10 replays 10 times faster)
+        :param loops: number of replays (0: endless); every further replay
+                      starts one mean interval after the last datagram
+        :return: iterator over tuples (seconds after the start,
+                 memoryview of the datagram); the memoryview is released
+                 when the next datagram is taken
+        """
+        if start >= len(self):
+            return
+        factor = 1 / (1000 * speed)
+        duration = (self.times[-1] - self.times[start]) * factor
+        if len(self) - start > 1:
+            duration += duration / (len(self) - start - 1)
+        # the offset of a datagram is base + its time * factor
+        base = -self.times[start] * factor
+        loop = 0
+        starts, lengths, times, view = (
+            self.starts, self.lengths, self.times, self.view)
+        while (loops == 0) or (loop < loops):
+            for index in range(start, len(self)):
+                position = starts[index]
+                message = view[position:position + lengths[index]]
+                try:
+                    yield (base + times[index] * factor, message)
+                finally:
+                    # also if the iteration is stopped, so the buffer
+                    # can be closed
+                    message.release()
+            base += duration
+            loop += 1
+
+    def close(self):
+        """
+        Release the buffer.
+        """
+        self.view.release()
+        if self.mmap is not None:
+            self.mmap.close()
@@ -24,6 +24,128 @@ Available classes are:
    :private-members:
    :special-members:
 
+.. autoclass:: AsyncNoSpaStream
+   :members:
+
+.. autoclass:: BatchReceiver
+   :members:
+
+.. autoclass:: BufferedWriter
+   :members:
+
+.. autoclass:: BufferedCSVWriter
+   :members:
+
+.. autoclass:: DisplayBuffer
+   :members:
+
+.. autofunction:: format_summary
+
+.. autoclass:: BinaryCaptureWriter
+   :members:
+
+.. autofunction:: iter_binary_capture
+
+.. autofunction:: export_csv
+
+.. autofunction:: load_binary_capture
+
+.. autoclass:: JournalWriter
+   :members:
+
+.. autofunction:: iter_journal
+
+.. autofunction:: recover_journal
+
+.. autofunction:: find_resumable
+
+.. autofunction:: export_journal
+
+.. autoclass:: RawCaptureWriter
+   :members:
+
+.. autofunction:: iter_raw_capture
+
+.. autofunction:: export_raw_capture
+
+.. autoclass:: ParabolaIndex
+   :members:
+
+.. autofunction:: build_index
+
+.. autofunction:: get_index
+
+.. autofunction:: read_segments
+
+.. autoclass:: PhaseDetector
+   :members:
+
+.. autoclass:: RollingStatistics
+   :members:
+
+.. autoclass:: LossMonitor
+   :members:
+
+.. autoclass:: ReceiverMetrics
+   :members:
+
+.. autoclass:: MetricsServer
+   :members:
+
+.. autoclass:: Histogram
+   :members:
+
+.. autofunction:: read_metrics
+
+.. autoclass:: RotatingWriter
+   :members:
+
+.. autoclass:: Compressor
+   :members:
+
+.. autofunction:: find_segments
+
+.. autoclass:: Record
+   :members:
+
+.. autofunction:: parse_record
+
+.. autoclass:: RecordColumns
+   :members:
+
+.. autoclass:: RecordParser
+   :members:
+
+.. autoclass:: ClockSync
+   :members:
+
+.. autofunction:: clock_path
+
+.. autoclass:: StreamBus
+   :members:
+
+.. autoclass:: UnixSocketPublisher
+   :members:
+
+.. autoclass:: SharedView
+   :members:
+
+.. autoclass:: SharedViewReader
+   :members:
+
+.. autoclass:: SequenceTracker
+   :members:
+
+.. autofunction:: add_sequence
+
+.. autofunction:: split_sequence
+
+.. autoclass:: RingBuffer
+   :members:
+
+.. autoclass:: ConsumerStage
+   :members:
+
 copyright + license
 ===================
 :Author: Daniel Maier, Daniel Mohr, Thomas Villatte
@@ -32,6 +154,48 @@ copyright + license
 :Copyright: (C) 2025 Daniel Maier, Daniel Mohr, Thomas Villatte
 """
 
-from .nove_space_stream import NoSpaStream
+from .async_stream import AsyncNoSpaStream
+from .batch_receiver import BatchReceiver
+from .binary_capture import (
+    BinaryCaptureWriter, export_csv, iter_binary_capture,
+    load_binary_capture)
+from .buffered_writer import BufferedCSVWriter, BufferedWriter
+from .bus import StreamBus, UnixSocketPublisher
+from .clock_sync import CLOCK_COLUMNS, ClockSync, clock_path
+from .display import DisplayBuffer, format_summary
+from .journal import (
+    JournalWriter, export_journal, find_resumable, iter_journal,
+    recover_journal)
+from .loss_monitor import LossMonitor
+from .metrics import (
+    METRICS_ADDRESS, Histogram, MetricsServer, ReceiverMetrics, read_metrics)
+from .nove_space_stream import CSV_FIELDNAMES, WRITERS, NoSpaStream
+from .parabola_index import (
+    ParabolaIndex, build_index, get_index, read_segments)
+from .phase_detector import PHASES, PhaseDetector, RollingStatistics
+from .pipeline import OVERFLOW_POLICIES, ConsumerStage, RingBuffer
+from .raw_capture import (
+    RawCaptureWriter, export_raw_capture, iter_raw_capture)
+from .records import Record, RecordColumns, RecordParser, parse_record
+from .rotation import (
+    COMPRESSIONS, Compressor, RotatingWriter, find_segments)
+from .sequence import SequenceTracker, add_sequence, split_sequence
+from .shared_view import SHARED_VIEW_NAME, SharedView, SharedViewReader
 
-__all__ = ["NoSpaStream"]
+__all__ = ["AsyncNoSpaStream", "BatchReceiver", "BinaryCaptureWriter",
+           "BufferedCSVWriter", "BufferedWriter", "CLOCK_COLUMNS",
+           "COMPRESSIONS", "CSV_FIELDNAMES", "ClockSync", "Compressor",
+           "ConsumerStage", "DisplayBuffer", "Histogram", "JournalWriter",
+           "LossMonitor", "METRICS_ADDRESS", "MetricsServer", "NoSpaStream",
+           "OVERFLOW_POLICIES", "PHASES", "ParabolaIndex", "PhaseDetector",
+           "RawCaptureWriter", "ReceiverMetrics", "Record", "RecordColumns",
+           "RecordParser", "RingBuffer", "RollingStatistics",
+           "RotatingWriter", "SHARED_VIEW_NAME", "SequenceTracker",
+           "SharedView", "SharedViewReader", "StreamBus",
+           "UnixSocketPublisher", "WRITERS",
+           "add_sequence", "build_index", "clock_path", "export_csv",
+           "export_journal", "export_raw_capture", "find_resumable",
+           "find_segments", "format_summary", "get_index",
+           "iter_binary_capture", "iter_journal", "iter_raw_capture",
+           "load_binary_capture", "parse_record", "read_metrics",
+           "read_segments", "recover_journal", "split_sequence"]
@@ -0,0 +1,301 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+asyncio based receiver for the stream from Novespace.
+
+Copyright (C) 2026 Daniel Maier (University of Greifswald),
+                   Daniel Mohr (University of Greifswald),
+                   Thomas Villatte (Novespace)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import asyncio
+import inspect
+import socket
+import time
+from datetime import datetime
+from pathlib import Path
+
+from .buffered_writer import BufferedCSVWriter
+from .nove_space_stream import CSV_FIELDNAMES
+
+
+class _DatagramProtocol(asyncio.DatagramProtocol):
+    """
+    protocol passing the datagrams of one port to AsyncNoSpaStream
+    """
+
+    def __init__(self, stream, port):
+        self.stream = stream
+        self.port = port
+
+    def datagram_received(self, data, addr):
+        self.stream.handle_datagram(time.time(), data, self.port)
+
+    def error_received(self, exc):
+        self.stream.errors += 1
+
+
+class AsyncNoSpaStream():
+    """
+    This class allows to get the stream from
+    Novespace ( https://www.airzerog.com/ ) in an asyncio event loop.
+
+    It provides the session semantics of
+    :class:`novespace_stream_data.receive.NoSpaStream`, but without a
+    thread and without a polling interval: :meth:`end_streaming` stops
+    immediately. One instance can listen on several ports; for more than
+    one port a csv file per port is written.
+
+    The records are available by `record_callback` (a function or a
+    coroutine function called with unixtime, data_str and port) and by
+    the asynchronous iterator :meth:`records`.
+
+    In contrast to NoSpaStream no signal handlers are installed, since
+    the event loop is shared with other code.
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, csv_path, inputport=3131, printing=False, *,
+                 flush_rows=10, flush_interval=1.0, fsync=False,
+                 queue_size=1024):
+        """
+        :param csv_path: path to store the data
+        :param inputport: port or list of ports to listen.
+        :param printing: If set to True the data is not only logged, but also
+                         printed on the console (stdout).
+        :param flush_rows: flush the csv file after this number of rows
+        :param flush_interval: flush the csv file after this number
+                               of seconds
+        :param fsync: If set to True, every flush of the csv file is
+                      followed by os.fsync (crash safety).
+        :param queue_size: size of the queue of every iterator of
+                           :meth:`records`; if full, the oldest record
+                           is dropped
+        """
+        self.streampath = csv_path
+        if isinstance(inputport, int):
+            inputport = [inputport]
+        self.streamports = list(inputport)
+        self.print_on_console = printing
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.queue_size = queue_size
+        self.csv_fieldnames = list(CSV_FIELDNAMES)
+        self.csv_files = {}
+        self.writers = {}
+        self.transports = {}
+        self.queues = []
+        self.tasks = set()
+        self.record_callback = None
+        self.display_data_callback = None
+        self.received = 0
+        self.dropped = 0
+        self.errors = 0
+        self.poll_handle = None
+        self.stopped = None
+
+    def is_running(self):
+        """
+        :return: True if the stream is active
+        """
+        return bool(self.transports)
+
+    def get_status(self):
+        """
+        Print the current streaming status.
+        """
+        if self.is_running():
+            for port in self.streamports:
+                print(
+                    "Active datastream from port "
+                    f"{port} to {self.csv_files[port]}.")
+        else:
+            print("No active datastream!")
+        print(", ".join(f"{key}: {value}"
+                        for key, value in self.get_statistics().items()))
+
+    def get_statistics(self):
+        """
+        :return: dictionary with the counters of the current session
+        """
+        return {'received': self.received,
+                'dropped': self.dropped,
+                'errors': self.errors}
+
+    async def start_streaming(self, create_csv_file=True):
+        """
+        Start the data streaming process.
+
+        :param create_csv_file: If set to False, the csv files have to be
+                                given in the dictionary csv_files
+                                (port -> path).
+        """
+        if self.is_running():
+            print("The stream is allready active!")
+            return
+        loop = asyncio.get_running_loop()
+        self.stopped = asyncio.Event()
+        self.received = 0
+        self.dropped = 0
+        self.errors = 0
+        timestamp = datetime.now().strftime("%Y%m%d-%Hh%Mm%Ss")
+        try:
+            for port in self.streamports:
+                await self._open_port(loop, port, create_csv_file, timestamp)
+        except BaseException:
+            # e. g. a later port is in use: close the ports opened so far
+            self._close_ports()
+            raise
+        if self.flush_interval is not None:
+            self.poll_handle = loop.call_later(
+                self.flush_interval, self._poll_writers)
+
+    async def _open_port(self, loop, port, create_csv_file, timestamp):
+        """
+        Open the csv file and the socket of a port.
+        """
+        if create_csv_file:
+            suffix = f'_port{port}' if len(self.streamports) > 1 else ''
+            self.csv_files[port] = Path(
+                self.streampath,
+                f'NoveSpa_planedata_{timestamp}{suffix}.csv')
+        self.writers[port] = BufferedCSVWriter(
+            self.csv_files[port], self.csv_fieldnames,
+            flush_rows=self.flush_rows,
+            flush_interval=self.flush_interval, fsync=self.fsync)
+        self.writers[port].open()
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            sock.bind(('', port))
+            self.transports[port], _ = await loop.create_datagram_endpoint(
+                lambda port=port: _DatagramProtocol(self, port), sock=sock)
+        except BaseException:
+            sock.close()
+            raise
+        print(
+            "Starting datastream from port "
+            f"{port} to file: {self.csv_files[port]}")
+
+    def _close_ports(self):
+        """
+        Close the sockets and the csv files.
+        """
+        for transport in self.transports.values():
+            transport.close()
+        self.transports = {}
+        for writer in self.writers.values():
+            writer.close()
+        self.writers = {}
+
+    def _poll_writers(self):
+        """
+        Flush the csv files regularly, also if no data arrives.
+        """
+        for writer in self.writers.values():
+            writer.poll()
+        self.poll_handle = asyncio.get_running_loop().call_later(
+            self.flush_interval, self._poll_writers)
+
+    def handle_datagram(self, unixtime, data, port):
+        """
+        Save, print and pass a received datagram.
+
+        :param unixtime: local timestamp of the datagram
+        :param data: received datagram (bytes)
+        :param port: port the datagram was received on
+        """
+        self.received += 1
+        try:
+            data_str = data.decode('utf-8')
+        except UnicodeDecodeError:
+            self.errors += 1
+            return
+        self.writers[port].write_record(unixtime, data_str)
+        if self.print_on_console is True:
+            print(f'{unixtime};{data_str}')
+        if self.display_data_callback is not None:
+            self.display_data_callback(f'{unixtime};{data_str}')
+        if self.record_callback is not None:
+            result = self.record_callback(unixtime, data_str, port)
+            if inspect.isawaitable(result):
+                task = asyncio.ensure_future(result)
+                self.tasks.add(task)
+                task.add_done_callback(self.tasks.discard)
+        for queue in self.queues:
+            self._put(queue, (unixtime, data_str, port))
+
+    def _put(self, queue, item):
+        """
+        Put an item into a queue; drop the oldest item if it is full.
+        """
+        if queue.full():
+            queue.get_nowait()
+            self.dropped += 1
+        queue.put_nowait(item)
+
+    async def records(self):
+        """
+        Asynchronous iterator over the received records.
+
+        It yields tuples (unixtime, data_str, port) and ends with
+        :meth:`end_streaming`.
+        """
+        queue = asyncio.Queue(self.queue_size)
+        self.queues.append(queue)
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                yield item
+        finally:
+            self.queues.remove(queue)
+
+    async def wait_stopped(self):
+        """
+        Wait until the stream is ended.
+        """
+        if self.stopped is not None:
+            await self.stopped.wait()
+
+    async def end_streaming(self):
+        """
+        End the data streaming process.
+        """
+        if not self.is_running():
+            print("No active data-stream to be terminated.")
+            return
+        for transport in self.transports.values():
+            transport.close()
+        self.transports = {}
+        if self.poll_handle is not None:
+            self.poll_handle.cancel()
+            self.poll_handle = None
+        if self.tasks:
+            await asyncio.gather(*self.tasks, return_exceptions=True)
+        for writer in self.writers.values():
+            writer.close()
+        self.writers = {}
+        for queue in self.queues:
+            self._put(queue, None)
+        for port in self.streamports:
+            print(f"\nEnd of streaming to {self.csv_files[port]}")
+        print(datetime.now().strftime(
+            "Streaming ended on %Y-%m-%d at %H:%M:%S"))
+        self.stopped.set()
@@ -0,0 +1,130 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Batched receive of datagrams with kernel receive timestamps.
+
+Copyright (C) 2026 Daniel Maier (University of Greifswald),
+                   Daniel Mohr (University of Greifswald),
+                   Thomas Villatte (Novespace)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import socket
+import struct
+import sys
+import time
+
+# python does not provide SO_TIMESTAMPNS; 35 is the value on linux
+SO_TIMESTAMPNS = getattr(
+    socket, 'SO_TIMESTAMPNS',
+    35 if sys.platform.startswith('linux') else None)
+# struct timespec as delivered with SO_TIMESTAMPNS (native time_t and long)
+TIMESPEC = struct.Struct('@ll')
+MSG_TRUNC = getattr(socket, 'MSG_TRUNC', 0)
+
+
+def enable_kernel_timestamps(sock):
+    """
+    Ask the kernel to attach the receive time to every datagram.
+
+    :param sock: UDP socket
+    :return: True if the kernel provides receive timestamps
+    """
+    if (SO_TIMESTAMPNS is None) or (not hasattr(sock, 'recvmsg_into')):
+        return False
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, SO_TIMESTAMPNS, 1)
+    except OSError:
+        return False
+    return True
+
+
+class BatchReceiver():
+    """
+    This class drains all datagrams queued on a socket in one wake-up.
+
+    Up to `batch_size` datagrams are read into a preallocated buffer
+    without blocking. If the kernel provides receive timestamps
+    (SO_TIMESTAMPNS), they are used as local timestamp; otherwise
+    :func:`time.time` is called after receiving.
+
+    Python does not offer recvmmsg, therefore one recvmsg call per
+    datagram is used, but no select call between the datagrams.
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, sock, batch_size=64, max_datagram_size=65535):
+        """
+        :param sock: bound UDP socket
+        :param batch_size: maximal number of datagrams per call of receive
+        :param max_datagram_size: maximal size of a datagram in bytes;
+                                  larger datagrams are truncated and counted
+        """
+        self.socket = sock
+        self.batch_size = batch_size
+        self.max_datagram_size = max_datagram_size
+        self.buffer = bytearray(max_datagram_size)
+        self.view = memoryview(self.buffer)
+        self.truncated = 0
+        self.batches = 0
+        self.kernel_timestamps = enable_kernel_timestamps(sock)
+        self.use_recvmsg = hasattr(sock, 'recvmsg_into')
+        self.ancbufsize = (
+            socket.CMSG_SPACE(TIMESPEC.size) if self.kernel_timestamps else 0)
+        self.socket.setblocking(False)
+
+    def receive(self):
+        """
+        Receive all queued datagrams (at most batch_size).
+
+        :return: list of tuples (unixtime, data, address)
+        """
+        records = []
+        for _ in range(self.batch_size):
+            try:
+                if self.use_recvmsg:
+                    nbytes, ancdata, msg_flags, address = \
+                        self.socket.recvmsg_into(
+                            [self.buffer], self.ancbufsize)
+                else:
+                    nbytes, address = self.socket.recvfrom_into(self.buffer)
+                    ancdata, msg_flags = [], 0
+            except (BlockingIOError, InterruptedError):
+                break
+            unixtime = None
+            for level, kind, cdata in ancdata:
+                if ((level == socket.SOL_SOCKET) and
+                        (kind == SO_TIMESTAMPNS) and
+                        (len(cdata) >= TIMESPEC.size)):
+                    seconds, nanoseconds = TIMESPEC.unpack_from(cdata)
+                    unixtime = seconds + nanoseconds * 1e-9
+            if unixtime is None:
+                unixtime = time.time()
+            if msg_flags & MSG_TRUNC:
+                self.truncated += 1
+            records.append((unixtime, bytes(self.view[:nbytes]), address))
+        if records:
+            self.batches += 1
+        return records
+
+    def get_statistics(self):
+        """
+        :return: dictionary with the counters of the receiver
+        """
+        return {'batches': self.batches,
+                'truncated': self.truncated,
+                'kernel_timestamps': self.kernel_timestamps}
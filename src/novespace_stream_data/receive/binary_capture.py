@@ -0,0 +1,341 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Typed binary capture format with an exporter to the csv format.
+
+Copyright (C) 2026 Daniel Maier (University of Greifswald),
+                   Daniel Mohr (University of Greifswald),
+                   Thomas Villatte (Novespace)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+format
+======
+
+A capture consists of two append-only files:
+
+`<name>.nsb` starts with a header of 16 bytes (magic `NSPABIN1`,
+uint32 version, uint32 record size) followed by records of 88 bytes
+(little endian):
+
+=============  =======  ==============================================
+field          type     content
+=============  =======  ==============================================
+unixtime       float64  local timestamp
+ms             int64    miliseconds since 00:00:00 or -1
+time           float64  column ' Time' (mm:ss.f) in seconds
+jx, jy, jz     float64  g-levels
+temperature    float64  temperature (°C)
+humidity       float64  humidity (%)
+pressure       float64  pressure (mbar)
+parabola       int64    parabola number or -1
+announcement   int32    index of the announcement in the string table
+raw            int32    index of the original datagram in the string
+                        table or -1
+=============  =======  ==============================================
+
+`<name>.nsb.strings` is the string table: every entry is an uint32
+length followed by the utf-8 encoded string. Announcements are stored
+only once (up to MAX_INTERNED different strings). If a datagram cannot
+be reproduced exactly from the typed columns (e. g. unusual number
+formatting), the original datagram is appended to the string table and
+referenced by `raw`, so the exporter always reproduces the csv file of
+the receiver. The typed columns of a datagram which cannot be parsed at
+all are -1 (integers) and NaN (floats).
+
+A torn record or string at the end of the files (e. g. after a loss of
+power) is removed when the capture is opened for appending.
+"""
+
+import csv
+import math
+import os
+import struct
+
+from .buffered_writer import BufferedWriter
+
+MAGIC = b'NSPABIN1'
+VERSION = 1
+HEADER = struct.Struct('<8sII')
+RECORD = struct.Struct('<dqddddddd' + 'qii')
+LENGTH = struct.Struct('<I')
+FIELDS = ('unixtime', 'ms', 'time', 'jx', 'jy', 'jz',
+          'temperature', 'humidity', 'pressure', 'parabola',
+          'announcement', 'raw')
+STRINGS_SUFFIX = '.strings'
+# maximal number of strings looked up to store them only once
+MAX_INTERNED = 1024
+
+
+def format_number(value):
+    """
+    :return: shortest text of a number, without a trailing '.0'
+    """
+    text = repr(value)
+    if text.endswith('.0'):
+        return text[:-2]
+    return text
+
+
+def format_time(seconds):
+    """
+    :return: column ' Time' (mm:ss.f) from seconds
+    """
+    minutes = int(seconds // 60)
+    return f'{minutes:02d}:{seconds - 60 * minutes:04.1f}'
+
+
+def parse_datagram(data_str):
+    """
+    Split a datagram into typed values.
+
+    :param data_str: decoded datagram (without local timestamp)
+    :return: tuple (ms, time, jx, jy, jz, temperature, humidity,
+             pressure, parabola, announcement) or None
+    """
+    fields = data_str.split(';')
+    if len(fields) != 10:
+        return None
+    try:
+        minutes, seconds = fields[1].split(':')
+        return (int(fields[0]), 60 * int(minutes) + float(seconds),
+                *(float(field) for field in fields[2:8]),
+                int(fields[8]), fields[9])
+    except ValueError:
+        return None
+
+
+def render_datagram(values, announcement):
+    """
+    Reproduce a datagram from the typed values.
+
+    :param values: tuple (ms, time, jx, jy, jz, temperature, humidity,
+                   pressure, parabola)
+    :param announcement: announcement string
+    """
+    return ';'.join(
+        [str(values[0]), format_time(values[1])] +
+        [format_number(value) for value in values[2:8]] +
+        [str(values[8]), announcement])
+
+
+def read_strings(path):
+    """
+    Read a string table.
+
+    :param path: path of the string table
+    :return: tuple (list of strings, size of the valid part in bytes)
+    """
+    strings = []
+    valid = 0
+    if not os.path.exists(path):
+        return strings, valid
+    with open(path, 'rb') as filedescriptor:
+        content = filedescriptor.read()
+    while valid + LENGTH.size <= len(content):
+        (length,) = LENGTH.unpack_from(content, valid)
+        end = valid + LENGTH.size + length
+        if end > len(content):
+            break
+        strings.append(content[valid + LENGTH.size:end].decode('utf-8'))
+        valid = end
+    return strings, valid
+
+
+def recover_capture(path, number_of_strings):
+    """
+    Remove a torn record and records with missing strings at the end
+    of a capture.
+
+    :param path: path of the capture
+    :param number_of_strings: number of complete strings in the table
+    :return: size of the valid capture in bytes (0 for a new capture)
+    """
+    if not os.path.exists(path):
+        return 0
+    size = os.path.getsize(path)
+    if size < HEADER.size:
+        os.truncate(path, 0)
+        return 0
+    with open(path, 'r+b') as filedescriptor:
+        magic, _, record_size = HEADER.unpack(
+            filedescriptor.read(HEADER.size))
+        if (magic != MAGIC) or (record_size != RECORD.size):
+            raise ValueError(f'{path} is not a binary capture')
+        size = HEADER.size + ((size - HEADER.size) // RECORD.size) * \
+            RECORD.size
+        while size > HEADER.size:
+            filedescriptor.seek(size - RECORD.size)
+            record = RECORD.unpack(filedescriptor.read(RECORD.size))
+            if max(record[-2:]) < number_of_strings:
+                break
+            size -= RECORD.size
+        filedescriptor.truncate(size)
+    return size
+
+
+class BinaryCaptureWriter(BufferedWriter):
+    """
+    This class writes the received datagrams in the typed binary
+    capture format (see :mod:`novespace_stream_data.receive.binary_capture`)
+    with the flush policy of :class:`BufferedWriter`.
+    """
+
+    suffix = '.nsb'
+
+    def __init__(self, path, fieldnames, **kwargs):
+        """
+        :param path: path of the capture
+        :param fieldnames: names of the columns (not stored)
+        :param kwargs: flush policy, see :class:`BufferedWriter`
+        """
+        super().__init__(path, fieldnames, **kwargs)
+        self.strings_path = f'{path}{STRINGS_SUFFIX}'
+        self.filedescriptor = None
+        self.strings_filedescriptor = None
+        self.string_ids = {}
+        self.number_of_strings = 0
+
+    def _open(self, write_header):
+        strings, valid = read_strings(self.strings_path)
+        self.string_ids = {string: index for index, string in
+                           enumerate(strings[:MAX_INTERNED])}
+        self.number_of_strings = len(strings)
+        size = recover_capture(self.path, len(strings))
+        # pylint: disable=consider-using-with
+        self.strings_filedescriptor = open(self.strings_path, 'ab')
+        self.strings_filedescriptor.truncate(valid)
+        self.filedescriptor = open(
+            self.path, 'ab', buffering=self.buffer_size)
+        if size == 0:
+            self.filedescriptor.write(
+                HEADER.pack(MAGIC, VERSION, RECORD.size))
+        self.offset = max(size, HEADER.size)
+
+    def _append_string(self, string):
+        """
+        Append a string to the string table.
+
+        :return: index of the string in the string table
+        """
+        encoded = string.encode('utf-8')
+        self.strings_filedescriptor.write(LENGTH.pack(len(encoded)) + encoded)
+        # strings have to be stored before the records using them
+        self.strings_filedescriptor.flush()
+        self.number_of_strings += 1
+        return self.number_of_strings - 1
+
+    def _string_id(self, string):
+        """
+        :return: index of a string in the string table, stored only once
+                 while less than MAX_INTERNED strings are known
+        """
+        index = self.string_ids.get(string)
+        if index is None:
+            index = self._append_string(string)
+            if len(self.string_ids) < MAX_INTERNED:
+                self.string_ids[string] = index
+        return index
+
+    def _write(self, unixtime, data_str):
+        values = parse_datagram(data_str)
+        raw = -1
+        if values is None:
+            values = (-1, math.nan) + (math.nan,) * 6 + (-1, '')
+            raw = self._append_string(data_str)
+        elif render_datagram(values[:9], values[9]) != data_str:
+            # original datagrams are usually unique
+            raw = self._append_string(data_str)
+        self.filedescriptor.write(RECORD.pack(
+            float(unixtime), *values[:9], self._string_id(values[9]), raw))
+        self.offset += RECORD.size
+
+    def get_paths(self):
+        return [self.path, self.strings_path]
+
+    def _files(self):
+        return [self.strings_filedescriptor, self.filedescriptor]
+
+
+def iter_binary_capture(path, start=0, stop=None):
+    """
+    Read a binary capture record by record without additional
+    dependencies.
+
+    :param path: path of the capture
+    :param start: number of the first record to read
+    :param stop: number of the record to stop before (None: read to the end)
+    :return: iterator over tuples (unixtime, data_str)
+    """
+    strings, _ = read_strings(f'{path}{STRINGS_SUFFIX}')
+    with open(path, 'rb') as filedescriptor:
+        magic, _, record_size = HEADER.unpack(
+            filedescriptor.read(HEADER.size))
+        if (magic != MAGIC) or (record_size != RECORD.size):
+            raise ValueError(f'{path} is not a binary capture')
+        filedescriptor.seek(HEADER.size + start * RECORD.size)
+        content = filedescriptor.read(
+            -1 if stop is None else max(0, stop - start) * RECORD.size)
+    content = content[:len(content) - len(content) % RECORD.size]
+    for record in RECORD.iter_unpack(content):
+        if record[-1] >= 0:
+            yield record[0], strings[record[-1]]
+        else:
+            yield record[0], render_datagram(record[1:10], strings[record[10]])
+
+
+def export_csv(path, csv_path, fieldnames):
+    """
+    Export a binary capture to the csv format of the receiver.
+
+    :param path: path of the capture
+    :param csv_path: path of the csv file to create
+    :param fieldnames: names of the columns for the header
+    :return: number of exported rows
+    """
+    rows = 0
+    with open(csv_path, mode='w', newline='',
+              encoding='utf-8') as filedescriptor:
+        csv.DictWriter(filedescriptor, fieldnames=fieldnames,
+                       delimiter=';').writeheader()
+        csv_writer = csv.writer(filedescriptor)
+        for unixtime, data_str in iter_binary_capture(path):
+            csv_writer.writerow([f'{unixtime};{data_str}'])
+            rows += 1
+    return rows
+
+
+def load_binary_capture(path):
+    """
+    Map a binary capture into memory without copying it.
+
+    This needs numpy.
+
+    :param path: path of the capture
+    :return: tuple (numpy.memmap with the fields FIELDS, list of strings)
+    """
+    import numpy  # pylint: disable=import-outside-toplevel
+    dtype = numpy.dtype(
+        [(name, '<i8' if name in ('ms', 'parabola') else '<f8')
+         for name in FIELDS[:10]] +
+        [('announcement', '<i4'), ('raw', '<i4')])
+    size = os.path.getsize(path) - HEADER.size
+    strings, _ = read_strings(f'{path}{STRINGS_SUFFIX}')
+    if size < RECORD.size:
+        return numpy.zeros(0, dtype=dtype), strings
+    return numpy.memmap(
+        path, dtype=dtype, mode='r', offset=HEADER.size,
+        shape=(size // RECORD.size,)), strings
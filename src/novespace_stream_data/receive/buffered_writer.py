@@ -0,0 +1,251 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Long-lived, buffered writer for the csv file of a streaming session.
+
+Copyright (C) 2026 Daniel Maier (University of Greifswald),
+                   Daniel Mohr (University of Greifswald),
+                   Thomas Villatte (Novespace)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import csv
+import os
+import time
+from threading import Lock
+
+
+class BufferedWriter():
+    """
+    This class is the base of the writers of a streaming session.
+    It keeps the files open and buffers the written records.
+
+    The buffer is flushed to the operating system after `flush_rows`
+    records or after `flush_interval` seconds, whatever comes first.
+    With `fsync` set, every flush is followed by :func:`os.fsync`,
+    which trades throughput for crash safety.
+
+    If a `latency` histogram (see
+    :class:`novespace_stream_data.receive.Histogram`) is given, the time
+    from receiving every record until its flush is observed.
+
+    If an `index` (see
+    :class:`novespace_stream_data.receive.ParabolaIndex`) is given, every
+    record is added to it and the index is saved on :meth:`close`.
+
+    Derived classes implement :meth:`_open`, :meth:`_write` and
+    :meth:`_files` and keep `offset` (size of the file in bytes) up to
+    date.
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    suffix = ''
+    # True if the records are given as received (bytes)
+    raw = False
+
+    def __init__(self, path, fieldnames, *, flush_rows=10,
+                 flush_interval=1.0, fsync=False, buffer_size=65536,
+                 index=None, latency=None):
+        """
+        :param path: path of the file
+        :param fieldnames: names of the columns for the header
+        :param flush_rows: flush after this number of records
+                           (None or 0 disables the record limit)
+        :param flush_interval: flush after this number of seconds
+                               (None disables the time limit)
+        :param fsync: If set to True, every flush is followed by os.fsync.
+        :param buffer_size: size of the write buffer in bytes
+        :param index: If given, an index of the parabolas is built
+                      while writing.
+        :param latency: If given, the time from receiving a record until
+                        its flush is observed with this histogram.
+        """
+        self.path = path
+        self.fieldnames = fieldnames
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.buffer_size = buffer_size
+        self.is_open = False
+        self.pending_rows = 0
+        self.rows_written = 0
+        self.offset = 0
+        self.index = index
+        self.latency = latency
+        # local timestamps of the records not flushed yet
+        self.pending_times = []
+        self.last_flush = time.monotonic()
+        self.lock = Lock()
+
+    def open(self, write_header=True):
+        """
+        Open the file for appending and write the header.
+
+        :param write_header: If set to True the header is written.
+        """
+        with self.lock:
+            self._open(write_header)
+            self.is_open = True
+            self._flush()
+
+    def write_record(self, unixtime, data_str):
+        """
+        Write one received datagram.
+
+        :param unixtime: local timestamp of the datagram
+        :param data_str: decoded datagram
+        :return: False if the file is already closed, otherwise True
+        """
+        with self.lock:
+            if not self.is_open:
+                return False
+            offset = self.offset
+            self._write(unixtime, data_str)
+            if self.index is not None:
+                self.index.add(offset, self.offset, unixtime, data_str)
+            if self.latency is not None:
+                self.pending_times.append(unixtime)
+            self.rows_written += 1
+            self.pending_rows += 1
+            if self.flush_rows and (self.pending_rows >= self.flush_rows):
+                self._flush()
+            elif ((self.flush_interval is not None) and
+                  (time.monotonic() - self.last_flush >=
+                   self.flush_interval)):
+                self._flush()
+        return True
+
+    def poll(self):
+        """
+        Flush pending records if `flush_interval` is exceeded.
+
+        This should be called if no data arrives for a while.
+        """
+        with self.lock:
+            if (self.is_open and self.pending_rows and
+                    (self.flush_interval is not None) and
+                    (time.monotonic() - self.last_flush >=
+                     self.flush_interval)):
+                self._flush()
+
+    def flush(self):
+        """
+        Flush all pending records.
+        """
+        with self.lock:
+            if self.is_open:
+                self._flush()
+
+    def close(self):
+        """
+        Flush all pending records and close the file.
+
+        Calling this method more than once is harmless.
+        """
+        with self.lock:
+            if self.is_open:
+                self._flush()
+                for filedescriptor in self._files():
+                    filedescriptor.close()
+                self.is_open = False
+                if self.index is not None:
+                    self.index.save()
+
+    def get_paths(self):
+        """
+        :return: list of the paths of the written files
+        """
+        return [self.path]
+
+    def _flush(self):
+        """
+        Flush the buffers; the lock has to be held by the caller.
+        """
+        for filedescriptor in self._files():
+            filedescriptor.flush()
+            if self.fsync:
+                os.fsync(filedescriptor.fileno())
+        if self.pending_times:
+            now = time.time()
+            for unixtime in self.pending_times:
+                self.latency.observe(now - unixtime)
+            self.pending_times = []
+        self.pending_rows = 0
+        self.last_flush = time.monotonic()
+
+    def _open(self, write_header):
+        """
+        Open the files; the lock is held.
+        """
+        raise NotImplementedError
+
+    def _write(self, unixtime, data_str):
+        """
+        Write one record into the buffer; the lock is held.
+        """
+        raise NotImplementedError
+
+    def _files(self):
+        """
+        :return: list of the open file objects
+        """
+        raise NotImplementedError
+
+
+class BufferedCSVWriter(BufferedWriter):
+    """
+    This class keeps the csv file of a streaming session open and
+    buffers the written rows (see :class:`BufferedWriter`).
+
+    The rows are identical to the rows written by the former
+    open-per-datagram implementation.
+    """
+
+    suffix = '.csv'
+
+    def __init__(self, path, fieldnames, **kwargs):
+        """
+        :param path: path of the csv file
+        :param fieldnames: names of the columns for the header
+        :param kwargs: flush policy, see :class:`BufferedWriter`
+        """
+        super().__init__(path, fieldnames, **kwargs)
+        self.filedescriptor = None
+        self.csv_writer = None
+
+    def _open(self, write_header):
+        # pylint: disable=consider-using-with
+        self.filedescriptor = open(
+            self.path, mode='a', newline='', encoding='utf-8',
+            buffering=self.buffer_size)
+        if write_header:
+            csv.DictWriter(
+                self.filedescriptor,
+                fieldnames=self.fieldnames, delimiter=';').writeheader()
+        self.filedescriptor.flush()
+        self.offset = os.path.getsize(self.path)
+        self.csv_writer = csv.writer(self.filedescriptor)
+
+    def _write(self, unixtime, data_str):
+        row = f'{unixtime};{data_str}'
+        # writerow returns the number of characters; the offset is in bytes
+        self.offset += self.csv_writer.writerow([row])
+        if not row.isascii():
+            self.offset += len(row.encode('utf-8')) - len(row)
+
+    def _files(self):
+        return [self.filedescriptor]
@@ -0,0 +1,235 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Publish/subscribe bus of the received datagrams.
+
+Copyright (C) 2026 Daniel Maier (University of Greifswald),
+                   Daniel Mohr (University of Greifswald),
+                   Thomas Villatte (Novespace)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import socket
+import stat
+import time
+from threading import Lock
+
+from .pipeline import ConsumerStage
+
+
+class StreamBus():
+    """
+    This class distributes the received records to any number of
+    subscribers in the same process.
+
+    Every subscriber is a :class:`ConsumerStage` with its own ring buffer,
+    overflow policy and thread, so a slow subscriber only loses its own
+    entries and never holds up the receiving loop. With the policy
+    'block' the receiving loop waits at most `block_timeout` seconds.
+
+    An instance is called with every record; it can be given to
+    :meth:`NoSpaStream.add_record_handler`.
+    """
+
+    def __init__(self, block_timeout=0.01):
+        """
+        :param block_timeout: maximal time to wait for a full subscriber
+                              with the overflow policy 'block'
+        """
+        self.block_timeout = block_timeout
+        self.subscribers = []
+        self.lock = Lock()
+        self.published = 0
+
+    def subscribe(self, handler, capacity=1024, overflow='drop-oldest',
+                  name=None):
+        """
+        Add a subscriber.
+
+        :param handler: function called in the thread of the subscriber
+                        with unixtime, data_str and port of every record
+        :param capacity: capacity of the ring buffer of the subscriber
+        :param overflow: overflow policy, one of OVERFLOW_POLICIES
+        :param name: name of the subscriber (and of its thread)
+        :return: the subscriber (ConsumerStage)
+        """
+        subscriber = ConsumerStage(
+            name or f'subscriber-{len(self.subscribers) + 1}', handler,
+            capacity, overflow,
+            idle_handler=getattr(handler, 'poll', None))
+        subscriber.start()
+        with self.lock:
+            self.subscribers = self.subscribers + [subscriber]
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        """
+        Remove a subscriber after its buffered records are processed.
+
+        :param subscriber: subscriber returned by :meth:`subscribe`
+        """
+        with self.lock:
+            self.subscribers = [entry for entry in self.subscribers
+                                if entry is not subscriber]
+        subscriber.stop()
+
+    def __call__(self, unixtime, data_str, port=None):
+        """
+        Publish a record to all subscribers.
+
+        :param unixtime: local timestamp of the record
+        :param data_str: decoded datagram (the port of the tagged layout
+                         may be in front)
+        :param port: port the datagram was received on
+        """
+        self.published += 1
+        item = (unixtime, data_str, port)
+        # the list is replaced on changes, so it is read without lock
+        for subscriber in self.subscribers:
+            subscriber.ring.put(item, self.block_timeout)
+
+    def close(self):
+        """
+        Remove all subscribers.
+        """
+        for subscriber in list(self.subscribers):
+            self.unsubscribe(subscriber)
+
+    def get_statistics(self):
+        """
+        :return: dictionary with the number of published records and the
+                 counters of every subscriber
+        """
+        return {'published': self.published,
+                'subscribers': {
+                    subscriber.name: subscriber.get_statistics()
+                    for subscriber in self.subscribers}}
+
+
+class UnixSocketPublisher():
+    """
+    This class republishes the records to other processes on the same
+    computer: every client connected to a Unix stream socket gets the
+    records as lines `unixtime;data_str` (as in the csv file), e. g.
+    `socat - UNIX-CONNECT:path`.
+
+    It is used as subscriber of a :class:`StreamBus`. The clients are
+    served without blocking; the lines for a client which does not read
+    are kept up to `max_pending` bytes, then the client is disconnected.
+    """
+
+    def __init__(self, path, max_pending=1048576):
+        """
+        :param path: path of the Unix stream socket
+        :param max_pending: maximal number of bytes waiting for a client
+        """
+        self.path = str(path)
+        self.max_pending = max_pending
+        if os.path.exists(self.path) and \
+                stat.S_ISSOCK(os.stat(self.path).st_mode):
+            # left over by a previous run
+            os.remove(self.path)
+        self.server = socket.socket(
+            socket.AF_UNIX, socket.SOCK_STREAM)  # pylint: disable=no-member
+        self.server.bind(self.path)
+        self.server.listen()
+        self.server.setblocking(False)
+        self.clients = {}
+        self.last_accept = 0.0
+        self.sent = 0
+        self.disconnected = 0
+
+    def __call__(self, unixtime, data_str, port=None):
+        """
+        Send a record to all clients.
+
+        :param unixtime: local timestamp of the record
+        :param data_str: decoded datagram
+        :param port: port the datagram was received on (not used)
+        """
+        if time.monotonic() - self.last_accept >= 0.1:
+            self.poll()
+        if not self.clients:
+            return
+        line = f'{unixtime};{data_str}\n'.encode('utf-8')
+        for client, pending in list(self.clients.items()):
+            pending += line
+            self.send(client, pending)
+        self.sent += 1
+
+    def send(self, client, pending):
+        """
+        Send the pending bytes of a client as far as possible.
+
+        :param client: socket of the client
+        :param pending: bytearray with the bytes not sent yet
+        """
+        try:
+            del pending[:client.send(pending)]
+        except BlockingIOError:
+            pass
+        except OSError:
+            self.disconnect(client)
+            return
+        if len(pending) > self.max_pending:
+            self.disconnect(client)
+
+    def disconnect(self, client):
+        """
+        Close the connection to a client.
+
+        :param client: socket of the client
+        """
+        self.clients.pop(client, None)
+        client.close()
+        self.disconnected += 1
+
+    def poll(self):
+        """
+        Accept new clients and send pending bytes; this is also called
+        by the subscriber if no records arrive.
+        """
+        self.last_accept = time.monotonic()
+        while True:
+            try:
+                client, _ = self.server.accept()
+            except (BlockingIOError, InterruptedError):
+                break
+            client.setblocking(False)
+            self.clients[client] = bytearray()
+        for client, pending in list(self.clients.items()):
+            if pending:
+                self.send(client, pending)
+
+    def get_statistics(self):
+        """
+        :return: dictionary with the counters of the publisher
+        """
+        return {'clients': len(self.clients), 'sent': self.sent,
+                'disconnected': self.disconnected}
+
+    def close(self):
+        """
+        Close all connections and remove the socket.
+        """
+        for client in list(self.clients):
+            client.close()
+        self.clients = {}
+        self.server.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
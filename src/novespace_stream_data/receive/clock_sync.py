@@ -0,0 +1,301 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Alignment of the local clock with the clock of the stream.
+
+Copyright (C) 2026 Daniel Maier (University of Greifswald),
+                   Daniel Mohr (University of Greifswald),
+                   Thomas Villatte (Novespace)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+clock model
+===========
+
+The local timestamp of a datagram is its time of sending plus a
+network delay, which is never negative but varies (jitter). So the
+datagrams with the least delay describe the relation of the clocks: the
+stream time is split in blocks, the datagram with the least delay of
+every block is kept and a line is fitted robustly (Theil-Sen: median of
+the slopes of all pairs) through the kept datagrams of the last blocks.
+
+A model consists of `reference_ms` (column 'miliseconds since 00:00:00'),
+the local unix time `reference_time` at this stream time and the drift
+of the local clock against the clock of the stream. A stream time `ms`
+is converted to local unix time by::
+
+    reference_time + wrap(ms - reference_ms) / 1000 * (1 + drift)
+
+with `wrap` mapping the difference to half a day around 0 (midnight).
+
+clock log
+=========
+
+With a clock log the model is written after every block (and at the
+end) with the columns `unixtime` (local timestamp of the last datagram
+of the fit), `reference_ms`, `reference_time`, `drift_ppm` (drift in
+1e-6), `delay_ms` (mean delay of the datagrams of the block above the
+fitted line) and `blocks` (number of blocks of the fit), e. g.::
+
+    1760428810.0;36000000;1760428800.012345;-3.1;0.412;1
+
+It is read by :func:`novespace_stream_data.analysis.read_clock_log` and
+the logs of the receiver are converted by
+:func:`novespace_stream_data.analysis.align_clock`.
+"""
+
+import time
+from collections import deque
+from pathlib import Path
+from statistics import median
+
+from .loss_monitor import DAY
+
+CLOCK_SUFFIX = '.clock.csv'
+
+CLOCK_COLUMNS = ('unixtime', 'reference_ms', 'reference_time',
+                 'drift_ppm', 'delay_ms', 'blocks')
+
+
+def clock_path(path):
+    """
+    :param path: path of a file of the receiver
+    :return: path of its clock log
+    """
+    return Path(path).with_suffix(CLOCK_SUFFIX)
+
+
+def wrap_ms(delta):
+    """
+    :param delta: difference of two stream times in miliseconds
+    :return: difference in [-DAY / 2, DAY / 2) (over midnight)
+    """
+    return (delta + DAY // 2) % DAY - DAY // 2
+
+
+def theil_sen(points):
+    """
+    Fit a line robustly.
+
+    :param points: list of tuples (x, y)
+    :return: tuple (slope, intercept); the slope is the median of the
+             slopes of all pairs, the intercept the median of the
+             intercepts with this slope
+    """
+    slopes = [(y_2 - y_1) / (x_2 - x_1)
+              for index, (x_1, y_1) in enumerate(points)
+              for x_2, y_2 in points[index + 1:] if x_2 != x_1]
+    slope = median(slopes) if slopes else 0.0
+    return slope, median(y - slope * x for x, y in points)
+
+
+class ClockSync():
+    """
+    This class fits the offset and the drift between the local clock and
+    the column 'miliseconds since 00:00:00' of the stream while receiving
+    (see :mod:`novespace_stream_data.receive.clock_sync`).
+
+    The local timestamps are made independent of steps of the system
+    clock (e. g. by NTP) with the monotonic clock, so a step does not
+    disturb the fit. A jump of the stream time by more than `max_gap`
+    miliseconds (e. g. a restart of the sender) starts a new fit.
+
+    :meth:`add_record` takes typed records, e. g. from
+    :meth:`NoSpaStream.add_parsed_handler`.
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, path=None, block_seconds=10.0, blocks=30,
+                 max_gap=10000):
+        """
+        :param path: path of the clock log (None: no log)
+        :param block_seconds: length of a block of stream time in seconds
+        :param blocks: number of the last blocks used for the fit
+        :param max_gap: longer jumps of the stream time (in miliseconds)
+                        start a new fit
+        """
+        self.block_seconds = block_seconds
+        self.blocks = deque(maxlen=blocks)
+        self.max_gap = max_gap
+        self.path = None
+        self.log = None
+        self.samples = 0
+        self.resets = 0
+        self.fit = None
+        self.delay = None
+        self.last_unixtime = None
+        self.reset()
+        self.open(path)
+
+    def open(self, path):
+        """
+        Start a new fit and a clock log.
+
+        :param path: path of the clock log (None: no log)
+        """
+        self.close()
+        self.reset()
+        self.path = path
+        if path is not None:
+            self.log = open(  # pylint: disable=consider-using-with
+                path, 'a', encoding='ascii')
+            if self.log.tell() == 0:
+                self.log.write(';'.join(CLOCK_COLUMNS) + '\n')
+                self.log.flush()
+
+    def reset(self):
+        """
+        Forget the fit, e. g. after a restart of the sender.
+        """
+        self.blocks.clear()
+        self.fit = None
+        self.delay = None
+        # stream time of the first datagram and elapsed stream time
+        self.origin_ms = None
+        self.elapsed_ms = 0
+        self.wall_offset = time.time() - time.monotonic()
+        # start, least delay (x, y) and summed delay of the current block
+        self.block = None
+
+    def add_record(self, record):
+        """
+        Add a typed record.
+
+        :param record: :class:`Record`
+        """
+        self.add(record.unixtime, record.ms)
+
+    def add(self, unixtime, milliseconds):
+        """
+        Add a datagram.
+
+        :param unixtime: local timestamp of the datagram
+        :param milliseconds: column 'miliseconds since 00:00:00'
+        """
+        if self.origin_ms is None:
+            self.origin_ms = milliseconds
+        else:
+            delta = wrap_ms(milliseconds - self.origin_ms - self.elapsed_ms)
+            if abs(delta) > self.max_gap:
+                self.resets += 1
+                self.reset()
+                self.origin_ms = milliseconds
+                delta = 0
+            self.elapsed_ms += delta
+        self.samples += 1
+        # undo steps of the system clock since the start of the fit
+        local = unixtime - (time.time() - time.monotonic() -
+                            self.wall_offset)
+        # stream time (seconds since origin) and delay
+        x = self.elapsed_ms / 1000
+        y = local - x
+        if self.block is None:
+            self.block = [x, (x, y), 0.0, 0]
+        elif x - self.block[0] >= self.block_seconds:
+            self.end_block()
+            self.block = [x, (x, y), 0.0, 0]
+        elif y < self.block[1][1]:
+            self.block[1] = (x, y)
+        if self.fit is not None:
+            self.block[2] += y - self.fit[1] - self.fit[0] * x
+            self.block[3] += 1
+        self.last_unixtime = unixtime
+
+    def end_block(self):
+        """
+        Fit the model with the finished block and write it to the log.
+        """
+        self.blocks.append(self.block[1])
+        self.delay = self.block[2] / self.block[3] if self.block[3] \
+            else None
+        self.fit = theil_sen(list(self.blocks))
+        if self.log is not None:
+            model = self.get_model()
+            delay = '' if self.delay is None else f'{1e3 * self.delay:.3f}'
+            self.log.write(
+                f"{self.last_unixtime:.6f};{model['reference_ms']};"
+                f"{model['reference_time']:.6f};"
+                f"{1e6 * model['drift']:.3f};{delay};{len(self.blocks)}\n")
+            self.log.flush()
+
+    def get_model(self):
+        """
+        :return: dictionary with reference_ms, reference_time and drift
+                 or None before the first datagram; until the first
+                 block is finished, the drift is 0 and the datagram with
+                 the least delay so far is used
+        """
+        if self.block is None:
+            return None
+        if self.fit is None:
+            x, intercept = self.block[1]
+            slope = 0.0
+        else:
+            x = self.blocks[-1][0]
+            slope, intercept = self.fit
+        return {'reference_ms': (self.origin_ms + round(1000 * x)) % DAY,
+                'reference_time': x * (1 + slope) + intercept,
+                'drift': slope}
+
+    def to_local(self, milliseconds):
+        """
+        :param milliseconds: column 'miliseconds since 00:00:00'
+        :return: local unix time of this stream time or None
+        """
+        model = self.get_model()
+        if model is None:
+            return None
+        return model['reference_time'] + wrap_ms(
+            milliseconds - model['reference_ms']) / 1000 * \
+            (1 + model['drift'])
+
+    def to_stream(self, unixtime=None):
+        """
+        :param unixtime: local unix time (default: now); steps of the
+                         system clock since the start of the fit are
+                         not corrected
+        :return: stream time ('miliseconds since 00:00:00', float) at
+                 this local time or None
+        """
+        model = self.get_model()
+        if model is None:
+            return None
+        if unixtime is None:
+            unixtime = time.monotonic() + self.wall_offset
+        return (model['reference_ms'] + 1000 * (
+            unixtime - model['reference_time']) / (1 + model['drift'])) % DAY
+
+    def get_statistics(self):
+        """
+        :return: dictionary with the counters and the current model
+        """
+        statistics = {'samples': self.samples, 'resets': self.resets,
+                      'blocks': len(self.blocks)}
+        if self.fit is not None:
+            statistics['drift_ppm'] = 1e6 * self.fit[0]
+        if self.delay is not None:
+            statistics['delay_ms'] = 1e3 * self.delay
+        return statistics
+
+    def close(self):
+        """
+        Fit the model with the current block and close the clock log.
+        """
+        if self.log is not None:
+            if self.block is not None:
+                self.end_block()
+            self.log.close()
+            self.log = None
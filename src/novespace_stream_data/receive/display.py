@@ -0,0 +1,121 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Coalescing hand-over of the received datagrams to a display.
+
+Copyright (C) 2026 Daniel Maier (University of Greifswald),
+                   Daniel Mohr (University of Greifswald),
+                   Thomas Villatte (Novespace)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import time
+from collections import deque
+
+from .binary_capture import parse_datagram
+from .sequence import split_sequence
+
+
+def format_summary(data_str, rate=None):
+    """
+    Summarize a displayed datagram in one line.
+
+    :param data_str: datagram as displayed (with local timestamp and
+                     maybe port and sequence number)
+    :param rate: received datagrams per second
+    :return: summary line or None if the datagram cannot be parsed
+    """
+    if split_sequence(data_str) is not None:
+        data_str = data_str.rpartition(';')[0]
+    values = parse_datagram(';'.join(data_str.split(';')[-10:]))
+    if values is None:
+        return None
+    summary = (f"parabola {values[8]}  {values[9]}  "
+               f"jx {values[2]:+.2f}  jy {values[3]:+.2f}  "
+               f"jz {values[4]:+.2f} g")
+    if rate is not None:
+        summary += f"  {rate:.1f} datagrams/s"
+    return summary
+
+
+class DisplayBuffer():
+    """
+    This class passes the datagrams from the receiving thread to a
+    display which refreshes at a fixed frame rate (e. g. the Tk main
+    loop).
+
+    The receiving thread only appends to a bounded deque: if the display
+    is slower than the stream, older lines are dropped (coalesced) and
+    only the latest `lines` are shown. :meth:`take` is called once per
+    frame by the display.
+    """
+
+    def __init__(self, lines=20, rate_interval=1.0):
+        """
+        :param lines: maximal number of lines handed over per frame
+        :param rate_interval: seconds over which the rate is measured
+        """
+        self.lines = deque(maxlen=lines)
+        self.rate_interval = rate_interval
+        self.received = 0
+        self.shown = 0
+        self.latest = None
+        self.rate = None
+        self.rate_start = (time.monotonic(), 0)
+
+    def add(self, data_str):
+        """
+        Add a datagram; this is called by the receiving thread.
+
+        :param data_str: datagram as displayed
+        """
+        self.received += 1
+        self.lines.append((self.received, data_str))
+
+    def take(self):
+        """
+        Take the lines added since the last frame.
+
+        :return: tuple (list of the latest lines, number of skipped lines)
+        """
+        lines = []
+        number = self.shown
+        while True:
+            try:
+                number, data_str = self.lines.popleft()
+            except IndexError:
+                break
+            lines.append(data_str)
+        skipped = max(0, number - self.shown - len(lines))
+        self.shown = number
+        if lines:
+            self.latest = lines[-1]
+        now = time.monotonic()
+        if now - self.rate_start[0] >= self.rate_interval:
+            self.rate = (self.shown - self.rate_start[1]) / (
+                now - self.rate_start[0])
+            self.rate_start = (now, self.shown)
+        return lines, skipped
+
+    def get_summary(self):
+        """
+        :return: summary line of the latest datagram (g-levels, parabola,
+                 rate) or None
+        """
+        if self.latest is None:
+            return None
+        return format_summary(self.latest, self.rate)
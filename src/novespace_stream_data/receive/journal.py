@@ -0,0 +1,315 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Crash-safe journal of the received datagrams.
+
+Copyright (C) 2026 Daniel Maier (University of Greifswald),
+                   Daniel Mohr (University of Greifswald),
+                   Thomas Villatte (Novespace)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+format
+======
+
+A journal consists of two files:
+
+`<name>.nsj` starts with a header (magic `NSPAJRN1`, uint32 version,
+uint32 length of the field names) followed by the field names of the
+csv file (utf-8, separated by ';'). Then records follow (little
+endian):
+
+=============  =======  ==============================================
+field          type     content
+=============  =======  ==============================================
+length         uint32   length of the datagram in bytes
+checksum       uint32   crc32 of unixtime and datagram
+unixtime       float64  local timestamp
+datagram       bytes    decoded datagram (utf-8) as received
+=============  =======  ==============================================
+
+`<name>.nsj.commit` holds the size of the journal at the last commit
+(uint64), a flag set when the session was closed cleanly (uint32) and
+the crc32 of both.
+
+The records are committed in groups: after `commit_interval` seconds
+the journal is flushed and synced to disk (:func:`os.fsync`), then the
+commit file is updated. On opening, only the records after the last
+commit are checked; a torn or corrupt record and everything after it is
+removed and the journal is continued.
+"""
+
+import csv
+import glob
+import os
+import struct
+import zlib
+from pathlib import Path
+
+from .buffered_writer import BufferedWriter
+
+MAGIC = b'NSPAJRN1'
+VERSION = 1
+HEADER = struct.Struct('<8sII')
+RECORD_HEADER = struct.Struct('<IId')
+UNIXTIME = struct.Struct('<d')
+COMMIT = struct.Struct('<QII')
+COMMIT_SUFFIX = '.commit'
+MAX_DATAGRAM_SIZE = 65535
+
+
+def checksum(unixtime, payload):
+    """
+    :return: crc32 of the timestamp and the encoded datagram
+    """
+    return zlib.crc32(payload, zlib.crc32(UNIXTIME.pack(unixtime)))
+
+
+def read_header(filedescriptor):
+    """
+    Read the header of a journal.
+
+    :param filedescriptor: journal opened for binary reading at offset 0
+    :return: tuple (list of field names, size of the header in bytes)
+    """
+    magic, version, length = HEADER.unpack(filedescriptor.read(HEADER.size))
+    if (magic != MAGIC) or (version != VERSION):
+        raise ValueError(f'{filedescriptor.name} is not a journal')
+    fieldnames = filedescriptor.read(length).decode('utf-8').split(';')
+    return fieldnames, HEADER.size + length
+
+
+def read_commit(path):
+    """
+    :param path: path of the journal
+    :return: tuple (size at the last commit, True if closed cleanly) or
+             None if there is no valid commit file
+    """
+    try:
+        with open(f'{path}{COMMIT_SUFFIX}', 'rb') as filedescriptor:
+            content = filedescriptor.read(COMMIT.size)
+    except OSError:
+        return None
+    if len(content) != COMMIT.size:
+        return None
+    size, closed, crc = COMMIT.unpack(content)
+    if zlib.crc32(content[:COMMIT.size - 4]) != crc:
+        return None
+    return size, bool(closed)
+
+
+def iter_journal(path, start=None):
+    """
+    Read a journal record by record up to the first torn or corrupt
+    record.
+
+    :param path: path of the journal
+    :param start: byte offset of the first record (default: after the
+                  header)
+    :return: iterator over tuples (offset, end, unixtime, data_str)
+    """
+    with open(path, 'rb') as filedescriptor:
+        _, header_size = read_header(filedescriptor)
+        offset = header_size if start is None else start
+        filedescriptor.seek(offset)
+        while True:
+            head = filedescriptor.read(RECORD_HEADER.size)
+            if len(head) < RECORD_HEADER.size:
+                return
+            length, crc, unixtime = RECORD_HEADER.unpack(head)
+            if length > MAX_DATAGRAM_SIZE:
+                return
+            payload = filedescriptor.read(length)
+            if (len(payload) < length) or \
+                    (checksum(unixtime, payload) != crc):
+                return
+            end = offset + RECORD_HEADER.size + length
+            yield offset, end, unixtime, payload.decode('utf-8')
+            offset = end
+
+
+def recover_journal(path):
+    """
+    Remove a torn or corrupt tail of a journal.
+
+    Only the records after the last commit are checked (all records if
+    the commit file is missing or invalid).
+
+    :param path: path of the journal
+    :return: tuple (size of the valid journal in bytes (0 for a new
+             journal), True if the session was closed cleanly)
+    """
+    if not os.path.exists(path):
+        return 0, False
+    with open(path, 'rb') as filedescriptor:
+        try:
+            _, header_size = read_header(filedescriptor)
+        except (struct.error, UnicodeDecodeError):
+            header_size = None
+    if (header_size is None) or (header_size > os.path.getsize(path)):
+        # the header itself is torn
+        os.truncate(path, 0)
+        return 0, False
+    commit = read_commit(path)
+    size = header_size
+    closed = False
+    if (commit is not None) and \
+            (header_size <= commit[0] <= os.path.getsize(path)):
+        size, closed = commit
+    for _, size, _, _ in iter_journal(path, size):
+        closed = False
+    if size < os.path.getsize(path):
+        os.truncate(path, size)
+        closed = False
+    return size, closed
+
+
+def find_resumable(folder, pattern='NoveSpa_planedata_*.nsj'):
+    """
+    Find the newest journal of a session which was not closed cleanly
+    (e. g. after a loss of power).
+
+    :param folder: folder of the journals
+    :param pattern: pattern of the names of the journals
+    :return: path of the journal or None
+    """
+    journals = sorted(glob.glob(os.path.join(glob.escape(str(folder)),
+                                             pattern)),
+                      key=os.path.getmtime)
+    if not journals:
+        return None
+    commit = read_commit(journals[-1])
+    if (commit is not None) and commit[1]:
+        return None
+    return Path(journals[-1])
+
+
+def export_journal(path, csv_path):
+    """
+    Export a journal to the csv format of the receiver.
+
+    :param path: path of the journal
+    :param csv_path: path of the csv file to create
+    :return: number of exported rows
+    """
+    with open(path, 'rb') as filedescriptor:
+        fieldnames, _ = read_header(filedescriptor)
+    rows = 0
+    with open(csv_path, mode='w', newline='',
+              encoding='utf-8') as filedescriptor:
+        csv.DictWriter(filedescriptor, fieldnames=fieldnames,
+                       delimiter=';').writeheader()
+        csv_writer = csv.writer(filedescriptor)
+        for _, _, unixtime, data_str in iter_journal(path):
+            csv_writer.writerow([f'{unixtime};{data_str}'])
+            rows += 1
+    return rows
+
+
+class JournalWriter(BufferedWriter):
+    """
+    This class writes the received datagrams into a crash-safe journal
+    (see :mod:`novespace_stream_data.receive.journal`).
+
+    Every record has a checksum. The records are committed in groups
+    (flush, :func:`os.fsync` and update of the commit file) every
+    `commit_interval` seconds: a shorter interval loses less data on a
+    loss of power, a longer one allows a higher throughput. An existing
+    journal is recovered and continued.
+    """
+
+    suffix = '.nsj'
+
+    def __init__(self, path, fieldnames, *, commit_interval=None,
+                 **kwargs):
+        """
+        :param path: path of the journal
+        :param fieldnames: names of the columns (stored for the export)
+        :param commit_interval: If given, a commit is done every
+                                `commit_interval` seconds (instead of
+                                the flush policy).
+        :param kwargs: flush policy, see :class:`BufferedWriter`;
+                       `fsync` is always set
+        """
+        if commit_interval is not None:
+            kwargs['flush_rows'] = 0
+            kwargs['flush_interval'] = commit_interval
+        kwargs['fsync'] = True
+        super().__init__(path, fieldnames, **kwargs)
+        self.commit_path = f'{path}{COMMIT_SUFFIX}'
+        self.filedescriptor = None
+        self.commit_descriptor = None
+        self.resumed = False
+
+    def _open(self, write_header):
+        size, _ = recover_journal(self.path)
+        self.resumed = size > 0
+        # pylint: disable=consider-using-with
+        self.filedescriptor = open(
+            self.path, 'ab', buffering=self.buffer_size)
+        if size == 0:
+            names = ';'.join(self.fieldnames).encode('utf-8')
+            self.filedescriptor.write(
+                HEADER.pack(MAGIC, VERSION, len(names)) + names)
+            size = HEADER.size + len(names)
+        self.offset = size
+        self.commit_descriptor = os.open(
+            self.commit_path, os.O_WRONLY | os.O_CREAT, 0o644)
+
+    def _write(self, unixtime, data_str):
+        payload = data_str.encode('utf-8')
+        unixtime = float(unixtime)
+        self.filedescriptor.write(
+            RECORD_HEADER.pack(len(payload), checksum(unixtime, payload),
+                               unixtime) + payload)
+        self.offset += RECORD_HEADER.size + len(payload)
+
+    def _flush(self):
+        super()._flush()
+        self._commit(False)
+
+    def _commit(self, closed):
+        """
+        Store the size of the synced journal; the lock is held.
+        """
+        content = COMMIT.pack(self.offset, int(closed), 0)[:COMMIT.size - 4]
+        os.pwrite(self.commit_descriptor,
+                  content + struct.pack('<I', zlib.crc32(content)), 0)
+
+    def close(self):
+        """
+        Commit all pending records, mark the journal as closed cleanly
+        and close it.
+
+        Calling this method more than once is harmless.
+        """
+        with self.lock:
+            if not self.is_open:
+                return
+            self._flush()
+            self.filedescriptor.close()
+            self._commit(True)
+            os.fsync(self.commit_descriptor)
+            os.close(self.commit_descriptor)
+            self.is_open = False
+            if self.index is not None:
+                self.index.save()
+
+    def get_paths(self):
+        return [self.path, self.commit_path]
+
+    def _files(self):
+        return [self.filedescriptor]
@@ -0,0 +1,294 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Continuous accounting of lost datagrams in the receiver.
+
+Copyright (C) 2026 Daniel Maier (University of Greifswald),
+                   Daniel Mohr (University of Greifswald),
+                   Thomas Villatte (Novespace)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+stats log
+=========
+
+With a stats log a line per second with the columns `unixtime`,
+`received`, `missing`, `out_of_order`, `duplicate`, `kernel_dropped`,
+`stage_dropped` and `errors` is written, e. g.::
+
+    1760428800;10;0;0;0;0;0;0
+
+`missing` are the datagrams detected as lost by a gap (this may be
+corrected by later out-of-order datagrams), `kernel_dropped` the
+datagrams dropped by the kernel because the receive buffer of a socket
+was full and `stage_dropped` the datagrams dropped by full ring buffers
+(see :class:`novespace_stream_data.receive.ConsumerStage`).
+"""
+
+import os
+import time
+from collections import deque
+from pathlib import Path
+from statistics import median
+
+from .sequence import SEQUENCE_MARK, SequenceTracker, split_sequence
+
+STATS_SUFFIX = '.stats.csv'
+
+COUNTERS = ('received', 'missing', 'out_of_order', 'duplicate',
+            'kernel_dropped', 'stage_dropped', 'errors')
+
+DAY = 86400000  # miliseconds
+
+# number of steps of the column 'miliseconds since 00:00:00' to infer
+# the interval from
+CALIBRATION = 20
+
+PROC_FILES = ('/proc/net/udp', '/proc/net/udp6')
+
+
+def stats_path(path):
+    """
+    :param path: path of a file of the receiver
+    :return: path of its stats log
+    """
+    return Path(path).with_suffix(STATS_SUFFIX)
+
+
+def read_kernel_drops(inodes):
+    """
+    Read the number of datagrams the kernel dropped because the receive
+    buffer of a socket was full (column `drops` of /proc/net/udp).
+
+    :param inodes: inodes of the sockets
+    :return: sum of the drops of the sockets or None if not available
+    """
+    drops = None
+    for proc_file in PROC_FILES:
+        try:
+            with open(proc_file, encoding='ascii') as filedescriptor:
+                lines = filedescriptor.readlines()[1:]
+        except OSError:
+            continue
+        for line in lines:
+            fields = line.split()
+            if (len(fields) > 12) and (int(fields[9]) in inodes):
+                drops = (drops or 0) + int(fields[12])
+    return drops
+
+
+def count_steps(clock, delta):
+    """
+    :param clock: list (miliseconds and number of the latest datagram,
+                  interval or None, steps to infer the interval from)
+    :param delta: miliseconds since the latest datagram
+    :return: number of datagrams since the latest datagram; a step
+             shorter than one interval is one datagram
+    """
+    if clock[2] is None:
+        # every datagram is one step until the interval is known
+        if delta > 0:
+            clock[3].append(delta)
+            if len(clock[3]) == CALIBRATION:
+                clock[2] = median(clock[3])
+        return (delta > 0) - (delta < 0)
+    if delta > 0:
+        return max(1, round(delta / clock[2]))
+    if delta < 0:
+        return min(-1, round(delta / clock[2]))
+    return 0
+
+
+class LossMonitor():
+    """
+    This class counts received, missing, out-of-order and duplicate
+    datagrams continuously and sums them per second.
+
+    Datagrams with a sequence number (see
+    :mod:`novespace_stream_data.receive.sequence`) are counted by it.
+    Otherwise the column 'miliseconds since 00:00:00' is used: the stream
+    from Novespace sends a datagram every `interval` miliseconds, so a
+    gap of n intervals means n - 1 missing datagrams, a time before the
+    latest one an out-of-order and the same time a duplicate datagram; a
+    step shorter than one interval is on time. If no `interval` is
+    given, it is the median of the first CALIBRATION steps of a port
+    (every datagram counts as one step until then).
+    Midnight is handled; a jump by more than `max_gap` miliseconds
+    (e. g. a restart of the sender) is counted as interruption and not as
+    loss.
+
+    Additionally the drop counters of the kernel (Linux: /proc/net/udp)
+    and of the ring buffers are read every second.
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, path=None, interval=None, max_gap=10000,
+                 history=60):
+        """
+        :param path: path of the stats log (None: no log)
+        :param interval: miliseconds between datagrams of a stream
+                         without sequence numbers (None: inferred)
+        :param max_gap: longer gaps (in miliseconds) are counted as
+                        interruption instead of loss
+        :param history: number of per-second lines kept in memory
+        """
+        self.path = path
+        self.interval = interval
+        self.max_gap = max_gap
+        self.tracker = SequenceTracker()
+        self.clocks = {}
+        self.inodes = set()
+        self.interruptions = 0
+        self.totals = dict.fromkeys(COUNTERS, 0)
+        self.current = dict.fromkeys(COUNTERS, 0)
+        self.history = deque(maxlen=history)
+        self.tracked = dict.fromkeys(('missing', 'out_of_order',
+                                      'duplicate'), 0)
+        self.kernel_dropped = None
+        self.stage_dropped = 0
+        self.second = int(time.time())
+        self.closed = False
+        self.log = None
+        if path is not None:
+            self.log = open(  # pylint: disable=consider-using-with
+                path, 'a', encoding='ascii')
+            if self.log.tell() == 0:
+                self.log.write(';'.join(('unixtime',) + COUNTERS) + '\n')
+                self.log.flush()
+
+    def add_socket(self, sock):
+        """
+        Read the drop counter of the kernel for a socket.
+
+        :param sock: bound UDP socket
+        """
+        self.inodes.add(os.fstat(sock.fileno()).st_ino)
+        self.kernel_dropped = read_kernel_drops(self.inodes)
+
+    def add(self, data, port=None):
+        """
+        Count a received datagram.
+
+        :param data: received datagram (bytes)
+        :param port: port the datagram was received on
+        """
+        self.current['received'] += 1
+        field = data[data.rfind(b';') + 1:]
+        if field[:1] == SEQUENCE_MARK.encode():
+            sequence = split_sequence(field.decode('ascii', 'replace'))
+            if sequence is not None:
+                self.tracker.add(port, SEQUENCE_MARK + sequence[0],
+                                 sequence[1])
+                return
+        try:
+            milliseconds = int(data[:data.find(b';')])
+        except ValueError:
+            return
+        clock = self.clocks.get(port)
+        if clock is None:
+            # miliseconds and number of the latest datagram, interval and
+            # steps to infer the interval from
+            self.clocks[port] = [milliseconds, 0, self.interval, []]
+            self.tracker.add(port, '', 0)
+            return
+        delta = milliseconds - clock[0]
+        if delta < -DAY // 2:
+            delta += DAY
+        elif delta > DAY // 2:
+            delta -= DAY
+        if abs(delta) > self.max_gap:
+            self.interruptions += 1
+            steps = 1
+        else:
+            steps = count_steps(clock, delta)
+        number = clock[1] + steps
+        if steps > 0:
+            clock[0] = milliseconds
+            clock[1] = number
+        self.tracker.add(port, '', number)
+
+    def add_error(self):
+        """
+        Count a receive error.
+
+        :return: True for the first error in the current second
+        """
+        self.current['errors'] += 1
+        return self.current['errors'] == 1
+
+    def poll(self, stage_dropped=0, now=None):
+        """
+        Close the current second if it has passed.
+
+        :param stage_dropped: number of datagrams dropped by the ring
+                              buffers so far
+        :param now: current unix time
+        """
+        now = time.time() if now is None else now
+        if now < self.second + 1:
+            return
+        statistics = self.tracker.get_statistics()
+        for key, value in self.tracked.items():
+            self.current[key] = statistics[key] - value
+            self.tracked[key] = statistics[key]
+        self.current['stage_dropped'] = stage_dropped - self.stage_dropped
+        self.stage_dropped = stage_dropped
+        if self.inodes:
+            kernel_dropped = read_kernel_drops(self.inodes)
+            if (kernel_dropped is not None) and \
+                    (self.kernel_dropped is not None):
+                self.current['kernel_dropped'] = \
+                    kernel_dropped - self.kernel_dropped
+            self.kernel_dropped = kernel_dropped
+        for key, value in self.current.items():
+            self.totals[key] += value
+        row = (self.second,) + tuple(self.current[key] for key in COUNTERS)
+        self.history.append(row)
+        if self.log is not None:
+            self.log.write(';'.join(map(str, row)) + '\n')
+            self.log.flush()
+        self.current = dict.fromkeys(COUNTERS, 0)
+        self.second = int(now)
+
+    def get_statistics(self):
+        """
+        :return: dictionary with the totals, the counters of the last
+                 complete second and the number of interruptions
+        """
+        statistics = dict(self.totals)
+        statistics['interruptions'] = self.interruptions
+        statistics['kernel_drops_available'] = self.kernel_dropped is not None
+        if self.history:
+            statistics['last_second'] = dict(
+                zip(COUNTERS, self.history[-1][1:]))
+        return statistics
+
+    def close(self, stage_dropped=None):
+        """
+        Write the current second and close the stats log.
+
+        :param stage_dropped: number of datagrams dropped by the ring
+                              buffers so far
+        """
+        if self.closed:
+            return
+        self.closed = True
+        if stage_dropped is None:
+            stage_dropped = self.stage_dropped
+        self.poll(stage_dropped, now=max(time.time(), self.second + 1))
+        if self.log is not None:
+            self.log.close()
+            self.log = None
@@ -0,0 +1,301 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Live metrics of the receiver in the Prometheus text format.
+
+Copyright (C) 2026 Daniel Maier (University of Greifswald),
+                   Daniel Mohr (University of Greifswald),
+                   Thomas Villatte (Novespace)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import http.server
+import os
+import socket
+import socketserver
+import stat
+import time
+import urllib.request
+from bisect import bisect_left
+from threading import Thread
+
+PREFIX = 'novespace_receiver'
+
+# default address of the endpoint (9100 is used by the node_exporter)
+METRICS_ADDRESS = 'localhost:9313'
+
+# seconds
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+                   0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+DURATION_BUCKETS = (0.000001, 0.0000025, 0.000005, 0.00001, 0.000025,
+                    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.01, 0.1)
+
+LOSS_COUNTERS = ('missing', 'out_of_order', 'duplicate', 'kernel_dropped',
+                 'stage_dropped', 'errors')
+
+
+def read_metrics(address, timeout=5.0):
+    """
+    Fetch the metrics of a :class:`MetricsServer`, e. g. of a remote
+    receiver.
+
+    :param address: 'host:port' for HTTP or the path of a Unix stream
+                    socket
+    :param timeout: timeout in seconds
+    :return: dictionary mapping the samples (name with labels, e. g.
+             'novespace_receiver_lost_total{kind="missing"}') to values
+    """
+    host, _, port = address.rpartition(':')
+    if host and port.isdigit():
+        with urllib.request.urlopen(f'http://{address}/metrics',
+                                    timeout=timeout) as response:
+            text = response.read().decode('utf-8')
+    else:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(address)
+            chunks = []
+            while chunk := client.recv(65536):
+                chunks.append(chunk)
+        text = b''.join(chunks).decode('utf-8')
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith('#'):
+            name, _, value = line.rpartition(' ')
+            samples[name] = float(value)
+    return samples
+
+
+class Histogram():
+    """
+    This class counts values in fixed buckets (like a Prometheus
+    histogram) with one bisection per value.
+
+    It is not locked; every histogram has to be observed by one thread
+    only.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        """
+        :param buckets: sorted upper bounds of the buckets
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        """
+        Count a value.
+
+        :param value: observed value
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self, name, description):
+        """
+        :param name: name of the metric
+        :param description: help text of the metric
+        :return: list of lines in the Prometheus text format
+        """
+        lines = [f'# HELP {name} {description}', f'# TYPE {name} histogram']
+        cumulative = 0
+        for bound, count in zip(self.buckets + ('+Inf',), self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_sum {self.sum}')
+        lines.append(f'{name}_count {self.count}')
+        return lines
+
+
+class ReceiverMetrics():
+    """
+    This class collects the metrics of :class:`NoSpaStream`.
+
+    The receiving loop only increments counters and observes histograms;
+    the text is rendered in the thread of the endpoint
+    (:class:`MetricsServer`) when the metrics are scraped.
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self):
+        self.bytes = 0
+        self.wakeups = 0
+        self.idle_wakeups = 0
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.write_time = Histogram(DURATION_BUCKETS)
+        self.display_time = Histogram(DURATION_BUCKETS)
+        self.last_scrape = (time.monotonic(), 0, 0)
+
+    def get_rates(self, received):
+        """
+        :param received: number of received datagrams
+        :return: tuple (datagrams/s, bytes/s) since the last call
+        """
+        now = time.monotonic()
+        last_time, last_received, last_bytes = self.last_scrape
+        self.last_scrape = (now, received, self.bytes)
+        duration = now - last_time
+        if duration <= 0:
+            return 0.0, 0.0
+        return ((received - last_received) / duration,
+                (self.bytes - last_bytes) / duration)
+
+    def render(self, statistics, running=True):
+        """
+        :param statistics: statistics of :meth:`NoSpaStream.get_statistics`
+        :param running: True if the stream is active
+        :return: metrics in the Prometheus text format
+        """
+        lines = []
+
+        def add(name, kind, description, samples):
+            name = f'{PREFIX}_{name}'
+            lines.append(f'# HELP {name} {description}')
+            lines.append(f'# TYPE {name} {kind}')
+            for labels, value in samples:
+                lines.append(f'{name}{labels} {value}')
+
+        datagram_rate, byte_rate = self.get_rates(statistics['received'])
+        add('up', 'gauge', 'Stream is active.', [('', int(running))])
+        add('datagrams_total', 'counter', 'Received datagrams.',
+            [('', statistics['received'])])
+        add('bytes_total', 'counter', 'Received bytes.', [('', self.bytes)])
+        add('datagrams_per_second', 'gauge',
+            'Received datagrams per second since the last scrape.',
+            [('', round(datagram_rate, 3))])
+        add('bytes_per_second', 'gauge',
+            'Received bytes per second since the last scrape.',
+            [('', round(byte_rate, 3))])
+        add('wakeups_total', 'counter', 'Wake-ups of the receiving loop.',
+            [('', self.wakeups)])
+        add('idle_wakeups_total', 'counter',
+            'Wake-ups of the receiving loop without data.',
+            [('', self.idle_wakeups)])
+        loss = statistics.get('loss', {})
+        add('lost_total', 'counter',
+            'Missing, out-of-order, duplicate and dropped datagrams and '
+            'receive errors.',
+            [(f'{{kind="{key}"}}', loss.get(key, 0))
+             for key in LOSS_COUNTERS])
+        for key, description in (('fill', 'Entries in the ring buffer.'),
+                                 ('max_fill', 'Maximal entries in the '
+                                  'ring buffer.'),
+                                 ('capacity', 'Size of the ring buffer.')):
+            add(f'queue_{key}', 'gauge', description,
+                [(f'{{stage="{name}"}}', counters[key])
+                 for name, counters in statistics['stages'].items()])
+        lines += self.latency.render(
+            f'{PREFIX}_latency_seconds',
+            'Time from receiving a datagram until it is flushed to the '
+            'file.')
+        lines += self.write_time.render(
+            f'{PREFIX}_write_seconds', 'Time spent in the write path.')
+        lines += self.display_time.render(
+            f'{PREFIX}_display_seconds',
+            'Time spent printing and in the display callback.')
+        return '\n'.join(lines) + '\n'
+
+
+class _HTTPHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Answer every GET request with the metrics.
+    """
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """
+        Send the metrics.
+        """
+        body = self.server.get_metrics().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type',
+                         'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_):  # pylint: disable=arguments-differ
+        """
+        Do not log the requests.
+        """
+
+
+class _UnixHandler(socketserver.StreamRequestHandler):
+    """
+    Send the metrics to every connecting client.
+    """
+
+    def handle(self):
+        """
+        Send the metrics.
+        """
+        self.wfile.write(self.server.get_metrics().encode('utf-8'))
+
+
+class MetricsServer():
+    """
+    This class provides the metrics on a local HTTP endpoint (for
+    Prometheus) or on a Unix stream socket (every connection gets the
+    current metrics, e. g. `socat - UNIX-CONNECT:path`).
+
+    The endpoint is served in a separate thread.
+    """
+
+    def __init__(self, get_metrics, address=METRICS_ADDRESS):
+        """
+        :param get_metrics: function returning the metrics as text
+        :param address: 'host:port' for HTTP or the path of a Unix
+                        stream socket
+        """
+        self.get_metrics = get_metrics
+        self.address = address
+        self.server = None
+        self.thread = None
+
+    def start(self):
+        """
+        Start serving the metrics.
+        """
+        host, _, port = self.address.rpartition(':')
+        if host and port.isdigit():
+            self.server = http.server.ThreadingHTTPServer(
+                (host, int(port)), _HTTPHandler)
+        else:
+            if os.path.exists(self.address) and \
+                    stat.S_ISSOCK(os.stat(self.address).st_mode):
+                # left over by a previous run
+                os.remove(self.address)
+            self.server = socketserver.ThreadingUnixStreamServer(
+                self.address, _UnixHandler)
+        self.server.daemon_threads = True
+        self.server.get_metrics = self.get_metrics
+        self.thread = Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """
+        Stop serving the metrics.
+        """
+        if self.server is None:
+            return
+        self.server.shutdown()
+        self.server.server_close()
+        if isinstance(self.server, socketserver.UnixStreamServer):
+            os.remove(self.address)
+        self.server = None
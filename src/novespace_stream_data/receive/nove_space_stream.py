@@ -24,8 +24,8 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-import csv
 import os
+import re
 import select
 import signal
 import socket
@@ -33,7 +33,33 @@ import sys
 import time
 from datetime import datetime
 from pathlib import Path
-from threading import Event, Thread
+from threading import Event, Thread, current_thread
+
+from .batch_receiver import BatchReceiver
+from .binary_capture import BinaryCaptureWriter
+from .buffered_writer import BufferedCSVWriter
+from .bus import StreamBus
+from .clock_sync import ClockSync, clock_path
+from .journal import JournalWriter, find_resumable
+from .loss_monitor import LossMonitor, stats_path
+from .metrics import MetricsServer, ReceiverMetrics
+from .parabola_index import ParabolaIndex, index_path
+from .pipeline import ConsumerStage
+from .raw_capture import RawCaptureWriter
+from .records import RecordParser
+from .rotation import RotatingWriter
+
+CSV_FIELDNAMES = (
+    'Unix - timestamp', ' Miliseconds since 00:00:00 (ms)',
+    ' Time', ' Jx (g)', ' Jy (g)', ' Jz (g)',
+    ' Temperature (°C)', ' Humidity (%)', ' Pressure (mbar)',
+    ' Parabola', ' Announcement')
+
+# seconds to wait for the receiving thread, longer than its select timeout
+JOIN_TIMEOUT = 2.0
+
+WRITERS = {'csv': BufferedCSVWriter, 'binary': BinaryCaptureWriter,
+           'journal': JournalWriter, 'raw': RawCaptureWriter}
 
 
 class NoSpaStream():
@@ -45,26 +71,135 @@ class NoSpaStream():
     This stream data was first provided during
     45. DLR parabolic flight campaign in October 2025.
     """
-    # pylint: disable=too-many-instance-attributes
+    # pylint: disable=too-many-instance-attributes,too-many-public-methods
+    # pylint: disable=too-many-statements
 
-    def __init__(self, csv_path, inputport=3131, printing=False):
+    def __init__(  # pylint: disable=too-many-arguments,too-many-locals
+            self, csv_path, inputport=3131, printing=False, *,
+            flush_rows=10, flush_interval=1.0, fsync=False,
+            queue_size=None, overflow='block',
+            batch_size=None, max_datagram_size=65535, tagged=False,
+            capture_format='csv', index=False, stats_log=False,
+            datagram_interval=None,
+            metrics=None, rotate_bytes=None, rotate_seconds=None,
+            rotate_parabola=False, compression=None,
+            commit_interval=None, resume=False, clock_log=False):
         """
         :param csv_path: path to store the data
-        :param inputport: port to listen.
+        :param inputport: port or list of ports to listen.
         :param printing: If set to True the data is not only logged, but also
                          printed on the console (stdout).
+        :param flush_rows: flush the csv file after this number of rows
+        :param flush_interval: flush the csv file after this number
+                               of seconds
+        :param fsync: If set to True, every flush of the csv file is
+                      followed by os.fsync (crash safety).
+        :param queue_size: If set, the receive thread only timestamps the
+                           datagrams and passes them via ring buffers of
+                           this size to separate threads for writing and
+                           for printing/displaying.
+        :param overflow: policy if a ring buffer is full:
+                         'block', 'drop-oldest' or 'drop-newest'
+        :param batch_size: If set, all queued datagrams (at most
+                           batch_size) are received in one wake-up and
+                           the kernel receive timestamps are used where
+                           available.
+        :param max_datagram_size: maximal size of a datagram in bytes
+        :param tagged: If listening on several ports, all data is written
+                       to one csv file with the additional column ' Port'.
+                       Otherwise a csv file per port is written.
+        :param capture_format: format of the stored data, one of WRITERS:
+                               'csv', 'binary' (typed binary capture,
+                               which can be exported to csv),
+                               'journal' (crash-safe journal, see
+                               :class:`JournalWriter`) or 'raw' (the
+                               datagrams as received without decoding,
+                               see :class:`RawCaptureWriter`)
+        :param index: If set to True, an index of the parabolas and flight
+                      phases is built while receiving and saved next to
+                      every file (see
+                      :class:`novespace_stream_data.receive.ParabolaIndex`).
+        :param stats_log: If set to True, the counters of received and
+                          lost datagrams are written every second to a
+                          stats log next to the csv file (see
+                          :class:`novespace_stream_data.receive.LossMonitor`).
+        :param datagram_interval: miliseconds between the datagrams of
+                                  the stream to count lost datagrams
+                                  (default: inferred from the stream)
+        :param metrics: If given, live metrics (rates, latency until the
+                        flush, queue depth, time in the write path) are
+                        provided on this address: 'host:port' for HTTP
+                        (Prometheus) or the path of a Unix stream socket.
+        :param rotate_bytes: If given, a new file (segment) is started
+                             after this number of bytes.
+        :param rotate_seconds: If given, a new segment is started after
+                               this number of seconds.
+        :param rotate_parabola: If set to True, a new segment is started
+                                for every parabola.
+        :param compression: If given ('gzip' or 'zstd'), closed segments
+                            are compressed in the background (see
+                            :class:`RotatingWriter`).
+        :param commit_interval: seconds between the commits (fsync) of
+                                a journal (default: flush policy)
+        :param resume: If set to True, a journal of a session which was
+                       not closed cleanly (e. g. loss of power) is
+                       recovered and continued instead of starting a
+                       new file (not with rotation).
+        :param clock_log: If set to True, the offset and the drift
+                          between the local clock and the column
+                          'miliseconds since 00:00:00' are fitted while
+                          receiving and written to a clock log next to
+                          the csv file (see :class:`ClockSync`).
         """
         self.streampath = csv_path
         self.streamport = inputport
         self.print_on_console = printing
-        self.socket_address = ('', self.streamport)
-        self.csv_fieldnames = [
-            'Unix - timestamp', ' Miliseconds since 00:00:00 (ms)',
-            ' Time', ' Jx (g)', ' Jy (g)', ' Jz (g)',
-            ' Temperature (°C)', ' Humidity (%)', ' Pressure (mbar)',
-            ' Parabola', ' Announcement']
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.batch_size = batch_size
+        self.max_datagram_size = max_datagram_size
+        self.tagged = tagged
+        if capture_format not in WRITERS:
+            raise ValueError(
+                f'unknown capture format "{capture_format}", '
+                f'use one of {tuple(WRITERS)}')
+        self.capture_format = capture_format
+        self.raw_capture = WRITERS[capture_format].raw
+        self.index = index
+        self.stats_log = stats_log
+        self.datagram_interval = datagram_interval
+        self.commit_interval = commit_interval
+        self.resume = resume
+        self.rotation = {'max_bytes': rotate_bytes,
+                         'max_seconds': rotate_seconds,
+                         'per_parabola': rotate_parabola,
+                         'compression': compression}
+        self.metrics = None
+        self.metrics_server = None
+        if metrics is not None:
+            self.metrics = ReceiverMetrics()
+            self.metrics_server = MetricsServer(self.get_metrics, metrics)
+        self.csv_fieldnames = list(CSV_FIELDNAMES)
         self.socket = None
+        self.sockets = {}
+        self.batch_receivers = {}
         self.csv_file = None
+        self.csv_files = {}
+        self.writer = None
+        self.writers = {}
+        self.stages = []
+        self.record_handlers = []
+        self.parser = None
+        self.bus = None
+        self.clock = None
+        if clock_log:
+            self.clock = ClockSync()
+            self.add_parsed_handler(self.clock.add_record)
+        self.received = 0
+        self.loss = LossMonitor()
         self.streaming_thread = None
         self.display_data_callback = None
         self.stop_event = Event()  # Event to properly stop data collection
@@ -80,25 +215,120 @@ class NoSpaStream():
         signal.signal(signal.SIGINT, self.signal_handler)
         signal.signal(signal.SIGTERM, self.signal_handler)
 
+    def get_ports(self):
+        """
+        :return: list of the ports to listen
+        """
+        if isinstance(self.streamport, int):
+            return [self.streamport]
+        return [int(port) for port in self.streamport]
+
     def connect_socket(self):
         """
-        Connect to the UDP socket.
+        Connect to the UDP sockets.
+        """
+        self.sockets = {}
+        self.batch_receivers = {}
+        for port in self.get_ports():
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self.sockets[sock] = port
+            try:
+                sock.bind(('', port))
+            except OSError:
+                # e. g. a later port is in use
+                self.close_sockets()
+                self.sockets = {}
+                self.batch_receivers = {}
+                raise
+            if self.batch_size is not None:
+                self.batch_receivers[sock] = BatchReceiver(
+                    sock, self.batch_size, self.max_datagram_size)
+            print(f"Creation of UDP-socket with port {port} sucessfull.")
+        self.socket = next(iter(self.sockets))
+
+    def close_sockets(self):
+        """
+        Close the UDP sockets.
         """
-        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        self.socket.bind(self.socket_address)
-        print(
-            f"Creation of UDP-socket with port {self.streamport} sucessfull.")
+        for sock in self.sockets:
+            sock.close()
 
     def get_status(self):
         """
         Print the current streaming status.
         """
         if self.streaming_running.is_set():
-            print(
-                "Active datastream from port "
-                f"{self.streamport} to {self.csv_file}.")
+            for port, csv_file in self.csv_files.items():
+                print(
+                    "Active datastream from port "
+                    f"{port} to {csv_file}.")
         else:
             print("No active datastream!")
+        statistics = self.get_statistics()
+        print(f"received datagrams: {statistics['received']}")
+        if 'receiver' in statistics:
+            print("receiver: " + ", ".join(
+                f"{key}: {value}"
+                for key, value in statistics['receiver'].items()))
+        print("loss: " + ", ".join(
+            f"{key}: {value}" for key, value in statistics['loss'].items()
+            if key != 'last_second'))
+        if 'last_second' in statistics['loss']:
+            print("last second: " + ", ".join(
+                f"{key}: {value}"
+                for key, value in statistics['loss']['last_second'].items()))
+        for name, counters in statistics['stages'].items():
+            print(f"stage {name}: " + ", ".join(
+                f"{key}: {value}" for key, value in counters.items()))
+        for name, counters in statistics['handlers'].items():
+            print(f"handler {name}: " + ", ".join(
+                f"{key}: {value}" for key, value in counters.items()))
+
+    def get_statistics(self):
+        """
+        :return: dictionary with the counters of the current session
+        """
+        statistics = {'received': self.received,
+                      'loss': self.loss.get_statistics(),
+                      'stages': {stage.name: stage.get_statistics()
+                                 for stage in self.stages},
+                      'handlers': {
+                          type(handler).__name__: handler.get_statistics()
+                          for handler in self.get_handlers()
+                          if hasattr(handler, 'get_statistics')}}
+        if self.batch_receivers:
+            statistics['receiver'] = {}
+            for receiver in self.batch_receivers.values():
+                for key, value in receiver.get_statistics().items():
+                    if isinstance(value, bool):
+                        statistics['receiver'][key] = (
+                            statistics['receiver'].get(key, True) and value)
+                    else:
+                        statistics['receiver'][key] = (
+                            statistics['receiver'].get(key, 0) + value)
+        return statistics
+
+    def get_metrics(self):
+        """
+        :return: metrics in the Prometheus text format
+        """
+        return self.metrics.render(self.get_statistics(),
+                                   self.streaming_running.is_set())
+
+    def find_session(self):
+        """
+        :return: path (with suffix .csv) of the session to continue
+                 or None
+        """
+        if (not self.resume) or (self.capture_format != 'journal') or \
+                any(self.rotation.values()):
+            return None
+        journal = find_resumable(self.streampath)
+        if journal is None:
+            return None
+        # the journals of several ports have the port in their name
+        return journal.with_name(
+            re.sub(r'_port\d+$', '', journal.stem) + '.csv')
 
     def start_streaming(self, create_csv_file=True):
         """
@@ -120,21 +350,62 @@ class NoSpaStream():
                     self.streampath,
                     'NoveSpa_planedata_'
                     f'{datetime.now().strftime("%Y%m%d-%Hh%Mm%Ss")}.csv')
-                self.csv_file.touch()
-            with open(self.csv_file, mode='a',
-                      newline='', encoding='utf-8') as filedescriptor:
-                csv_writer = csv.DictWriter(
-                    filedescriptor,
-                    fieldnames=self.csv_fieldnames, delimiter=';')
-                csv_writer.writeheader()
-            print(
-                "Starting datastream from port "
-                f"{self.streamport} to file: {self.csv_file}")
+                resumable = self.find_session()
+                if resumable is not None:
+                    print(f"Resuming the session of {resumable}")
+                    self.csv_file = resumable
+            if self.metrics_server is not None:
+                self.metrics = ReceiverMetrics()
+            try:
+                self.open_writers()
+            except BaseException:
+                self.close_sockets()
+                raise
+            self.received = 0
+            self.start_monitors()
+            for port, csv_file in self.csv_files.items():
+                print(
+                    "Starting datastream from port "
+                    f"{port} to file: {csv_file}")
+            if self.stats_log:
+                print(f"Writing statistics to: {self.loss.path}")
+            if self.clock is not None:
+                print(f"Writing the clock model to: {self.clock.path}")
+            if self.metrics_server is not None:
+                print("Providing metrics on: "
+                      f"{self.metrics_server.address}")
             print("To end streaming use: CTRL+C or send a TERM signal\n")
             self.streaming_thread = Thread(
                 target=self.stream_data, daemon=True)
             self.streaming_thread.start()
 
+    def start_monitors(self):
+        """
+        Start the loss monitor, the consumer stages, the clock log and the
+        metrics endpoint of a session; if this fails (e. g. the address
+        of the metrics is in use), the session is closed.
+        """
+        self.stages = []
+        try:
+            self.loss = LossMonitor(
+                stats_path(self.csv_file) if self.stats_log else None,
+                self.datagram_interval)
+            for sock in self.sockets:
+                self.loss.add_socket(sock)
+            self.start_stages()
+            if self.clock is not None:
+                self.clock.open(clock_path(self.csv_file))
+            if self.metrics_server is not None:
+                self.metrics_server.start()
+        except BaseException:
+            self.stop_stages()
+            self.loss.close()
+            self.close_writer()
+            if self.clock is not None:
+                self.clock.close()
+            self.close_sockets()
+            raise
+
     def signal_handler(self, signum, _):
         """
         signal handler to catch TERM signal
@@ -153,10 +424,25 @@ class NoSpaStream():
             print("No active data-stream to be terminated.")
         else:
             self.stop_event.set()  # Signal the thread to stop collecting data
-            self.streaming_not_running.wait(0.3)
+            # the receiving thread finishes its current wake-up (at most
+            # one select timeout); the session is closed only here
+            if (self.streaming_thread is not None) and \
+                    (self.streaming_thread is not current_thread()):
+                self.streaming_thread.join(JOIN_TIMEOUT)
+                if self.streaming_thread.is_alive():
+                    print("WARNING: the receiving thread did not end in "
+                          f"{JOIN_TIMEOUT} s")
             try:
-                self.socket.close()
-                print(f"\nEnd of streaming to {self.csv_file}")
+                self.stop_stages()
+                self.loss.close(self.get_stage_dropped())
+                self.close_writer()
+                if self.clock is not None:
+                    self.clock.close()
+                self.close_sockets()
+                if self.metrics_server is not None:
+                    self.metrics_server.stop()
+                for csv_file in sorted(set(self.csv_files.values())):
+                    print(f"\nEnd of streaming to {csv_file}")
                 print(datetime.now().strftime(
                     "Streaming ended on %Y-%m-%d at %H:%M:%S"))
                 if self.do_exit:
@@ -168,7 +454,290 @@ class NoSpaStream():
                     sys.exit(1)
             self.streaming_running.clear()
             self.streaming_not_running.set()
-        self.socket.close()
+        self.close_sockets()
+
+    def start_stages(self):
+        """
+        Start the consumer stages if a queue_size is given.
+        """
+        self.stages = []
+        if self.queue_size is None:
+            return
+        self.stages.append(ConsumerStage(
+            'writer', self.write_data, self.queue_size, self.overflow,
+            idle_handler=self.poll_writers))
+        if self.print_on_console or (self.display_data_callback is not None):
+            self.stages.append(ConsumerStage(
+                'display', self.show_data, self.queue_size, self.overflow))
+        for stage in self.stages:
+            stage.start()
+
+    def get_stage_dropped(self):
+        """
+        :return: number of datagrams dropped by the ring buffers
+        """
+        return sum(stage.ring.dropped for stage in self.stages)
+
+    def stop_stages(self):
+        """
+        Stop the consumer stages after they processed their entries.
+        """
+        for stage in self.stages:
+            stage.stop()
+
+    def open_writers(self):
+        """
+        Open the csv files of the current session.
+
+        With several ports and without `tagged` a csv file per port
+        is used (the port is appended to the name of `csv_file`).
+        """
+        ports = self.get_ports()
+        fieldnames = self.csv_fieldnames
+        writer_class = WRITERS[self.capture_format]
+        suffix = writer_class.suffix
+        if self.capture_format == 'csv':
+            suffix = Path(self.csv_file).suffix
+        if (len(ports) > 1) and (not self.tagged):
+            self.csv_files = {
+                port: Path(self.csv_file).with_name(
+                    f'{Path(self.csv_file).stem}_port{port}{suffix}')
+                for port in ports}
+        else:
+            self.csv_files = {
+                port: Path(self.csv_file).with_suffix(suffix)
+                for port in ports}
+            if len(ports) > 1:
+                fieldnames = (
+                    fieldnames[:1] + [' Port'] + fieldnames[1:])
+        writers = {}
+        kwargs = {'flush_rows': self.flush_rows,
+                  'flush_interval': self.flush_interval,
+                  'fsync': self.fsync,
+                  'latency': (None if self.metrics is None else
+                              self.metrics.latency)}
+        if self.capture_format == 'journal':
+            kwargs['commit_interval'] = self.commit_interval
+        try:
+            for csv_file in set(self.csv_files.values()):
+                if any(self.rotation.values()):
+                    writer = RotatingWriter(
+                        writer_class, csv_file, fieldnames,
+                        index=self.index, **self.rotation, **kwargs)
+                else:
+                    writer = writer_class(
+                        csv_file, fieldnames,
+                        index=(ParabolaIndex(index_path(csv_file))
+                               if self.index else None), **kwargs)
+                writer.open()
+                writers[csv_file] = writer
+        except BaseException:
+            # close the files opened so far
+            for writer in writers.values():
+                writer.close()
+            raise
+        self.writers = {port: writers[csv_file]
+                        for port, csv_file in self.csv_files.items()}
+        self.writer = self.writers[ports[0]]
+
+    def poll_writers(self):
+        """
+        Flush the csv files if their flush_interval is exceeded.
+        """
+        for writer in set(self.writers.values()):
+            writer.poll()
+
+    def close_writer(self):
+        """
+        Flush and close the csv files of the current session.
+        """
+        for writer in set(self.writers.values()):
+            writer.close()
+
+    def tag_data(self, data_str, port):
+        """
+        Prepend the port to the data if listening on several ports
+        in one csv file.
+
+        :param data_str: decoded datagram
+        :param port: port the datagram was received on
+        """
+        if (port is None) or (len(self.sockets) < 2):
+            return data_str
+        return f'{port};{data_str}'
+
+    def write_data(self, unixtime, data, port=None):
+        """
+        Save a received datagram into the csv file.
+
+        :param unixtime: local timestamp of the datagram
+        :param data: received datagram (bytes)
+        :param port: port the datagram was received on
+        """
+        if not self.raw_capture:
+            try:
+                data_str = data.decode('utf-8')
+            except UnicodeDecodeError as msg:
+                # also in the writer stage, which has no other way to
+                # count it
+                self.report_error(port, msg)
+                return
+            if self.tagged:
+                data_str = self.tag_data(data_str, port)
+        elif self.tagged and (port is not None) and (len(self.sockets) > 1):
+            data_str = b'%d;' % port + data
+        else:
+            # stored as received, without decoding
+            data_str = data
+        if self.metrics is None:
+            self.writers.get(port, self.writer).write_record(
+                unixtime, data_str)
+            return
+        start = time.perf_counter()
+        self.writers.get(port, self.writer).write_record(unixtime, data_str)
+        self.metrics.write_time.observe(time.perf_counter() - start)
+
+    def show_data(self, unixtime, data, port=None):
+        """
+        Print and/or display a received datagram.
+
+        :param unixtime: local timestamp of the datagram
+        :param data: received datagram (bytes)
+        :param port: port the datagram was received on
+        """
+        if ((self.print_on_console is not True) and
+                (self.display_data_callback is None)):
+            return
+        start = time.perf_counter()
+        data_str = self.tag_data(data.decode('utf-8', 'replace'), port)
+        data_str = f"{unixtime};{data_str}"
+        if self.print_on_console is True:
+            print(data_str)
+        if self.display_data_callback is not None:
+            self.display_data_callback(data_str)
+        if self.metrics is not None:
+            self.metrics.display_time.observe(time.perf_counter() - start)
+
+    def receive_datagrams(self, sock):
+        """
+        Receive the datagrams available on a socket.
+
+        :param sock: readable socket
+        :return: list of tuples (unixtime, data)
+        """
+        if sock in self.batch_receivers:
+            return [(unixtime, data) for unixtime, data, _ in
+                    self.batch_receivers[sock].receive()]
+        data, _ = sock.recvfrom(self.max_datagram_size)
+        return [(time.time(), data)]
+
+    def add_record_handler(self, handler):
+        """
+        Add a function called with every received record.
+
+        The handlers are called in the receiving thread before the record
+        is written, so they see every record with the least delay
+        (e. g. :class:`novespace_stream_data.receive.PhaseDetector`).
+        They have to be fast and must not block.
+
+        :param handler: function called with unixtime, data_str and port
+        """
+        self.record_handlers.append(handler)
+
+    def add_parsed_handler(self, handler, batch=False):
+        """
+        Add a function called with every received record parsed into a
+        :class:`Record`.
+
+        Every datagram is parsed only once by a :class:`RecordParser`
+        for all these handlers. They are called in the receiving thread
+        like the handlers of :meth:`add_record_handler`.
+
+        :param handler: function called with a Record
+        :param batch: If set to True, the handler is called with the
+                      records of a wake-up of the receiving loop as
+                      :class:`RecordColumns` instead.
+        """
+        if self.parser is None:
+            self.parser = RecordParser(self.batch_size or 64)
+            self.add_record_handler(self.parser)
+        if batch:
+            self.parser.add_batch_handler(handler)
+        else:
+            self.parser.add_record_handler(handler)
+
+    def subscribe(self, handler, capacity=1024, overflow='drop-oldest',
+                  name=None):
+        """
+        Add a subscriber of the received records, e. g. an experiment
+        controller or a second logger (see :class:`StreamBus`).
+
+        Every subscriber runs in its own thread with its own ring buffer,
+        so a slow subscriber does not hold up the receiving. The
+        subscribers are kept over the sessions of the receiver.
+
+        :param handler: function called with unixtime, data_str and port
+        :param capacity: capacity of the ring buffer of the subscriber
+        :param overflow: overflow policy, one of OVERFLOW_POLICIES
+        :param name: name of the subscriber
+        :return: the subscriber, see :meth:`StreamBus.unsubscribe`
+        """
+        if self.bus is None:
+            self.bus = StreamBus()
+            self.add_record_handler(self.bus)
+        return self.bus.subscribe(handler, capacity, overflow, name)
+
+    def get_handlers(self):
+        """
+        :return: list of the record handlers and of the objects of the
+                 handlers of parsed records
+        """
+        handlers = list(self.record_handlers)
+        if self.parser is not None:
+            handlers += [getattr(handler, '__self__', handler) for handler in
+                         self.parser.record_handlers +
+                         self.parser.batch_handlers]
+        return handlers
+
+    def dispatch(self, unixtime, data, port=None):
+        """
+        Pass a received datagram to the record handlers and to the
+        consumer stages or process it directly.
+
+        :param unixtime: local timestamp of the datagram
+        :param data: received datagram (bytes)
+        :param port: port the datagram was received on
+        """
+        self.received += 1
+        if self.metrics is not None:
+            self.metrics.bytes += len(data)
+        self.loss.add(data, port)
+        if self.record_handlers:
+            # the raw capture keeps datagrams which are not utf-8
+            data_str = self.tag_data(data.decode(
+                'utf-8', 'replace' if self.raw_capture else 'strict'), port)
+            for handler in self.record_handlers:
+                handler(unixtime, data_str, port)
+        if self.stages:
+            for stage in self.stages:
+                stage.put((unixtime, data, port))
+        else:
+            self.write_data(unixtime, data, port)
+            self.show_data(unixtime, data, port)
+
+    def report_error(self, port, msg):
+        """
+        Count a receive or write error and print the first one of a
+        second.
+
+        :param port: port of the error (None: error while writing)
+        :param msg: exception
+        """
+        if self.loss.add_error():
+            if port is None:
+                print(f"ERROR writing: {msg}")
+            else:
+                print(f"ERROR receiving from port {port}: {msg}")
 
     def stream_data(self):
         """
@@ -177,28 +746,39 @@ class NoSpaStream():
         print("streaming data\n")
         self.streaming_running.set()
         self.streaming_not_running.clear()
+        # wake up in time to flush (or commit) the pending records
+        timeout = min(interval for interval in (
+            0.5, self.flush_interval, self.commit_interval) if interval)
         while not self.stop_event.is_set():
-            readable, _, _ = select.select([self.socket], [], [], 0.5)
-            if readable:
-                # Recive and decode datastream
+            readable, _, _ = select.select(
+                list(self.sockets), [], [], timeout)
+            if self.metrics is not None:
+                self.metrics.wakeups += 1
+                if not readable:
+                    self.metrics.idle_wakeups += 1
+            for sock in readable:
+                # Recive and timestamp datastream
                 try:
-                    data, _ = self.socket.recvfrom(1024)
-                    data_str = data.decode('utf-8')
-                    unixtime = str(time.time())
-                    data_str = unixtime + ';' + data_str
-
-                    # Save the data into the csv file
-                    with open(self.csv_file, mode='a',
-                              newline='', encoding='utf-8') as filedescriptor:
-                        csv_writer = csv.writer(filedescriptor)
-                        csv_writer.writerow([data_str])
-                        if self.print_on_console is True:
-                            print(data_str)
-                    if self.display_data_callback is not None:
-                        self.display_data_callback(data_str)
-                except OSError:
-                    pass
-        self.streaming_running.clear()
+                    datagrams = self.receive_datagrams(sock)
+                except OSError as msg:
+                    self.report_error(self.sockets[sock], msg)
+                    continue
+                for unixtime, data in datagrams:
+                    # an invalid datagram or a write error (e. g. a full
+                    # disk) does not affect the others
+                    try:
+                        self.dispatch(unixtime, data, self.sockets[sock])
+                    except (UnicodeDecodeError, OSError) as msg:
+                        self.report_error(self.sockets[sock], msg)
+            if self.parser is not None:
+                self.parser.flush()
+            self.loss.poll(self.get_stage_dropped())
+            if (not readable) and (not self.stages):
+                try:
+                    self.poll_writers()
+                except OSError as msg:
+                    self.report_error(None, msg)
+        # the writers, stages and logs are closed by end_streaming
         print('streaming_not_running.set')
         self.streaming_not_running.set()
         print('  streaming_not_running.set.')
@@ -0,0 +1,310 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Index of the parabolas and flight phases of a file of the receiver.
+
+Copyright (C) 2026 Daniel Maier (University of Greifswald),
+                   Daniel Mohr (University of Greifswald),
+                   Thomas Villatte (Novespace)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+format
+======
+
+The index is stored as json next to the indexed file (e. g.
+`<name>.csv.index.json` or `<name>.nsb.index.json`). It contains the
+list 'segments'; a segment is a run of consecutive records with the same
+' Parabola' and ' Announcement':
+
+===============  =====================================================
+key              content
+===============  =====================================================
+parabola         parabola number
+announcement     announcement (e. g. 'STEADY FLIGHT')
+first_row        number of the first record (0 is the first data row)
+rows             number of records
+offset           byte offset of the first record in the file
+end              byte offset after the last record
+first_unixtime   local timestamp of the first record
+last_unixtime    local timestamp of the last record
+first_ms         miliseconds since 00:00:00 of the first record
+last_ms          miliseconds since 00:00:00 of the last record
+===============  =====================================================
+
+Invalid records are added to the current segment.
+"""
+
+import csv
+import json
+import os
+from pathlib import Path
+
+from .binary_capture import (
+    HEADER, RECORD, iter_binary_capture)
+from .journal import iter_journal
+from .raw_capture import (
+    RECORD_HEADER as RAW_RECORD_HEADER, iter_raw_capture)
+from .sequence import split_sequence
+
+INDEX_SUFFIX = '.index.json'
+INDEX_VERSION = 1
+
+
+def index_path(path):
+    """
+    :param path: path of a file of the receiver
+    :return: path of its index
+    """
+    return Path(f'{path}{INDEX_SUFFIX}')
+
+
+def parse_key(data_str):
+    """
+    Extract the values describing the flight phase of a datagram.
+
+    The port of the tagged layout is allowed in front of the datagram, a
+    sequence number (see :func:`add_sequence`) behind it.
+
+    :param data_str: decoded datagram (without local timestamp); a
+                     datagram as received (bytes) is decoded
+    :return: tuple (parabola, announcement, ms) or None
+    """
+    if isinstance(data_str, bytes):
+        data_str = data_str.decode('utf-8', 'replace')
+    if split_sequence(data_str) is not None:
+        data_str = data_str.rpartition(';')[0]
+    fields = data_str.rsplit(';', 9)
+    if len(fields) != 10:
+        return None
+    try:
+        return (int(fields[8]), fields[9],
+                int(fields[0].rpartition(';')[2]))
+    except ValueError:
+        return None
+
+
+class ParabolaIndex():
+    """
+    This class maps the parabolas and their flight phases (column
+    ' Announcement') to row ranges and byte offsets of a file of the
+    receiver.
+
+    The index is built while receiving (see :class:`BufferedWriter`)
+    or offline by :func:`build_index`.
+    """
+
+    def __init__(self, path=None, segments=None):
+        """
+        :param path: path to save the index
+        :param segments: list of segments (see module description)
+        """
+        self.path = path
+        self.segments = list(segments or [])
+        self.rows = sum(segment['rows'] for segment in self.segments)
+
+    def add(self, offset, end, unixtime, data_str):
+        """
+        Add the next record.
+
+        :param offset: byte offset of the record in the file
+        :param end: byte offset after the record
+        :param unixtime: local timestamp of the record
+        :param data_str: decoded datagram
+        """
+        key = parse_key(data_str)
+        if self.segments and (
+                (key is None) or
+                (key[:2] == (self.segments[-1]['parabola'],
+                             self.segments[-1]['announcement']))):
+            segment = self.segments[-1]
+            segment['rows'] += 1
+            segment['end'] = end
+            segment['last_unixtime'] = unixtime
+            if key is not None:
+                segment['last_ms'] = key[2]
+        else:
+            parabola, announcement, milliseconds = key or (-1, '', -1)
+            self.segments.append({
+                'parabola': parabola, 'announcement': announcement,
+                'first_row': self.rows, 'rows': 1,
+                'offset': offset, 'end': end,
+                'first_unixtime': unixtime, 'last_unixtime': unixtime,
+                'first_ms': milliseconds, 'last_ms': milliseconds})
+        self.rows += 1
+
+    def save(self, path=None):
+        """
+        Save the index as json.
+
+        :param path: path of the index (default: `path` of the instance)
+        """
+        path = self.path if path is None else path
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as filedescriptor:
+            json.dump({'version': INDEX_VERSION, 'rows': self.rows,
+                       'segments': self.segments},
+                      filedescriptor, indent=0)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load an index.
+
+        :param path: path of the index
+        :return: ParabolaIndex
+        """
+        with open(path, encoding='utf-8') as filedescriptor:
+            content = json.load(filedescriptor)
+        if content.get('version') != INDEX_VERSION:
+            raise ValueError(f'{path} has an unknown version')
+        return cls(path, content['segments'])
+
+    def find(self, parabola, announcement=None):
+        """
+        :param parabola: parabola number
+        :param announcement: If given, only segments of this flight phase
+                             are returned.
+        :return: list of the matching segments
+        """
+        return [segment for segment in self.segments
+                if (segment['parabola'] == parabola) and
+                ((announcement is None) or
+                 (segment['announcement'] == announcement))]
+
+    def phases(self):
+        """
+        :return: dictionary parabola -> list of its segments
+        """
+        parabolas = {}
+        for segment in self.segments:
+            parabolas.setdefault(segment['parabola'], []).append(segment)
+        return parabolas
+
+
+def _iter_csv(path):
+    """
+    :return: iterator over tuples (offset, end, unixtime, data_str)
+             of the data rows of a csv file of the receiver
+    """
+    with open(path, 'rb') as filedescriptor:
+        end = len(filedescriptor.readline())
+        for line in filedescriptor:
+            offset, end = end, end + len(line)
+            text = line.decode('utf-8').rstrip('\r\n')
+            if text.startswith('"'):
+                text = list(csv.reader([text]))[0][0]
+            unixtime, _, data_str = text.partition(';')
+            try:
+                unixtime = float(unixtime)
+            except ValueError:
+                unixtime = None
+            yield offset, end, unixtime, data_str
+
+
+def _iter_raw(path, start=None):
+    """
+    :return: iterator over tuples (offset, end, unixtime, datagram
+             (bytes)) of the records of a raw capture
+    """
+    offset = start
+    for unixtime, data, end in iter_raw_capture(path, start):
+        if offset is None:
+            offset = end - RAW_RECORD_HEADER.size - len(data)
+        yield offset, end, unixtime, data
+        offset = end
+
+
+def build_index(path):
+    """
+    Build the index of a csv file, a binary capture (`*.nsb`), a journal
+    (`*.nsj`) or a raw capture (`*.nsr`) of the receiver.
+
+    :param path: path of the file
+    :return: ParabolaIndex (not yet saved)
+    """
+    index = ParabolaIndex(index_path(path))
+    suffix = Path(path).suffix
+    if suffix == '.nsb':
+        offset = HEADER.size
+        for unixtime, data_str in iter_binary_capture(path):
+            index.add(offset, offset + RECORD.size, unixtime, data_str)
+            offset += RECORD.size
+        return index
+    records = {'.nsj': iter_journal, '.nsr': _iter_raw}.get(
+        suffix, _iter_csv)(path)
+    for offset, end, unixtime, data_str in records:
+        index.add(offset, end, unixtime, data_str)
+    return index
+
+
+def get_index(path, rebuild=False):
+    """
+    Load the index of a file of the receiver; if it does not exist or is
+    older than the file, it is built and saved.
+
+    :param path: path of the file
+    :param rebuild: If set to True, the index is always built.
+    :return: ParabolaIndex
+    """
+    path_of_index = index_path(path)
+    if ((not rebuild) and path_of_index.exists() and
+            (os.path.getmtime(path_of_index) >= os.path.getmtime(path))):
+        return ParabolaIndex.load(path_of_index)
+    index = build_index(path)
+    index.save()
+    return index
+
+
+def read_segments(path, segments):
+    """
+    Read the records of the given segments without parsing the
+    rest of the file.
+
+    :param path: path of the csv file, the binary capture, the journal
+                 or the raw capture
+    :param segments: segments of its index
+    :return: iterator over tuples (unixtime, data_str); datagrams of a
+             raw capture which are not utf-8 are decoded with
+             replacement characters
+    """
+    suffix = Path(path).suffix
+    if suffix == '.nsb':
+        for segment in segments:
+            yield from iter_binary_capture(
+                path, segment['first_row'],
+                segment['first_row'] + segment['rows'])
+        return
+    if suffix in ('.nsj', '.nsr'):
+        records = iter_journal if suffix == '.nsj' else _iter_raw
+        for segment in segments:
+            for offset, _, unixtime, data_str in records(
+                    path, segment['offset']):
+                if offset >= segment['end']:
+                    break
+                if isinstance(data_str, bytes):
+                    data_str = data_str.decode('utf-8', 'replace')
+                yield unixtime, data_str
+        return
+    with open(path, 'rb') as filedescriptor:
+        for segment in segments:
+            filedescriptor.seek(segment['offset'])
+            content = filedescriptor.read(
+                segment['end'] - segment['offset']).decode('utf-8')
+            for row in csv.reader(content.splitlines()):
+                unixtime, _, data_str = row[0].partition(';')
+                yield float(unixtime), data_str
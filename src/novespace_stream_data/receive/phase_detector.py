@@ -0,0 +1,310 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Streaming detector of the flight phases from the measured g-levels.
+
+Copyright (C) 2026 Daniel Maier (University of Greifswald),
+                   Daniel Mohr (University of Greifswald),
+                   Thomas Villatte (Novespace)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import math
+import socket
+import time
+
+from .sequence import split_sequence
+
+PHASES = ('STEADY FLIGHT', 'PULL UP', 'INJECTION', '0G', 'PULL OUT')
+
+THRESHOLDS = {'high_enter': 1.5, 'high_leave': 1.3,
+              'zero_enter': 0.1, 'zero_leave': 0.3}
+
+
+class RollingStatistics():
+    """
+    This class computes mean and standard deviation of the last `window`
+    values with O(1) operations per value.
+    """
+
+    def __init__(self, window):
+        """
+        :param window: number of values
+        """
+        self.values = [0.0] * window
+        self.index = 0
+        self.count = 0
+        self.sum = 0.0
+        self.sum_squares = 0.0
+
+    def add(self, value):
+        """
+        Add a value; the oldest value leaves the window.
+
+        :param value: new value
+        """
+        if self.count == len(self.values):
+            old = self.values[self.index]
+            self.sum -= old
+            self.sum_squares -= old * old
+        else:
+            self.count += 1
+        self.values[self.index] = value
+        self.sum += value
+        self.sum_squares += value * value
+        self.index += 1
+        if self.index == len(self.values):
+            self.index = 0
+            # remove accumulated rounding errors once per window
+            self.sum = math.fsum(self.values[:self.count])
+            self.sum_squares = math.fsum(
+                value * value for value in self.values[:self.count])
+
+    def mean(self):
+        """
+        :return: mean of the values in the window
+        """
+        return self.sum / self.count if self.count else math.nan
+
+    def std(self):
+        """
+        :return: standard deviation of the values in the window
+        """
+        if not self.count:
+            return math.nan
+        mean = self.sum / self.count
+        return math.sqrt(max(0.0, self.sum_squares / self.count - mean * mean))
+
+
+def parse_int(text):
+    """
+    :param text: integer column of a datagram
+    :return: its value or -1 if it is invalid (as in read_log)
+    """
+    try:
+        return int(text)
+    except ValueError:
+        return -1
+
+
+def open_event_socket(address):
+    """
+    Create a non-blocking socket to send the events.
+
+    :param address: 'host:port' for UDP or the path of a Unix
+                    datagram socket
+    :return: tuple (socket, destination)
+    """
+    host, _, port = address.rpartition(':')
+    if host and port.isdigit():
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        destination = (host, int(port))
+    else:
+        sock = socket.socket(socket.AF_UNIX,  # pylint: disable=no-member
+                             socket.SOCK_DGRAM)
+        destination = address
+    sock.setblocking(False)
+    return sock, destination
+
+
+class PhaseDetector():
+    """
+    This class detects the flight phases of a parabola ('PULL UP',
+    'INJECTION', '0G', 'PULL OUT', 'STEADY FLIGHT') from the measured
+    ' Jx (g)', ' Jy (g)' and ' Jz (g)' without waiting for the
+    announcement.
+
+    The magnitude of the acceleration is averaged over the last `window`
+    samples. A phase is entered if the mean crosses the threshold to enter
+    and left only if it crosses the threshold to leave (hysteresis):
+
+    ==============  ====================================================
+    phase           transition
+    ==============  ====================================================
+    STEADY FLIGHT   mean > high_enter: PULL UP
+    PULL UP         mean < high_leave: INJECTION
+    INJECTION       mean < zero_enter: 0G; mean > high_enter: PULL UP
+    0G              mean > zero_leave: PULL OUT
+    PULL OUT        mean < high_leave after mean > high_enter:
+                    STEADY FLIGHT
+    ==============  ====================================================
+
+    Every transition is an event: a dictionary with the keys 'phase',
+    'previous', 'unixtime', 'ms', 'parabola', 'mean', 'std' and
+    'latency' (seconds from the local timestamp of the sample to the
+    detection); 'ms' and 'parabola' are integers (-1 if invalid).
+    Events are passed to `callback` and, if `address` is given, sent as
+    datagram `unixtime;ms;phase;mean;std` to a local UDP or Unix
+    datagram socket without blocking.
+
+    An instance is called with every record; it can be given to
+    :meth:`NoSpaStream.add_record_handler` or used as `record_callback`
+    of :class:`AsyncNoSpaStream`.
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, window=3, callback=None, address=None,
+                 thresholds=None):
+        """
+        :param window: number of samples for the rolling statistics
+        :param callback: function called with every event
+        :param address: If given, the events are sent to this address:
+                        'host:port' (UDP) or the path of a Unix
+                        datagram socket.
+        :param thresholds: dictionary to change the thresholds (g) of
+                           THRESHOLDS
+        """
+        self.statistics = RollingStatistics(window)
+        self.callback = callback
+        self.thresholds = dict(THRESHOLDS)
+        self.thresholds.update(thresholds or {})
+        self.sock = None
+        self.destination = None
+        if address is not None:
+            self.sock, self.destination = open_event_socket(address)
+        self.phase = 'STEADY FLIGHT'
+        self.high_reached = False
+        self.samples = 0
+        self.events = 0
+        self.invalid = 0
+        self.send_errors = 0
+        self.max_latency = 0.0
+
+    def __call__(self, unixtime, data_str, port=None):
+        """
+        Process a record.
+
+        :param unixtime: local timestamp of the record
+        :param data_str: decoded datagram (the port of the tagged layout
+                         may be in front, a sequence number behind)
+        :param port: port the datagram was received on (not used)
+        :return: event or None
+        """
+        if split_sequence(data_str) is not None:
+            data_str = data_str.rpartition(';')[0]
+        fields = data_str.rsplit(';', 9)
+        try:
+            magnitude = math.sqrt(float(fields[2]) ** 2 +
+                                  float(fields[3]) ** 2 +
+                                  float(fields[4]) ** 2)
+        except (ValueError, IndexError):
+            self.invalid += 1
+            return None
+        return self.process(
+            unixtime, magnitude, parse_int(fields[0].rpartition(';')[2]),
+            parse_int(fields[8]) if len(fields) == 10 else -1)
+
+    def add_record(self, record):
+        """
+        Process a typed record, e. g. from
+        :meth:`NoSpaStream.add_parsed_handler`.
+
+        :param record: :class:`novespace_stream_data.receive.Record`
+        :return: event or None
+        """
+        return self.process(
+            record.unixtime,
+            math.sqrt(record.jx ** 2 + record.jy ** 2 + record.jz ** 2),
+            record.ms, record.parabola)
+
+    def process(self, unixtime, magnitude, ms, parabola):
+        """
+        Process the magnitude of the acceleration of a sample.
+
+        :param unixtime: local timestamp of the sample
+        :param magnitude: magnitude of the acceleration (g)
+        :param ms: column ' Miliseconds since 00:00:00 (ms)' (int)
+        :param parabola: column ' Parabola' (int)
+        :return: event or None
+        """
+        self.samples += 1
+        self.statistics.add(magnitude)
+        phase = self.next_phase(self.statistics.mean())
+        if phase == self.phase:
+            return None
+        event = {'phase': phase, 'previous': self.phase,
+                 'unixtime': unixtime, 'ms': ms, 'parabola': parabola,
+                 'mean': self.statistics.mean(),
+                 'std': self.statistics.std(),
+                 'latency': time.time() - unixtime}
+        self.phase = phase
+        self.emit(event)
+        return event
+
+    def next_phase(self, mean):
+        """
+        :param mean: current mean of the magnitude of the acceleration
+        :return: phase after this sample
+        """
+        thresholds = self.thresholds
+        phase = self.phase
+        if phase == 'STEADY FLIGHT':
+            if mean > thresholds['high_enter']:
+                phase = 'PULL UP'
+        elif phase == 'PULL UP':
+            if mean < thresholds['high_leave']:
+                phase = 'INJECTION'
+        elif phase == 'INJECTION':
+            if mean < thresholds['zero_enter']:
+                phase = '0G'
+            elif mean > thresholds['high_enter']:
+                phase = 'PULL UP'
+        elif phase == '0G':
+            if mean > thresholds['zero_leave']:
+                phase = 'PULL OUT'
+                self.high_reached = False
+        elif phase == 'PULL OUT':
+            if mean > thresholds['high_enter']:
+                self.high_reached = True
+            elif self.high_reached and (mean < thresholds['high_leave']):
+                phase = 'STEADY FLIGHT'
+        return phase
+
+    def emit(self, event):
+        """
+        Pass an event to the callback and the socket.
+
+        :param event: dictionary describing the event
+        """
+        self.events += 1
+        self.max_latency = max(self.max_latency, event['latency'])
+        if self.sock is not None:
+            try:
+                self.sock.sendto(
+                    (f"{event['unixtime']};{event['ms']};{event['phase']};"
+                     f"{event['mean']:.4f};{event['std']:.4f}").encode(),
+                    self.destination)
+            except OSError:
+                self.send_errors += 1
+        if self.callback is not None:
+            self.callback(event)
+
+    def get_statistics(self):
+        """
+        :return: dictionary with the counters of the detector
+        """
+        return {'samples': self.samples, 'events': self.events,
+                'invalid': self.invalid, 'send_errors': self.send_errors,
+                'max_latency': self.max_latency}
+
+    def close(self):
+        """
+        Close the socket for the events.
+        """
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
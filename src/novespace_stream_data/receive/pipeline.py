@@ -0,0 +1,223 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Bounded ring buffer and consumer stages to decouple the socket receive
+loop from disk I/O, console output and the display.
+
+Copyright (C) 2026 Daniel Maier (University of Greifswald),
+                   Daniel Mohr (University of Greifswald),
+                   Thomas Villatte (Novespace)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from threading import Condition, Lock, Thread
+
+OVERFLOW_POLICIES = ('block', 'drop-oldest', 'drop-newest')
+
+
+class RingBuffer():
+    """
+    This class provides a preallocated, bounded FIFO for one producer and
+    one consumer thread.
+
+    If the buffer is full, `overflow` decides what happens:
+
+    * 'block': the producer waits until there is space again
+    * 'drop-oldest': the oldest entry is overwritten
+    * 'drop-newest': the new entry is discarded
+
+    Every discarded entry is counted in `dropped`.
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, capacity=1024, overflow='block'):
+        """
+        :param capacity: maximal number of entries
+        :param overflow: overflow policy, one of OVERFLOW_POLICIES
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f'unknown overflow policy "{overflow}", '
+                f'use one of {OVERFLOW_POLICIES}')
+        if capacity < 1:
+            raise ValueError('capacity of the ring buffer has to be >= 1')
+        self.capacity = capacity
+        self.overflow = overflow
+        self.slots = [None] * capacity
+        self.head = 0  # index of the oldest entry
+        self.size = 0
+        self.dropped = 0
+        self.max_fill = 0
+        self.closed = False
+        self.lock = Lock()
+        self.not_empty = Condition(self.lock)
+        self.not_full = Condition(self.lock)
+
+    def __len__(self):
+        return self.size
+
+    def put(self, item, timeout=None):
+        """
+        Append an entry.
+
+        :param item: entry to append
+        :param timeout: maximal time to wait in the 'block' policy
+        :return: True if the entry was stored
+        """
+        with self.lock:
+            if self.closed:
+                return False
+            if self.size == self.capacity:
+                if self.overflow == 'drop-newest':
+                    self.dropped += 1
+                    return False
+                if self.overflow == 'drop-oldest':
+                    self.slots[self.head] = None
+                    self.head = (self.head + 1) % self.capacity
+                    self.size -= 1
+                    self.dropped += 1
+                elif not self.not_full.wait_for(
+                        lambda: self.closed or self.size < self.capacity,
+                        timeout):
+                    self.dropped += 1
+                    return False
+                elif self.closed:
+                    return False
+            self.slots[(self.head + self.size) % self.capacity] = item
+            self.size += 1
+            self.max_fill = max(self.max_fill, self.size)
+            self.not_empty.notify()
+        return True
+
+    def get_many(self, max_items=64, timeout=None):
+        """
+        Remove and return the oldest entries.
+
+        :param max_items: maximal number of entries to return
+        :param timeout: maximal time to wait for an entry
+        :return: list of entries (empty on timeout) or None if the
+                 buffer is closed and empty
+        """
+        with self.lock:
+            if not self.not_empty.wait_for(
+                    lambda: self.closed or self.size, timeout):
+                return []
+            if self.size == 0:
+                return None
+            items = []
+            for _ in range(min(max_items, self.size)):
+                items.append(self.slots[self.head])
+                self.slots[self.head] = None
+                self.head = (self.head + 1) % self.capacity
+            self.size -= len(items)
+            self.not_full.notify_all()
+        return items
+
+    def close(self):
+        """
+        Close the buffer; remaining entries can still be read.
+        """
+        with self.lock:
+            self.closed = True
+            self.not_empty.notify_all()
+            self.not_full.notify_all()
+
+
+class ConsumerStage():
+    """
+    This class runs a handler for every entry of its own ring buffer
+    in a separate thread.
+
+    The entries are tuples, which are passed as arguments to `handler`.
+    If no entry arrives within `idle_interval` seconds, `idle_handler`
+    is called (e. g. to flush a file).
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, name, handler, capacity=1024, overflow='block', *,
+                 idle_handler=None, idle_interval=0.5):
+        """
+        :param name: name of the stage (and of the thread)
+        :param handler: function called for every entry
+        :param capacity: capacity of the ring buffer
+        :param overflow: overflow policy of the ring buffer
+        :param idle_handler: function called if no entry arrives
+        :param idle_interval: seconds without entry to call idle_handler
+        """
+        self.name = name
+        self.handler = handler
+        self.idle_handler = idle_handler
+        self.idle_interval = idle_interval
+        self.ring = RingBuffer(capacity, overflow)
+        self.processed = 0
+        self.errors = 0
+        self.thread = Thread(target=self.run, name=name, daemon=True)
+
+    def start(self):
+        """
+        Start the thread of the stage.
+        """
+        self.thread.start()
+
+    def put(self, item):
+        """
+        Pass an entry to the stage.
+
+        :return: True if the entry was accepted
+        """
+        return self.ring.put(item)
+
+    def run(self):
+        """
+        Process the entries until the stage is stopped.
+        """
+        while True:
+            items = self.ring.get_many(timeout=self.idle_interval)
+            if items is None:
+                break
+            if not items:
+                if self.idle_handler is not None:
+                    self.idle_handler()
+                continue
+            for item in items:
+                try:
+                    self.handler(*item)
+                except Exception as msg:  # pylint: disable = W0718
+                    self.errors += 1
+                    print(f"Error in stage {self.name}: {msg}")
+            self.processed += len(items)
+
+    def stop(self, timeout=2.0):
+        """
+        Stop the stage after all buffered entries are processed.
+
+        :param timeout: maximal time to wait for the thread
+        """
+        self.ring.close()
+        if self.thread.is_alive():
+            self.thread.join(timeout)
+
+    def get_statistics(self):
+        """
+        :return: dictionary with the counters of the stage
+        """
+        return {'processed': self.processed,
+                'dropped': self.ring.dropped,
+                'errors': self.errors,
+                'fill': len(self.ring),
+                'max_fill': self.ring.max_fill,
+                'capacity': self.ring.capacity}
@@ -0,0 +1,230 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Raw capture of the received datagrams without parsing.
+
+Copyright (C) 2026 Daniel Maier (University of Greifswald),
+                   Daniel Mohr (University of Greifswald),
+                   Thomas Villatte (Novespace)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+format
+======
+
+`<name>.nsr` starts with a header (magic `NSPARAW1`, uint32 version,
+uint32 length of the field names) followed by the field names of the
+csv file (utf-8, separated by ';'). Then records follow (little
+endian):
+
+=============  =======  ==============================================
+field          type     content
+=============  =======  ==============================================
+unixtime       float64  local timestamp
+length         uint32   length of the datagram in bytes
+datagram       bytes    datagram as received (with the port in front
+                        in the tagged layout)
+=============  =======  ==============================================
+
+A torn record at the end of the file (e. g. after a loss of power) is
+removed when the capture is opened for appending.
+"""
+
+import csv
+import os
+import struct
+
+from .buffered_writer import BufferedWriter
+
+MAGIC = b'NSPARAW1'
+VERSION = 1
+HEADER = struct.Struct('<8sII')
+RECORD_HEADER = struct.Struct('<dI')
+
+
+def read_raw_header(filedescriptor):
+    """
+    Read the header of a raw capture.
+
+    :param filedescriptor: capture opened for binary reading at offset 0
+    :return: tuple (list of field names, size of the header in bytes)
+    """
+    magic, version, length = HEADER.unpack(filedescriptor.read(HEADER.size))
+    if (magic != MAGIC) or (version != VERSION):
+        raise ValueError(f'{filedescriptor.name} is not a raw capture')
+    fieldnames = filedescriptor.read(length).decode('utf-8').split(';')
+    return fieldnames, HEADER.size + length
+
+
+def iter_raw_capture(path, start=None):
+    """
+    Read a raw capture record by record up to the first torn record.
+
+    :param path: path of the capture
+    :param start: byte offset of the first record (default: after the
+                  header)
+    :return: iterator over tuples (unixtime, datagram (bytes), end of the
+             record in bytes)
+    """
+    with open(path, 'rb') as filedescriptor:
+        _, offset = read_raw_header(filedescriptor)
+        if start is not None:
+            offset = start
+            filedescriptor.seek(offset)
+        while True:
+            head = filedescriptor.read(RECORD_HEADER.size)
+            if len(head) < RECORD_HEADER.size:
+                return
+            unixtime, length = RECORD_HEADER.unpack(head)
+            data = filedescriptor.read(length)
+            if len(data) < length:
+                return
+            offset += RECORD_HEADER.size + length
+            yield unixtime, data, offset
+
+
+def recover_raw_capture(path):
+    """
+    Remove a torn header or record at the end of a raw capture.
+
+    :param path: path of the capture
+    :return: size of the valid capture in bytes (0 for a new capture)
+    """
+    if not os.path.exists(path):
+        return 0
+    try:
+        with open(path, 'rb') as filedescriptor:
+            _, size = read_raw_header(filedescriptor)
+    except struct.error:
+        size = None
+    if (size is None) or (size > os.path.getsize(path)):
+        os.truncate(path, 0)
+        return 0
+    for _, _, size in iter_raw_capture(path):
+        pass
+    if size < os.path.getsize(path):
+        os.truncate(path, size)
+    return size
+
+
+def export_raw_capture(path, csv_path):
+    """
+    Export a raw capture to the csv format of the receiver.
+
+    Datagrams which are not utf-8 are exported with replacement
+    characters.
+
+    :param path: path of the capture
+    :param csv_path: path of the csv file to create
+    :return: number of exported rows
+    """
+    with open(path, 'rb') as filedescriptor:
+        fieldnames, _ = read_raw_header(filedescriptor)
+    rows = 0
+    with open(csv_path, mode='w', newline='',
+              encoding='utf-8') as filedescriptor:
+        csv.DictWriter(filedescriptor, fieldnames=fieldnames,
+                       delimiter=';').writeheader()
+        csv_writer = csv.writer(filedescriptor)
+        for unixtime, data, _ in iter_raw_capture(path):
+            # invalid utf-8 is replaced, as when printing the datagrams
+            csv_writer.writerow(
+                [f'{unixtime};{data.decode("utf-8", "replace")}'])
+            rows += 1
+    return rows
+
+
+class RawCaptureWriter(BufferedWriter):
+    """
+    This class stores the received datagrams verbatim (see
+    :mod:`novespace_stream_data.receive.raw_capture`) with the flush
+    policy of :class:`BufferedWriter`.
+
+    The records are given as bytes and packed with the timestamp into a
+    preallocated buffer, which is written to the file without a copy on
+    a flush. Nothing is decoded, formatted or quoted, so this is the
+    cheapest write path of the receiver.
+    """
+
+    suffix = '.nsr'
+    raw = True
+
+    def __init__(self, path, fieldnames, **kwargs):
+        """
+        :param path: path of the capture
+        :param fieldnames: names of the columns (stored for the export)
+        :param kwargs: flush policy, see :class:`BufferedWriter`
+        """
+        super().__init__(path, fieldnames, **kwargs)
+        self.buffer = bytearray(self.buffer_size)
+        self.view = memoryview(self.buffer)
+        self.position = 0
+        self.filedescriptor = None
+
+    def _open(self, write_header):
+        size = recover_raw_capture(self.path)
+        # pylint: disable=consider-using-with
+        self.filedescriptor = open(self.path, 'ab', buffering=0)
+        self.position = 0
+        if size == 0:
+            names = ';'.join(self.fieldnames).encode('utf-8')
+            self._write_all(HEADER.pack(MAGIC, VERSION, len(names)) + names)
+            size = HEADER.size + len(names)
+        self.offset = size
+
+    def _write(self, unixtime, data_str):
+        """
+        Pack one record into the buffer; the lock is held.
+
+        :param unixtime: local timestamp of the datagram
+        :param data_str: datagram as received (bytes)
+        """
+        size = RECORD_HEADER.size + len(data_str)
+        if self.position + size > len(self.buffer):
+            self._write_buffer()
+        if size > len(self.buffer):
+            self._write_all(
+                RECORD_HEADER.pack(unixtime, len(data_str)) + data_str)
+        else:
+            RECORD_HEADER.pack_into(self.buffer, self.position, unixtime,
+                                    len(data_str))
+            self.buffer[self.position + RECORD_HEADER.size:
+                        self.position + size] = data_str
+            self.position += size
+        self.offset += size
+
+    def _write_all(self, data):
+        """
+        Write data to the unbuffered file; the lock is held.
+        """
+        view = memoryview(data)
+        while view:
+            view = view[self.filedescriptor.write(view):]
+
+    def _write_buffer(self):
+        """
+        Write the buffer to the file; the lock is held.
+        """
+        if self.position:
+            self._write_all(self.view[:self.position])
+            self.position = 0
+
+    def _flush(self):
+        self._write_buffer()
+        super()._flush()
+
+    def _files(self):
+        return [self.filedescriptor]
@@ -0,0 +1,239 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Typed records of the received datagrams.
+
+Copyright (C) 2026 Daniel Maier (University of Greifswald),
+                   Daniel Mohr (University of Greifswald),
+                   Thomas Villatte (Novespace)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+The fields of a record correspond to the columns of the csv file:
+
+=============  =======  ==============================================
+field          type     column
+=============  =======  ==============================================
+unixtime       float    'Unix - timestamp'
+port           int      ' Port' (port the datagram was received on)
+ms             int      ' Miliseconds since 00:00:00 (ms)'
+time           float    ' Time' (mm:ss.f) in seconds
+jx, jy, jz     float    ' Jx (g)', ' Jy (g)', ' Jz (g)'
+temperature    float    ' Temperature (°C)'
+humidity       float    ' Humidity (%)'
+pressure       float    ' Pressure (mbar)'
+parabola       int      ' Parabola'
+announcement   str      ' Announcement' (interned)
+=============  =======  ==============================================
+"""
+
+import sys
+from array import array
+
+from .binary_capture import parse_datagram
+from .sequence import split_sequence
+
+RECORD_FIELDS = ('unixtime', 'port', 'ms', 'time', 'jx', 'jy', 'jz',
+                 'temperature', 'humidity', 'pressure', 'parabola',
+                 'announcement')
+# typecodes of the columns of RecordColumns
+COLUMN_TYPES = {'unixtime': 'd', 'port': 'q', 'ms': 'q', 'time': 'd',
+                'jx': 'd', 'jy': 'd', 'jz': 'd', 'temperature': 'd',
+                'humidity': 'd', 'pressure': 'd', 'parabola': 'q'}
+
+
+class Record():
+    """
+    This class is one parsed datagram. It has no instance dictionary,
+    so a buffered record needs little memory.
+    """
+    # pylint: disable=too-many-instance-attributes,too-few-public-methods
+
+    __slots__ = RECORD_FIELDS
+
+    def __init__(self, unixtime, port, values):
+        """
+        :param unixtime: local timestamp of the datagram
+        :param port: port the datagram was received on or None
+        :param values: tuple (ms, time, jx, jy, jz, temperature,
+                       humidity, pressure, parabola, announcement)
+        """
+        self.unixtime = unixtime
+        self.port = port
+        (self.ms, self.time, self.jx, self.jy, self.jz, self.temperature,
+         self.humidity, self.pressure, self.parabola,
+         self.announcement) = values
+
+    def __repr__(self):
+        return 'Record(' + ', '.join(
+            f'{name}={getattr(self, name)!r}' for name in RECORD_FIELDS) + ')'
+
+
+def parse_record(unixtime, data_str, port=None):
+    """
+    Parse a datagram into a typed record.
+
+    The port of the tagged layout and a sequence number (see
+    :func:`add_sequence`) are allowed; the announcement is interned.
+
+    :param unixtime: local timestamp of the datagram
+    :param data_str: decoded datagram
+    :param port: port the datagram was received on
+    :return: Record or None if the datagram cannot be parsed
+    """
+    if split_sequence(data_str) is not None:
+        data_str = data_str.rpartition(';')[0]
+    fields = data_str.rsplit(';', 9)
+    if len(fields) == 10:
+        fields[0] = fields[0].rpartition(';')[2]
+    values = parse_datagram(';'.join(fields))
+    if values is None:
+        return None
+    return Record(unixtime, port, values[:9] + (sys.intern(values[9]),))
+
+
+class RecordColumns():
+    """
+    This class stores records as rows of preallocated columns (struct of
+    arrays): every numeric field is an :class:`array.array`, the
+    announcements are a list of interned strings.
+
+    It is used to pass batches of records without an object per record.
+    """
+
+    def __init__(self, capacity=64):
+        """
+        :param capacity: maximal number of rows
+        """
+        self.capacity = capacity
+        self.columns = {name: array(typecode, bytes(
+            array(typecode).itemsize * capacity))
+                        for name, typecode in COLUMN_TYPES.items()}
+        self.announcements = [''] * capacity
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def append(self, record):
+        """
+        Store a record in the next row.
+
+        :param record: Record
+        :return: True if the columns are full afterwards
+        """
+        row = self.size
+        for name, column in self.columns.items():
+            value = getattr(record, name)
+            column[row] = -1 if value is None else value
+        self.announcements[row] = record.announcement
+        self.size += 1
+        return self.size == self.capacity
+
+    def column(self, name):
+        """
+        :param name: name of a field (see RECORD_FIELDS)
+        :return: memoryview of the values of the stored rows or list of
+                 the announcements
+        """
+        if name == 'announcement':
+            return self.announcements[:self.size]
+        return memoryview(self.columns[name])[:self.size]
+
+    def clear(self):
+        """
+        Remove all rows (the memory is kept).
+        """
+        self.size = 0
+
+
+class RecordParser():
+    """
+    This class parses every received datagram once into a
+    :class:`Record` and passes it to the handlers of typed records,
+    so they do not split the datagram again.
+
+    Handlers of batches get a :class:`RecordColumns` with up to
+    `batch_size` records when it is full and when :meth:`flush` is
+    called (e. g. after every wake-up of the receiving loop); the
+    columns are reused afterwards, so a batch handler has to copy what
+    it keeps.
+
+    An instance is called with every record; it can be given to
+    :meth:`NoSpaStream.add_record_handler`.
+    """
+
+    def __init__(self, batch_size=64):
+        """
+        :param batch_size: maximal number of records of a batch
+        """
+        self.record_handlers = []
+        self.batch_handlers = []
+        self.batch = RecordColumns(batch_size)
+        self.parsed = 0
+        self.invalid = 0
+        self.batches = 0
+
+    def add_record_handler(self, handler):
+        """
+        :param handler: function called with every Record
+        """
+        self.record_handlers.append(handler)
+
+    def add_batch_handler(self, handler):
+        """
+        :param handler: function called with RecordColumns
+        """
+        self.batch_handlers.append(handler)
+
+    def __call__(self, unixtime, data_str, port=None):
+        """
+        Parse a record and pass it to the handlers.
+
+        :param unixtime: local timestamp of the record
+        :param data_str: decoded datagram (the port of the tagged layout
+                         may be in front)
+        :param port: port the datagram was received on
+        :return: Record or None
+        """
+        record = parse_record(unixtime, data_str, port)
+        if record is None:
+            self.invalid += 1
+            return None
+        self.parsed += 1
+        for handler in self.record_handlers:
+            handler(record)
+        if self.batch_handlers and self.batch.append(record):
+            self.flush()
+        return record
+
+    def flush(self):
+        """
+        Pass the pending batch to the batch handlers.
+        """
+        if not self.batch.size:
+            return
+        self.batches += 1
+        for handler in self.batch_handlers:
+            handler(self.batch)
+        self.batch.clear()
+
+    def get_statistics(self):
+        """
+        :return: dictionary with the counters of the parser
+        """
+        return {'parsed': self.parsed, 'invalid': self.invalid,
+                'batches': self.batches}
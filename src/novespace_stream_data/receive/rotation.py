@@ -0,0 +1,419 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Rotation of the files of the receiver into segments, background
+compression and a manifest of the segments.
+
+Copyright (C) 2026 Daniel Maier (University of Greifswald),
+                   Daniel Mohr (University of Greifswald),
+                   Thomas Villatte (Novespace)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+manifest
+========
+
+The manifest is stored as json next to the segments
+(`<name>.manifest.json`). It contains the list 'segments'; every
+segment has the keys:
+
+================  =====================================================
+key               content
+================  =====================================================
+name              file name of the segment
+compressed        file name of the compressed segment or null
+compressed_files  file names of all compressed files of the segment
+                  (e. g. also the strings of a binary capture) or null
+first_unixtime    local timestamp of the first record or null
+last_unixtime     local timestamp of the last record or null
+rows              number of records
+bytes             size of the uncompressed segment
+parabolas         first and last parabola number or null
+closed            True if the segment is complete
+================  =====================================================
+
+An index of a segment (see
+:class:`novespace_stream_data.receive.ParabolaIndex`) refers to the
+uncompressed segment.
+"""
+
+import gzip
+import json
+import os
+import queue
+import shutil
+from pathlib import Path
+from threading import Lock, Thread
+
+from .parabola_index import ParabolaIndex, index_path, parse_key
+
+MANIFEST_SUFFIX = '.manifest.json'
+
+COMPRESSIONS = {'gzip': '.gz', 'zstd': '.zst'}
+
+
+def manifest_path(path):
+    """
+    :param path: path of the (first) file of a session of the receiver
+    :return: path of the manifest of its segments
+    """
+    return Path(path).with_suffix(MANIFEST_SUFFIX)
+
+
+def open_compressed(path, compression):
+    """
+    Open a file for writing compressed data.
+
+    zstd needs python 3.14 (compression.zstd) or the package zstandard.
+
+    :param path: path of the compressed file
+    :param compression: 'gzip' or 'zstd', see COMPRESSIONS
+    :return: binary file object
+    """
+    if compression == 'gzip':
+        return gzip.open(path, 'wb', compresslevel=6)
+    return zstd_module().open(path, 'wb')
+
+
+def zstd_module():
+    """
+    :return: module compression.zstd (python 3.14) or zstandard
+    """
+    # pylint: disable=import-outside-toplevel
+    try:
+        from compression import zstd
+        return zstd
+    except ImportError:
+        pass
+    try:
+        import zstandard
+        return zstandard
+    except ImportError as msg:
+        raise ImportError('zstd needs python 3.14 or the package '
+                          'zstandard') from msg
+
+
+def compress_file(path, compression):
+    """
+    Compress a file and remove it afterwards.
+
+    The compressed data is written to a temporary file first, so an
+    interrupted compression leaves the original file.
+
+    :param path: path of the file
+    :param compression: 'gzip' or 'zstd', see COMPRESSIONS
+    :return: path of the compressed file
+    """
+    target = f'{path}{COMPRESSIONS[compression]}'
+    with open(path, 'rb') as source, \
+            open_compressed(f'{target}.tmp', compression) as destination:
+        shutil.copyfileobj(source, destination, 1048576)
+    os.replace(f'{target}.tmp', target)
+    os.remove(path)
+    return target
+
+
+class Compressor():
+    """
+    This class compresses closed segments in a background thread, so
+    the receiving path never waits for the compression.
+    """
+
+    def __init__(self, compression='gzip'):
+        """
+        :param compression: 'gzip' or 'zstd', see COMPRESSIONS
+        """
+        if compression not in COMPRESSIONS:
+            raise ValueError(
+                f'unknown compression "{compression}", '
+                f'use one of {tuple(COMPRESSIONS)}')
+        if compression == 'zstd':
+            zstd_module()
+        self.compression = compression
+        self.queue = queue.Queue()
+        self.errors = 0
+        self.thread = Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def submit(self, paths, callback=None):
+        """
+        Compress files in the background.
+
+        :param paths: paths of the files
+        :param callback: function called with the list of the compressed
+                         paths when all files are compressed
+        """
+        self.queue.put((paths, callback))
+
+    def run(self):
+        """
+        Compress the submitted files until :meth:`stop` is called.
+        """
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            paths, callback = item
+            try:
+                compressed = [compress_file(path, self.compression)
+                              for path in paths if os.path.exists(path)]
+            except OSError as msg:
+                self.errors += 1
+                print(f"ERROR compressing {paths}: {msg}")
+                continue
+            if callback is not None:
+                callback(compressed)
+
+    def stop(self):
+        """
+        Wait until all submitted files are compressed.
+        """
+        self.queue.put(None)
+        self.thread.join()
+
+
+class RotatingWriter():
+    """
+    This class writes the records of a streaming session into segments:
+    a new segment (with its own header) is started after `max_bytes`,
+    `max_seconds` after the first record of the segment or, with
+    `per_parabola`, when the column ' Parabola' changes.
+
+    The segments are named `<stem>_<number><suffix>` after the path of
+    the session. Closed segments are compressed by a :class:`Compressor`
+    if `compression` is given. A manifest of the segments (see module
+    description) is kept up to date for a fast lookup by time
+    (:func:`find_segments`).
+
+    It has the interface of
+    :class:`novespace_stream_data.receive.BufferedWriter`.
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(  # pylint: disable=too-many-arguments
+            self, writer_class, path, fieldnames, *, max_bytes=None,
+            max_seconds=None, per_parabola=False, compression=None,
+            index=False, **kwargs):
+        """
+        :param writer_class: class of the writer of a segment
+                             (e. g. :class:`BufferedCSVWriter`)
+        :param path: path of the session; the segments are named after it
+        :param fieldnames: names of the columns for the header
+        :param max_bytes: start a new segment after this size in bytes
+        :param max_seconds: start a new segment after this number of
+                            seconds
+        :param per_parabola: If set to True, a new segment is started
+                             when the parabola changes.
+        :param compression: None, 'gzip' or 'zstd' for closed segments
+        :param index: If set to True, an index of the parabolas is built
+                      for every segment.
+        :param kwargs: flush policy, see :class:`BufferedWriter`
+        """
+        self.writer_class = writer_class
+        self.base_path = Path(path)
+        self.fieldnames = fieldnames
+        self.max_bytes = max_bytes
+        self.max_seconds = max_seconds
+        self.per_parabola = per_parabola
+        self.index = index
+        self.kwargs = kwargs
+        self.compressor = (Compressor(compression)
+                           if compression is not None else None)
+        self.manifest_path = manifest_path(path)
+        self.segments = []
+        self.writer = None
+        self.path = None
+        self.parabola = None
+        self.lock = Lock()
+        self.manifest_lock = Lock()
+
+    def open(self, write_header=True):
+        """
+        Open the first segment.
+
+        :param write_header: If set to True the header is written.
+        """
+        with self.lock:
+            self._open_segment(write_header)
+
+    def _open_segment(self, write_header=True):
+        """
+        Open the next segment; the lock is held.
+        """
+        self.path = self.base_path.with_name(
+            f'{self.base_path.stem}_{len(self.segments) + 1:04d}'
+            f'{self.base_path.suffix}')
+        self.writer = self.writer_class(
+            self.path, self.fieldnames,
+            index=(ParabolaIndex(index_path(self.path))
+                   if self.index else None),
+            **self.kwargs)
+        self.writer.open(write_header)
+        self.segments.append({
+            'name': self.path.name, 'compressed': None,
+            'compressed_files': None, 'first_unixtime': None,
+            'last_unixtime': None, 'rows': 0, 'bytes': self.writer.offset,
+            'parabolas': None, 'closed': False})
+        self.save_manifest()
+
+    def _close_segment(self):
+        """
+        Close the current segment and compress it; the lock is held.
+        """
+        self.writer.close()
+        segment = self.segments[-1]
+        segment['bytes'] = self.writer.offset
+        segment['closed'] = True
+        self.save_manifest()
+        if self.compressor is not None:
+            self.compressor.submit(
+                self.writer.get_paths(),
+                lambda paths, segment=segment: self.set_compressed(
+                    segment, paths))
+
+    def set_compressed(self, segment, paths):
+        """
+        Record the compressed files of a segment in the manifest.
+
+        :param segment: entry of the segment in the manifest
+        :param paths: paths of the compressed files
+        """
+        names = [Path(path).name for path in paths]
+        with self.manifest_lock:
+            segment['compressed'] = next(
+                (name for name in names
+                 if Path(name).stem == segment['name']), None)
+            segment['compressed_files'] = names or None
+        self.save_manifest()
+
+    def save_manifest(self):
+        """
+        Save the manifest as json.
+        """
+        with self.manifest_lock:
+            tmp_path = f'{self.manifest_path}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as filedescriptor:
+                json.dump({'segments': self.segments}, filedescriptor,
+                          indent=0)
+            os.replace(tmp_path, self.manifest_path)
+
+    def needs_rotation(self, unixtime, parabola=None):
+        """
+        :param unixtime: local timestamp of the record
+        :param parabola: parabola number of the record (only used with
+                         `per_parabola`)
+        :return: True if the record has to start a new segment
+        """
+        if self.segments[-1]['rows'] == 0:
+            return False
+        if (self.max_bytes is not None) and \
+                (self.writer.offset >= self.max_bytes):
+            return True
+        if (self.max_seconds is not None) and \
+                (unixtime >= self.segments[-1]['first_unixtime'] +
+                 self.max_seconds):
+            return True
+        return ((parabola is not None) and (self.parabola is not None) and
+                (parabola != self.parabola))
+
+    def write_record(self, unixtime, data_str):
+        """
+        Write one received datagram, starting a new segment if necessary.
+
+        :param unixtime: local timestamp of the datagram
+        :param data_str: decoded datagram
+        :return: False if the file is already closed, otherwise True
+        """
+        with self.lock:
+            if self.writer is None:
+                return False
+            parabola = None
+            if self.per_parabola:
+                key = parse_key(data_str)
+                parabola = None if key is None else key[0]
+            if self.needs_rotation(unixtime, parabola):
+                self._close_segment()
+                self._open_segment()
+            if not self.writer.write_record(unixtime, data_str):
+                return False
+            segment = self.segments[-1]
+            if segment['rows'] == 0:
+                segment['first_unixtime'] = unixtime
+            segment['last_unixtime'] = unixtime
+            segment['rows'] += 1
+            if parabola is not None:
+                self.parabola = parabola
+                if segment['parabolas'] is None:
+                    segment['parabolas'] = [parabola, parabola]
+                segment['parabolas'][1] = parabola
+        return True
+
+    def poll(self):
+        """
+        Flush pending records if `flush_interval` is exceeded.
+        """
+        with self.lock:
+            if self.writer is not None:
+                self.writer.poll()
+
+    def flush(self):
+        """
+        Flush all pending records.
+        """
+        with self.lock:
+            if self.writer is not None:
+                self.writer.flush()
+
+    def close(self):
+        """
+        Close the current segment and wait for the compression.
+
+        Calling this method more than once is harmless.
+        """
+        with self.lock:
+            if self.writer is None:
+                return
+            self.segments[-1]['bytes'] = self.writer.offset
+            self._close_segment()
+            self.writer = None
+        if self.compressor is not None:
+            self.compressor.stop()
+
+
+def find_segments(path, first=None, last=None):
+    """
+    Find the segments of a session overlapping a time range.
+
+    :param path: path of the manifest
+    :param first: local unix time of the start of the range
+    :param last: local unix time of the end of the range
+    :return: list of tuples (path of the segment or of the compressed
+             segment, entry of the manifest)
+    """
+    path = Path(path)
+    with open(path, encoding='utf-8') as filedescriptor:
+        segments = json.load(filedescriptor)['segments']
+    found = []
+    for segment in segments:
+        if segment['rows'] == 0:
+            continue
+        if (first is not None) and (segment['last_unixtime'] < first):
+            continue
+        if (last is not None) and (segment['first_unixtime'] > last):
+            continue
+        found.append((path.with_name(segment['compressed'] or
+                                     segment['name']), segment))
+    return found
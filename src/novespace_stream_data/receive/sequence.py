@@ -0,0 +1,154 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Sequence numbers of datagrams for load tests and loss accounting.
+
+Copyright (C) 2026 Daniel Maier (University of Greifswald),
+                   Daniel Mohr (University of Greifswald),
+                   Thomas Villatte (Novespace)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+format
+======
+
+The stream from Novespace has no sequence numbers. Emulators may append
+the field `#<stream>:<number>` to a datagram, e. g.::
+
+    34440006;34:00.0;0.18;-0.01;0.95;19;46.2;944;0;STEADY FLIGHT;#3:17
+
+`<stream>` identifies the sender (several senders may use the same port)
+and `<number>` counts from 0.
+"""
+
+SEQUENCE_MARK = '#'
+
+
+def add_sequence(data, stream, number):
+    """
+    Append a sequence number to a datagram.
+
+    :param data: datagram (bytes)
+    :param stream: identifier of the sender
+    :param number: sequence number
+    :return: datagram with sequence number (bytes)
+    """
+    return data + f';{SEQUENCE_MARK}{stream}:{number}'.encode()
+
+
+def split_sequence(data_str):
+    """
+    Split the sequence number from a datagram.
+
+    :param data_str: decoded datagram
+    :return: tuple (stream, number) or None without sequence number
+    """
+    _, _, field = data_str.rpartition(';')
+    if not field.startswith(SEQUENCE_MARK):
+        return None
+    stream, _, number = field[1:].partition(':')
+    try:
+        return stream, int(number)
+    except ValueError:
+        return None
+
+
+class SequenceTracker():
+    """
+    This class counts received, missing, out-of-order and duplicate
+    datagrams from their sequence numbers, separately for every stream
+    (port and sender).
+
+    A datagram with a number above the highest one so far marks the
+    numbers in between as missing. A later datagram with one of these
+    numbers is counted as out-of-order (and no longer as missing), any
+    other lower number as duplicate. At most `window` missing numbers
+    are remembered per stream.
+
+    An instance is called with every record; it can be given to
+    :meth:`NoSpaStream.add_record_handler`.
+    """
+
+    def __init__(self, window=65536):
+        """
+        :param window: number of missing sequence numbers remembered
+                       per stream
+        """
+        self.window = window
+        self.streams = {}
+
+    def __call__(self, unixtime, data_str, port=None):
+        """
+        Process a record.
+
+        :param unixtime: local timestamp of the record (not used)
+        :param data_str: decoded datagram
+        :param port: port the datagram was received on
+        :return: tuple (stream, number) or None
+        """
+        sequence = split_sequence(data_str)
+        if sequence is None:
+            return None
+        self.add(port, *sequence)
+        return sequence
+
+    def add(self, port, stream, number):
+        """
+        Count a sequence number.
+
+        :param port: port the datagram was received on
+        :param stream: identifier of the sender
+        :param number: sequence number
+        """
+        counters = self.streams.get((port, stream))
+        if counters is None:
+            counters = self.streams[(port, stream)] = {
+                'received': 0, 'missing': 0, 'out_of_order': 0,
+                'duplicate': 0, 'highest': number - 1, 'gaps': {}}
+        counters['received'] += 1
+        gaps = counters['gaps']
+        if number > counters['highest']:
+            for missing in range(
+                    max(counters['highest'] + 1, number - self.window),
+                    number):
+                gaps[missing] = None
+            counters['missing'] += number - counters['highest'] - 1
+            counters['highest'] = number
+            while len(gaps) > self.window:
+                del gaps[next(iter(gaps))]
+        elif number in gaps:
+            del gaps[number]
+            counters['missing'] -= 1
+            counters['out_of_order'] += 1
+        else:
+            counters['duplicate'] += 1
+
+    def get_statistics(self):
+        """
+        :return: dictionary with the counters summed over all streams
+        """
+        statistics = {'streams': len(self.streams), 'received': 0,
+                      'missing': 0, 'out_of_order': 0, 'duplicate': 0}
+        for counters in list(self.streams.values()):
+            for key in ('received', 'missing', 'out_of_order', 'duplicate'):
+                statistics[key] += counters[key]
+        return statistics
+
+    def reset(self):
+        """
+        Forget all streams.
+        """
+        self.streams = {}
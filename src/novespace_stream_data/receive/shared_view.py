@@ -0,0 +1,247 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Live view of the latest samples in shared memory.
+
+Copyright (C) 2026 Daniel Maier (University of Greifswald),
+                   Daniel Mohr (University of Greifswald),
+                   Thomas Villatte (Novespace)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+layout
+======
+
+The block (:class:`multiprocessing.shared_memory.SharedMemory`) starts
+with a header of 64 bytes (little endian):
+
+=============  =======  ==============================================
+field          type     content
+=============  =======  ==============================================
+magic          8 bytes  `NSPASHM1`
+version        uint32   1
+capacity       uint32   number of slots of the ring
+slot size      uint32   128
+(reserved)     uint32
+count          uint64   number of samples written so far
+(reserved)     32 bytes
+=============  =======  ==============================================
+
+It is followed by the slot of the latest record and the `capacity`
+slots of the ring; sample `n` (counted from 0) is stored in ring slot
+`n % capacity`. A slot of 128 bytes consists of:
+
+=============  =======  ==============================================
+field          type     content
+=============  =======  ==============================================
+sequence       uint64   odd while the slot is written (seqlock)
+unixtime       float64  local timestamp
+port           int64    port the datagram was received on (0: unknown)
+ms             int64    miliseconds since 00:00:00
+time           float64  column ' Time' (mm:ss.f) in seconds
+jx, jy, jz     float64  g-levels
+temperature    float64  temperature (°C)
+humidity       float64  humidity (%)
+pressure       float64  pressure (mbar)
+parabola       int64    parabola number
+announcement   24 bytes utf-8, padded with zero bytes
+(reserved)     8 bytes
+=============  =======  ==============================================
+
+There is one writer (the receiver). A reader copies a slot and accepts
+the copy only if the sequence was even and did not change meanwhile
+(seqlock); otherwise it reads again. So neither the writer nor a reader
+ever waits for a lock.
+"""
+
+import struct
+import sys
+from multiprocessing import resource_tracker, shared_memory
+
+from .records import Record
+
+MAGIC = b'NSPASHM1'
+VERSION = 1
+HEADER = struct.Struct('<8sIIIIQ32x')
+SEQUENCE = struct.Struct('<Q')
+COUNT_OFFSET = 24
+RECORD = struct.Struct('<dqqdddddddq24s')
+SLOT_SIZE = 128
+SHARED_VIEW_NAME = 'novespace_stream_data'
+
+
+def record_values(values):
+    """
+    :param values: tuple as unpacked with RECORD
+    :return: Record
+    """
+    return Record(values[0], values[1],
+                  values[2:11] + (values[11].rstrip(b'\0').decode(
+                      'utf-8', 'replace'),))
+
+
+class SharedView():
+    """
+    This class publishes the latest record and a ring of the recent
+    records of the receiver in shared memory (see
+    :mod:`novespace_stream_data.receive.shared_view`), so processes on
+    the same computer read them with :class:`SharedViewReader` without
+    sockets or file access.
+
+    :meth:`add_record` takes typed records, e. g. from
+    :meth:`NoSpaStream.add_parsed_handler`.
+    """
+
+    def __init__(self, name=SHARED_VIEW_NAME, capacity=1024):
+        """
+        :param name: name of the shared memory block
+        :param capacity: number of recent records kept in the ring
+        """
+        size = HEADER.size + SLOT_SIZE * (capacity + 1)
+        try:
+            self.memory = shared_memory.SharedMemory(name, True, size)
+        except FileExistsError:
+            # left over by a previous run
+            stale = shared_memory.SharedMemory(name)
+            stale.close()
+            stale.unlink()
+            self.memory = shared_memory.SharedMemory(name, True, size)
+        self.buffer = self.memory.buf
+        self.capacity = capacity
+        self.count = 0
+        HEADER.pack_into(self.buffer, 0, MAGIC, VERSION, capacity,
+                         SLOT_SIZE, 0, 0)
+
+    def write_slot(self, offset, values):
+        """
+        Write a slot with the seqlock protocol.
+
+        :param offset: offset of the slot
+        :param values: values of RECORD
+        """
+        (sequence,) = SEQUENCE.unpack_from(self.buffer, offset)
+        SEQUENCE.pack_into(self.buffer, offset, sequence + 1)
+        RECORD.pack_into(self.buffer, offset + SEQUENCE.size, *values)
+        SEQUENCE.pack_into(self.buffer, offset, sequence + 2)
+
+    def add_record(self, record):
+        """
+        Publish a record as latest record and in the ring.
+
+        :param record: :class:`Record`
+        """
+        values = (record.unixtime, record.port or 0, record.ms, record.time,
+                  record.jx, record.jy, record.jz, record.temperature,
+                  record.humidity, record.pressure, record.parabola,
+                  record.announcement.encode('utf-8')[:24])
+        self.write_slot(HEADER.size, values)
+        self.write_slot(
+            HEADER.size + SLOT_SIZE * (1 + self.count % self.capacity),
+            values)
+        self.count += 1
+        SEQUENCE.pack_into(self.buffer, COUNT_OFFSET, self.count)
+
+    def close(self):
+        """
+        Release and remove the shared memory block.
+        """
+        self.buffer.release()
+        self.memory.close()
+        self.memory.unlink()
+
+
+class SharedViewReader():
+    """
+    This class reads the records published by :class:`SharedView` in
+    another process without locks.
+    """
+
+    def __init__(self, name=SHARED_VIEW_NAME):
+        """
+        :param name: name of the shared memory block
+        """
+        if sys.version_info >= (3, 13):
+            # pylint: disable=unexpected-keyword-arg
+            self.memory = shared_memory.SharedMemory(name, track=False)
+        else:
+            self.memory = shared_memory.SharedMemory(name)
+            # otherwise the block is removed when this process ends
+            # pylint: disable=protected-access
+            resource_tracker.unregister(self.memory._name, 'shared_memory')
+        self.buffer = self.memory.buf
+        magic, version, self.capacity, slot_size, _, _ = \
+            HEADER.unpack_from(self.buffer)
+        if (magic != MAGIC) or (version != VERSION) or \
+                (slot_size != SLOT_SIZE):
+            self.close()
+            raise ValueError(f'{name} is not a shared view of the receiver')
+
+    @property
+    def count(self):
+        """
+        number of records published so far
+        """
+        return SEQUENCE.unpack_from(self.buffer, COUNT_OFFSET)[0]
+
+    def read_slot(self, offset, retries=100):
+        """
+        Read a slot with the seqlock protocol.
+
+        :param offset: offset of the slot
+        :param retries: maximal number of attempts
+        :return: tuple (sequence, values of RECORD) or None if the slot
+                 was never written or is written all the time
+        """
+        for _ in range(retries):
+            (sequence,) = SEQUENCE.unpack_from(self.buffer, offset)
+            if sequence & 1:
+                continue
+            values = RECORD.unpack_from(self.buffer, offset + SEQUENCE.size)
+            if SEQUENCE.unpack_from(self.buffer, offset)[0] == sequence:
+                return (sequence, values) if sequence else None
+        return None
+
+    def latest(self):
+        """
+        :return: latest :class:`Record` or None
+        """
+        slot = self.read_slot(HEADER.size)
+        return None if slot is None else record_values(slot[1])
+
+    def recent(self, number=None):
+        """
+        :param number: maximal number of records (default: capacity)
+        :return: list of the recent records (:class:`Record`), oldest
+                 first; records overwritten while reading are left out
+        """
+        count = self.count
+        number = min(count, self.capacity, number or self.capacity)
+        records = []
+        for index in range(count - number, count):
+            slot = self.read_slot(
+                HEADER.size + SLOT_SIZE * (1 + index % self.capacity))
+            # the sequence grows by 2 with every round of the ring
+            if (slot is not None) and \
+                    (slot[0] == 2 * (index // self.capacity + 1)):
+                records.append(record_values(slot[1]))
+        return records
+
+    def close(self):
+        """
+        Detach from the shared memory block (it is not removed).
+        """
+        self.buffer.release()
+        self.memory.close()
@@ -5,22 +5,25 @@
 """
 This program emulates the UDP broadcast of the Data-unit,
 sending data from a csv file (row by row) to a UDP port on a
-specific IP address, every 0.1s
+specific IP address, every 0.1s or with the recorded timing
 """
 
-import csv
 import socket
 import threading
-import time
 import tkinter as tk
 from importlib.resources import files
 from tkinter import filedialog, messagebox
 
+from novespace_stream_data.emulate import Pacer, Replay
+
 # Global variable to control the stop flag
 stop_flag = False  # pylint: disable = C0103
 entry_file = None  # pylint: disable = C0103
 entry_ip = None  # pylint: disable = C0103
 entry_port = None  # pylint: disable = C0103
+entry_speed = None  # pylint: disable = C0103
+entry_parabola = None  # pylint: disable = C0103
+replay_var = None  # pylint: disable = C0103
 text_output = None  # pylint: disable = C0103
 DEFAULT_IP = "127.0.0.1"
 DEFAULT_PORT = "3131"
@@ -40,6 +43,14 @@ def start_sending():  # pylint: disable = C0116
     file_path = entry_file.get()  # Get the file path from the entry widget
     ip_address = entry_ip.get()  # Get the IP address from the entry widget
     port = int(entry_port.get())  # Get the port number from the entry widget
+    try:
+        speed = float(entry_speed.get())
+        parabola = (int(entry_parabola.get())
+                    if entry_parabola.get().strip() else None)
+    except ValueError:
+        messagebox.showerror(
+            "Error", "Speed-up and start parabola have to be numbers.")
+        return
 
     if not file_path or not ip_address or not port:
         messagebox.showerror("Error", "Please fill all fields.")
@@ -49,43 +60,49 @@ def start_sending():  # pylint: disable = C0116
 
     # Start the UDP transmission in a separate thread to avoid blocking the GUI
     thread = threading.Thread(target=send_udp_data,
-                              args=(file_path, ip_address, port))
+                              args=(file_path, ip_address, port,
+                                    replay_var.get(), speed, parabola))
     # Daemonize the thread to automatically close on program exit:
     thread.daemon = True
     thread.start()
 
 
 # Function to send data line by line from CSV over UDP
-def send_udp_data(file_path, ip_address, port):  # pylint: disable = C0116
+def send_udp_data(  # pylint: disable = C0116, R0913, R0917
+        file_path, ip_address, port, replay=False, speed=1.0,
+        parabola=None):
     try:
         # Create a UDP socket
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-
-        # Open the CSV file
-        with open(file_path, newline='', encoding='utf-8') as csvfile:
-            csvreader = csv.reader(csvfile)
-
-            # Read each line and send it over UDP
-            for row in csvreader:
-                if stop_flag:  # Check if we need to stop sending
-                    print("Transmission stopped")
-                    break
-
-                # Join the columns into a single string
-                message = ",".join(row)
-                sock.sendto(message.encode(), (ip_address, port))  # Send data
-
-                # Display the sent message in the Text widget
-                text_output.insert(tk.END, f"Sent: {message}\n")
-                text_output.yview(tk.END)  # Auto-scroll to the latest entry
-
-                # Wait for a short time before sending the next line
-                # Adjust this to control the rate of data transmission
-                time.sleep(0.1)
-
-        # Close the socket after sending all data
-        sock.close()
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+
+            # Read the CSV file and the recorded timing at once
+            with Replay(file_path) as recording:
+                start = recording.find_start(parabola=parabola)
+
+                # Send every 0.1 s or with the recorded timing (speed-up)
+                pacer = Pacer(0.1)
+                pacer.start()
+                for offset, message in recording.schedule(start, speed):
+                    # the mapping can only be closed without slices
+                    if stop_flag:  # Check if we need to stop sending
+                        message.release()
+                        print("Transmission stopped")
+                        break
+
+                    pacer.wait(offset if replay else None)
+                    sock.sendto(message, (ip_address, port))  # Send data
+
+                    # Display the sent message in the Text widget
+                    text_output.insert(
+                        tk.END, f"Sent: {bytes(message).decode()}\n")
+                    # Auto-scroll to the latest entry
+                    text_output.yview(tk.END)
+                    message.release()
+        finally:
+            # Close the socket after sending all data or on an error
+            sock.close()
 
         if not stop_flag:  # Check if the transmission wasn't stopped manually
             messagebox.showinfo("Success", "Data sent successfully!")
@@ -114,7 +131,8 @@ def main():  # pylint: disable = C0116
         root,
         text="This program emulates the UDP broadcast of the Data-unit, "
         "sending data from a csv file (row by row) to a UDP port on a "
-        "specific IP address, every 0.1s").grid(
+        "specific IP address, every 0.1s or with the recorded "
+        "timing").grid(
             row=0, column=1, padx=10, pady=10)
     tk.Label(root, text="CSV File:").grid(
         row=1, column=0, padx=10, pady=10, sticky="e")
@@ -143,26 +161,41 @@ def main():  # pylint: disable = C0116
     entry_port.grid(row=3, column=1, padx=10, pady=10,
                     sticky="ew")  # Stretch horizontally
 
+    # Replay with the recorded timing, speed-up factor and start parabola
+    global entry_speed, entry_parabola  # pylint: disable = C0103, W0603
+    global replay_var  # pylint: disable = C0103, W0603
+    replay_var = tk.BooleanVar(root, value=False)
+    tk.Checkbutton(
+        root, text="Recorded timing, speed-up:", variable=replay_var).grid(
+            row=4, column=0, padx=10, pady=10, sticky="e")
+    entry_speed = tk.Entry(root, width=40)
+    entry_speed.insert(0, "1")
+    entry_speed.grid(row=4, column=1, padx=10, pady=10, sticky="ew")
+    tk.Label(root, text="Start parabola:").grid(
+        row=5, column=0, padx=10, pady=10, sticky="e")
+    entry_parabola = tk.Entry(root, width=40)
+    entry_parabola.grid(row=5, column=1, padx=10, pady=10, sticky="ew")
+
     # Browse button to select a CSV file
     browse_button = tk.Button(root, text="Browse", command=browse_file)
     browse_button.grid(row=1, column=2, padx=10, pady=10, sticky="w")
 
     # Start button to begin sending data
     start_button = tk.Button(root, text="Start Sending", command=start_sending)
-    start_button.grid(row=4, column=0, padx=10, pady=20, sticky="e")
+    start_button.grid(row=6, column=0, padx=10, pady=20, sticky="e")
 
     # Stop button to stop sending data
     stop_button = tk.Button(root, text="Stop Sending", command=stop_sending)
-    stop_button.grid(row=4, column=1, padx=10, pady=20, sticky="w")
+    stop_button.grid(row=6, column=1, padx=10, pady=20, sticky="w")
 
     # Create a Text widget for showing the sent messages
     global text_output  # pylint: disable = C0103, W0603
     text_output = tk.Text(root, height=10, wrap=tk.WORD)
-    text_output.grid(row=5, column=0, columnspan=3, padx=10,
+    text_output.grid(row=7, column=0, columnspan=3, padx=10,
                      pady=10, sticky="nsew")  # Stretch in all directions
 
     # Make the grid rows/columns expand with window resizing
-    root.grid_rowconfigure(5, weight=1)  # Make row 4 (Text widget) expand
+    root.grid_rowconfigure(7, weight=1)  # Make row 7 (Text widget) expand
     # Make column 0 (Text widget) expand
     root.grid_columnconfigure(0, weight=1)
     # Make column 1 expand (entry widgets and buttons)
@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+This exports a binary capture of the receiver to the csv format.
+
+Copyright (C) 2026 Daniel Maier (University of Greifswald),
+                   Daniel Mohr (University of Greifswald),
+                   Thomas Villatte (Novespace)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import argparse
+from pathlib import Path
+
+from novespace_stream_data.receive import (
+    CSV_FIELDNAMES, JournalWriter, RawCaptureWriter, export_csv,
+    export_journal, export_raw_capture)
+
+
+def export_capture():
+    """
+    This function exports binary captures (*.nsb), journals (*.nsj) and
+    raw captures (*.nsr) to csv-files as written by the receiver.
+    """
+    description = "This script exports binary captures, journals and raw "
+    description += "captures of the receiver to csv-files."
+    epilog = "Date: 2026-10-17\n"
+    epilog += "License: GPL-3.0-or-later"
+    parser = argparse.ArgumentParser(
+        description=description,
+        epilog=epilog,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        'captures',
+        nargs="+",
+        type=str,
+        help='binary captures, journals or raw captures to export; the '
+        'csv-file is created next to the capture with the suffix .csv',
+        metavar='f')
+    args = parser.parse_args()
+    for capture in args.captures:
+        csv_path = Path(capture).with_suffix('.csv')
+        if Path(capture).suffix == JournalWriter.suffix:
+            rows = export_journal(capture, csv_path)
+        elif Path(capture).suffix == RawCaptureWriter.suffix:
+            rows = export_raw_capture(capture, csv_path)
+        else:
+            rows = export_csv(capture, csv_path, CSV_FIELDNAMES)
+        print(f"exported {rows} rows from {capture} to {csv_path}")
@@ -0,0 +1,189 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+This sends several synthetic streams at increasing rates to find the
+capacity of a receiver.
+
+Copyright (C) 2026 Daniel Maier (University of Greifswald),
+                   Daniel Mohr (University of Greifswald),
+                   Thomas Villatte (Novespace)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+
+from novespace_stream_data.emulate import LOAD_MODES, LoadGenerator
+from novespace_stream_data.receive import (
+    NoSpaStream, SequenceTracker, read_metrics)
+from novespace_stream_data.receive.metrics import PREFIX
+
+
+def print_step(rate, streams, result, statistics=None):
+    """
+    print the result of a rate step
+    """
+    line = (f"{rate:10.1f} {streams:7d} {result['rate']:12.1f} "
+            f"{result['sent']:10d} {result['errors']:7d}")
+    if statistics is not None:
+        lost = result['sent'] - statistics['received']
+        line += (f" {statistics['received']:10d} {lost:8d} "
+                 f"{100 * lost / max(result['sent'], 1):7.2f} "
+                 f"{statistics['out_of_order']:6d} "
+                 f"{statistics['duplicate']:6d} {statistics['dropped']:8d}")
+    print(line)
+
+
+def start_receiver(generator, filepath, args):
+    """
+    start a receiver in this process counting the sequence numbers
+    """
+    tracker = SequenceTracker()
+    receiver = NoSpaStream(
+        filepath, generator.get_ports(), queue_size=args.queue_size,
+        batch_size=args.batch_size, overflow='drop-newest')
+    receiver.do_exit = False
+    receiver.add_record_handler(tracker)
+    receiver.start_streaming()
+    return receiver, tracker
+
+
+def remote_counters(address):
+    """
+    fetch the counters of a remote receiver from its metrics endpoint
+    """
+    samples = read_metrics(address)
+
+    def lost(kind):
+        return int(samples.get(f'{PREFIX}_lost_total{{kind="{kind}"}}', 0))
+    return {'received': int(samples.get(f'{PREFIX}_datagrams_total', 0)),
+            'out_of_order': lost('out_of_order'),
+            'duplicate': lost('duplicate'),
+            'dropped': lost('kernel_dropped') + lost('stage_dropped')}
+
+
+def get_counters(receiver, tracker, remote):
+    """
+    get the counters of the receiver in this process or of the remote one
+    """
+    if remote is not None:
+        return remote_counters(remote)
+    statistics = tracker.get_statistics()
+    statistics['dropped'] = sum(stage.get_statistics()['dropped']
+                                for stage in receiver.stages)
+    return statistics
+
+
+def run_load_test():
+    """
+    This function sends several synthetic streams with sequence numbers at
+    increasing rates and reports sent and received datagrams per step.
+
+    By default a receiver (:class:`NoSpaStream`) is started in this
+    process; the streams are sent by worker processes.
+    """
+    description = "This script sends several synthetic streams with "
+    description += "sequence numbers at increasing rates and reports the "
+    description += "sent and received datagrams per rate step."
+    epilog = "Date: 2026-10-17\n"
+    epilog += "License: GPL-3.0-or-later"
+    parser = argparse.ArgumentParser(
+        description=description,
+        epilog=epilog,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        '-streams', nargs="?", default=4, type=int, required=False,
+        dest='streams', help='number of streams (default: %(default)s)',
+        metavar='n')
+    parser.add_argument(
+        '-rates', nargs="+", default=[10.0, 100.0, 1000.0], type=float,
+        required=False, dest='rates',
+        help='datagrams per second and stream of the rate steps '
+        '(default: %(default)s)', metavar='r')
+    parser.add_argument(
+        '-duration', nargs="?", default=5.0, type=float, required=False,
+        dest='duration', help='seconds per rate step (default: %(default)s)',
+        metavar='t')
+    parser.add_argument(
+        '-mode', nargs="?", default='ports', choices=LOAD_MODES,
+        required=False, dest='mode',
+        help='send to consecutive ports or to one port from different '
+        'source addresses (default: %(default)s)')
+    parser.add_argument(
+        '-ip_address', nargs="?", default='localhost', type=str,
+        required=False, dest='ip_address',
+        help='ip address of the receiver (default: %(default)s)',
+        metavar='dst')
+    parser.add_argument(
+        '-port', nargs="?", default=3131, type=int, required=False,
+        dest='port', help='(first) port of the receiver '
+        '(default: %(default)s)', metavar='i')
+    parser.add_argument(
+        '-workers', nargs="?", default=None, type=int, required=False,
+        dest='workers', help='number of sending processes '
+        '(default: number of cpus)', metavar='n')
+    parser.add_argument(
+        '-remote', nargs="?", default=None, type=str, required=False,
+        dest='remote',
+        help='do not start a receiver in this process; compare the sent '
+        'datagrams with the counters of the remote receiver fetched from '
+        'its metrics endpoint (host:port or path of a Unix socket, see '
+        '-metrics of novespace_stream_data_receiver)', metavar='address')
+    parser.add_argument(
+        '-filepath', nargs="?", default=None, type=str, required=False,
+        dest='filepath', help='folder for the csv-files of the receiver '
+        '(default: a temporary folder)', metavar='f')
+    parser.add_argument(
+        '-queue_size', nargs="?", default=None, type=int, required=False,
+        dest='queue_size', help='queue_size of the receiver', metavar='n')
+    parser.add_argument(
+        '-batch_size', nargs="?", default=None, type=int, required=False,
+        dest='batch_size', help='batch_size of the receiver', metavar='n')
+    args = parser.parse_args()
+    generator = LoadGenerator(
+        args.ip_address, args.port, args.streams, mode=args.mode,
+        workers=args.workers)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        receiver, tracker = None, None
+        if args.remote is None:
+            receiver, tracker = start_receiver(
+                generator, args.filepath or tmpdir, args)
+            time.sleep(0.5)
+        print(f"{'rate/s':>10} {'streams':>7} {'achieved/s':>12} "
+              f"{'sent':>10} {'errors':>7} {'received':>10} {'lost':>8} "
+              f"{'loss %':>7} {'order':>6} {'dupl.':>6} {'dropped':>8}")
+        try:
+            for rate in args.rates:
+                if receiver is not None:
+                    tracker.reset()
+                before = get_counters(receiver, tracker, args.remote)
+                result = generator.run_step(rate, args.duration)
+                # let the receiver process its queues
+                time.sleep(1.0)
+                after = get_counters(receiver, tracker, args.remote)
+                statistics = {key: after[key] - value
+                              for key, value in before.items()}
+                print_step(rate, args.streams, result, statistics)
+        except OSError as msg:
+            print(f"ERROR fetching the metrics of {args.remote}: {msg}")
+            sys.exit(1)
+        finally:
+            generator.close()
+            if receiver is not None:
+                receiver.end_streaming()
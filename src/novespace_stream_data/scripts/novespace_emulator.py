@@ -24,23 +24,39 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import argparse
-import csv
 import signal
 import socket
-import time
 from importlib.resources import files
 from threading import Event
 
+from novespace_stream_data.emulate import (
+    PACING_POLICIES, Pacer, Replay, parse_start_time)
+
 
 class NovespaceStreamEmulator():
     """
     This program emulates the UDP broadcast of the Data-unit,
     sending data from a csv file (row by row) to a UDP port on a
     specific IP address, every 0.1s
+
+    Every line is sent with its original bytes (see
+    :class:`novespace_stream_data.emulate.Replay`).
+
+    The datagrams are paced at absolute deadlines (see
+    :class:`novespace_stream_data.emulate.Pacer`), so the rate does not
+    drift; the achieved rate and jitter are printed at the end.
+
+    With `replay` set, the datagrams are sent with the recorded timing
+    (first column, miliseconds since 00:00:00) instead of every
+    `sleeptime` seconds, optionally faster by `speed`.
     """
+    # pylint: disable=too-many-instance-attributes
 
-    def __init__(self, filepath=None, ip_address='localhost', port=3131,
-                 sleeptime=0.1):
+    def __init__(  # pylint: disable=too-many-arguments
+            self, filepath=None, ip_address='localhost', port=3131,
+            sleeptime=0.1, *, policy='catch-up', busy_wait=0.001,
+            replay=False, speed=1.0, start_time=None, parabola=None,
+            loops=1, preload=False):
         """
         This emulates a data stream.
 
@@ -49,12 +65,30 @@ class NovespaceStreamEmulator():
         :param filepath (str): Path to file to stream
         :param ip_address (str): ip address to send data
         :param port (int): Number of Port for streaming (default: 3131)
-        :param sleeptime: number of seconds to sleep between datagrams
+        :param sleeptime: number of seconds between datagrams
+                          (0: as fast as possible)
+        :param policy: 'catch-up' or 'skip' for missed deadlines
+        :param busy_wait: seconds before a deadline spent in a busy loop
+        :param replay: If set to True, the recorded timing is used.
+        :param speed: speed-up factor of the replay
+        :param start_time: If given, start at this time of the recording
+                           (miliseconds since 00:00:00).
+        :param parabola: If given, start at this parabola.
+        :param loops: number of replays of the file (0: endless)
+        :param preload: If set to True, the file is read into memory
+                        instead of mapping it.
         """
         self.filepath = filepath
         self.ip_address = ip_address
         self.port = port
         self.sleeptime = sleeptime
+        self.replay = replay
+        self.speed = speed
+        self.start_time = start_time
+        self.parabola = parabola
+        self.loops = loops
+        self.preload = preload
+        self.pacer = Pacer(sleeptime, policy, busy_wait)
         self.stop_event = Event()
         self.streaming_not_running = Event()
         signal.signal(signal.SIGINT, self.signal_handler)
@@ -70,19 +104,28 @@ class NovespaceStreamEmulator():
         print("to stop streaming use: CTRL+C or send a TERM signal\n")
         self.stop_event.clear()
         self.streaming_not_running.clear()
-        with open(self.filepath, newline='', encoding='utf-8') as csvfile:
-            csvreader = csv.reader(csvfile)
-            for row in csvreader:
-                if self.stop_event.is_set():
-                    print("transmission stopped")
-                    break
-                message = ",".join(row)
-                sock.sendto(message.encode(), (self.ip_address, self.port))
-                time.sleep(self.sleeptime)
-        if not self.stop_event.is_set():
-            print("full file sent")
-        sock.close()
-        self.streaming_not_running.set()
+        try:
+            with Replay(self.filepath, self.preload) as recording:
+                start = recording.find_start(self.start_time, self.parabola)
+                if start > 0:
+                    print(f"start at datagram {start} of {len(recording)}")
+                self.pacer.start()
+                for offset, message in recording.schedule(
+                        start, self.speed, self.loops):
+                    # the mapping can only be closed without slices
+                    if self.stop_event.is_set():
+                        message.release()
+                        print("transmission stopped")
+                        break
+                    self.pacer.wait(offset if self.replay else None)
+                    sock.sendto(message, (self.ip_address, self.port))
+                    message.release()
+            if not self.stop_event.is_set():
+                print("full file sent")
+            self.pacer.print_report()
+        finally:
+            sock.close()
+            self.streaming_not_running.set()
 
     def signal_handler(self, signum, _):
         """
@@ -106,7 +149,8 @@ def start_novespace_emulator(
     :param filepath (str): Path to file to stream
     :param ip_address (str): ip address to send data
     :param port (int): Number of Port for streaming (default: 3131)
-    :param sleeptime: number of seconds to sleep between datagrams
+    :param sleeptime: number of seconds between datagrams
+                      (0: as fast as possible)
     """
     if filepath is None:
         filepath = files("novespace_stream_data").joinpath(
@@ -152,10 +196,85 @@ def start_novespace_emulator(
         type=float,
         required=False,
         dest='sleeptime',
-        help='number of seconds to sleep between datagrams '
+        help='number of seconds between datagrams; 0 sends as fast as '
+        'possible (default: %(default)s)',
+        metavar='i')
+    parser.add_argument(
+        '-deadline_policy',
+        nargs="?",
+        default='catch-up',
+        choices=PACING_POLICIES,
+        required=False,
+        dest='policy',
+        help='If a deadline is missed, catch-up sends the late datagrams '
+        'immediately and skip continues the schedule from now '
+        '(default: %(default)s)')
+    parser.add_argument(
+        '-busy_wait',
+        nargs="?",
+        default=0.001,
+        type=float,
+        required=False,
+        dest='busy_wait',
+        help='number of seconds before a deadline spent in a busy loop '
+        'for precise intervals (default: %(default)s)',
+        metavar='t')
+    parser.add_argument(
+        '-replay',
+        action='store_true',
+        required=False,
+        dest='replay',
+        help='send the datagrams with the recorded timing (first column, '
+        'miliseconds since 00:00:00) instead of every sleeptime seconds')
+    parser.add_argument(
+        '-replay_speed',
+        nargs="?",
+        default=1.0,
+        type=float,
+        required=False,
+        dest='speed',
+        help='speed-up factor of the replay, e.g. 10 or 100 '
         '(default: %(default)s)',
+        metavar='x')
+    parser.add_argument(
+        '-start_time',
+        nargs="?",
+        default=None,
+        type=parse_start_time,
+        required=False,
+        dest='start_time',
+        help='start at this time of the recording (hh:mm:ss.f or '
+        'miliseconds since 00:00:00)',
+        metavar='t')
+    parser.add_argument(
+        '-start_parabola',
+        nargs="?",
+        default=None,
+        type=int,
+        required=False,
+        dest='parabola',
+        help='start at the first datagram of this parabola',
         metavar='i')
+    parser.add_argument(
+        '-loops',
+        nargs="?",
+        default=1,
+        type=int,
+        required=False,
+        dest='loops',
+        help='number of replays of the file, 0 for endless '
+        '(default: %(default)s)',
+        metavar='n')
+    parser.add_argument(
+        '-in_memory',
+        action='store_true',
+        required=False,
+        dest='preload',
+        help='read the file into memory instead of mapping it')
     args = parser.parse_args()
     stream_emulator = NovespaceStreamEmulator(
-        args.filepath, args.ip_address, args.port, args.sleeptime)
+        args.filepath, args.ip_address, args.port, args.sleeptime,
+        policy=args.policy, busy_wait=args.busy_wait, replay=args.replay,
+        speed=args.speed, start_time=args.start_time,
+        parabola=args.parabola, loops=args.loops, preload=args.preload)
     stream_emulator()
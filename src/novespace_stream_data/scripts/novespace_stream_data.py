@@ -31,11 +31,24 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 import argparse
 import os
 
-from novespace_stream_data.receive import NoSpaStream
+from novespace_stream_data.receive import (
+    COMPRESSIONS, METRICS_ADDRESS, OVERFLOW_POLICIES, SHARED_VIEW_NAME,
+    WRITERS, NoSpaStream, PhaseDetector, SharedView, UnixSocketPublisher)
+
+
+def print_event(event):
+    """
+    print an event of the phase detector
+    """
+    print(f"{event['unixtime']}: {event['previous']} -> {event['phase']} "
+          f"(mean {event['mean']:.3f} g, "
+          f"latency {1000 * event['latency']:.3f} ms)")
 
 
 def start_nove_space_datastream(
-        port=3131, filepath=os.getcwd(), printing=False):
+        port=3131, filepath=os.getcwd(), printing=False, *,
+        flush_rows=10, flush_interval=1.0, queue_size=None,
+        batch_size=None, max_datagram_size=65535):
     """
     This function starts the streaming of airplanedata and
     writes them into a csv-file.
@@ -43,11 +56,21 @@ def start_nove_space_datastream(
 
     Inputs:
 
-    :param port (int): Number of Port for streaming (default: 3131)
+    :param port (int): Number of Port for streaming (default: 3131);
+                       several ports can be given on the command line
     :param filepath (str): Path to file in which the csv-file is
                            created (default cwd)
     :param printig (bool): Should the recived data be printed
                            on the console? (default False)
+    :param flush_rows (int): flush the csv file after this number of rows
+    :param flush_interval (float): flush the csv file after this number
+                                   of seconds
+    :param queue_size (int): size of the ring buffers between receiving
+                             and writing (default None: no ring buffers)
+    :param batch_size (int): receive up to this number of queued datagrams
+                             in one wake-up and use kernel timestamps
+                             (default None: one datagram per wake-up)
+    :param max_datagram_size (int): maximal size of a datagram in bytes
     """
     description = "This script receives data stream of airplanedata and "
     description += "writes them into a csv-file."
@@ -59,14 +82,265 @@ def start_nove_space_datastream(
         formatter_class=argparse.RawDescriptionHelpFormatter)
     parser.add_argument(
         '-port',
-        nargs="?",
-        default=port,
+        nargs="+",
+        default=[port],
         type=int,
         required=False,
         dest='port',
-        help='Number of Port for streaming (default: %(default)s)',
+        help='Number of Port for streaming; several ports can be given '
+        '(default: %(default)s)',
         metavar='i')
+    parser.add_argument(
+        '-tagged',
+        action='store_true',
+        required=False,
+        dest='tagged',
+        help='If several ports are given, write all data to one csv-file '
+        'with the additional column "Port". Otherwise a csv-file per port '
+        'is created.')
+    parser.add_argument(
+        '-flush_rows',
+        nargs="?",
+        default=flush_rows,
+        type=int,
+        required=False,
+        dest='flush_rows',
+        help='flush the csv file after this number of rows '
+        '(0 disables; default: %(default)s)',
+        metavar='n')
+    parser.add_argument(
+        '-flush_interval',
+        nargs="?",
+        default=flush_interval,
+        type=float,
+        required=False,
+        dest='flush_interval',
+        help='flush the csv file after this number of seconds '
+        '(default: %(default)s)',
+        metavar='t')
+    parser.add_argument(
+        '-fsync',
+        action='store_true',
+        required=False,
+        dest='fsync',
+        help='call fsync after every flush of the csv file '
+        '(crash safety, but slower)')
+    parser.add_argument(
+        '-queue_size',
+        nargs="?",
+        default=queue_size,
+        type=int,
+        required=False,
+        dest='queue_size',
+        help='If given, the datagrams are passed via ring buffers of this '
+        'size from the receiving thread to a separate writing thread '
+        '(default: %(default)s)',
+        metavar='n')
+    parser.add_argument(
+        '-overflow',
+        nargs="?",
+        default='block',
+        choices=OVERFLOW_POLICIES,
+        required=False,
+        dest='overflow',
+        help='policy if a ring buffer is full (default: %(default)s)')
+    parser.add_argument(
+        '-batch_size',
+        nargs="?",
+        default=batch_size,
+        type=int,
+        required=False,
+        dest='batch_size',
+        help='If given, up to this number of queued datagrams are received '
+        'in one wake-up and the kernel receive timestamps are used where '
+        'available (default: %(default)s)',
+        metavar='n')
+    parser.add_argument(
+        '-max_datagram_size',
+        nargs="?",
+        default=max_datagram_size,
+        type=int,
+        required=False,
+        dest='max_datagram_size',
+        help='maximal size of a datagram in bytes (default: %(default)s)',
+        metavar='n')
+    parser.add_argument(
+        '-capture_format',
+        nargs="?",
+        default='csv',
+        choices=tuple(WRITERS),
+        required=False,
+        dest='capture_format',
+        help='format of the stored data; a binary capture, a journal '
+        '(crash-safe) or a raw capture (fastest, stored as received) can '
+        'be exported with novespace_stream_data_export '
+        '(default: %(default)s)')
+    parser.add_argument(
+        '-commit_interval',
+        nargs="?",
+        default=None,
+        type=float,
+        required=False,
+        dest='commit_interval',
+        help='seconds between the commits (fsync) of a journal; shorter '
+        'loses less data on a loss of power, longer allows higher rates '
+        '(default: flush policy)',
+        metavar='t')
+    parser.add_argument(
+        '-resume',
+        action='store_true',
+        required=False,
+        dest='resume',
+        help='continue the journal of a session which was not closed '
+        'cleanly (e. g. loss of power) instead of starting a new one')
+    parser.add_argument(
+        '-index',
+        action='store_true',
+        required=False,
+        dest='index',
+        help='build an index of the parabolas and flight phases while '
+        'receiving (see novespace_stream_data_index)')
+    parser.add_argument(
+        '-rotate_size',
+        nargs="?",
+        default=None,
+        type=float,
+        required=False,
+        dest='rotate_size',
+        help='start a new csv-file (segment) after this number of MB',
+        metavar='mb')
+    parser.add_argument(
+        '-rotate_minutes',
+        nargs="?",
+        default=None,
+        type=float,
+        required=False,
+        dest='rotate_minutes',
+        help='start a new segment after this number of minutes',
+        metavar='t')
+    parser.add_argument(
+        '-rotate_parabola',
+        action='store_true',
+        required=False,
+        dest='rotate_parabola',
+        help='start a new segment for every parabola')
+    parser.add_argument(
+        '-compression',
+        nargs="?",
+        default=None,
+        choices=tuple(COMPRESSIONS),
+        required=False,
+        dest='compression',
+        help='compress closed segments in the background; a manifest of '
+        'the segments is written next to them (zstd needs python 3.14 or '
+        'the package zstandard)')
+    parser.add_argument(
+        '-stats_log',
+        action='store_true',
+        required=False,
+        dest='stats_log',
+        help='write the received, missing, out-of-order, duplicate and '
+        'dropped datagrams per second to a stats log next to the csv-file')
+    parser.add_argument(
+        '-datagram_interval',
+        nargs="?",
+        default=None,
+        type=float,
+        required=False,
+        dest='datagram_interval',
+        help='miliseconds between the datagrams of the stream to count '
+        'lost datagrams (default: the median of the first steps of the '
+        'column miliseconds since 00:00:00)',
+        metavar='ms')
+    parser.add_argument(
+        '-clock_log',
+        action='store_true',
+        required=False,
+        dest='clock_log',
+        help='fit the offset and the drift between the local clock and the '
+        'column miliseconds since 00:00:00 of the stream while receiving '
+        'and write the model every 10 s to a clock log next to the '
+        'csv-file; the logs are converted with '
+        'novespace_stream_data.analysis.align_clock')
+    parser.add_argument(
+        '-metrics',
+        nargs="?",
+        const=METRICS_ADDRESS,
+        default=None,
+        type=str,
+        required=False,
+        dest='metrics',
+        help='provide live metrics in the Prometheus text format on an '
+        'HTTP endpoint (host:port, default if no address is given: '
+        '%(const)s) or on a Unix stream socket (path)',
+        metavar='address')
+    parser.add_argument(
+        '-detect_events',
+        nargs="?",
+        const='',
+        default=None,
+        type=str,
+        required=False,
+        dest='detect_events',
+        help='detect the flight phases from the measured g-levels and '
+        'print the events; if an address is given (host:port for UDP or '
+        'the path of a Unix datagram socket), the events are also sent '
+        'there',
+        metavar='address')
+    parser.add_argument(
+        '-local_socket',
+        nargs="?",
+        default=None,
+        type=str,
+        required=False,
+        dest='local_socket',
+        help='republish the received data to other processes on this '
+        'computer: every client of this Unix stream socket gets the rows '
+        'as written to the csv-file (e. g. socat - UNIX-CONNECT:path)',
+        metavar='path')
+    parser.add_argument(
+        '-shared_memory',
+        nargs="?",
+        const=SHARED_VIEW_NAME,
+        default=None,
+        type=str,
+        required=False,
+        dest='shared_memory',
+        help='publish the latest record and the recent records to other '
+        'processes on this computer in a shared memory block with this '
+        'name (default if no name is given: %(const)s), see '
+        'novespace_stream_data.receive.SharedViewReader',
+        metavar='name')
     args = parser.parse_args()
-    datastream = NoSpaStream(filepath, args.port, printing)
-    datastream.start_streaming()
-    datastream.streaming_thread.join()
+    datastream = NoSpaStream(
+        filepath, args.port, printing, flush_rows=args.flush_rows,
+        flush_interval=args.flush_interval, fsync=args.fsync,
+        queue_size=args.queue_size, overflow=args.overflow,
+        batch_size=args.batch_size,
+        max_datagram_size=args.max_datagram_size, tagged=args.tagged,
+        capture_format=args.capture_format, index=args.index,
+        stats_log=args.stats_log,
+        datagram_interval=args.datagram_interval, metrics=args.metrics,
+        rotate_bytes=(None if args.rotate_size is None
+                      else int(args.rotate_size * 2**20)),
+        rotate_seconds=(None if args.rotate_minutes is None
+                        else 60 * args.rotate_minutes),
+        rotate_parabola=args.rotate_parabola, compression=args.compression,
+        commit_interval=args.commit_interval, resume=args.resume,
+        clock_log=args.clock_log)
+    if args.detect_events is not None:
+        datastream.add_record_handler(PhaseDetector(
+            callback=print_event, address=args.detect_events or None))
+    if args.local_socket is not None:
+        datastream.subscribe(UnixSocketPublisher(args.local_socket),
+                             name='local_socket')
+    shared_view = None
+    if args.shared_memory is not None:
+        shared_view = SharedView(args.shared_memory)
+        datastream.add_parsed_handler(shared_view.add_record)
+    try:
+        datastream.start_streaming()
+        datastream.streaming_thread.join()
+    finally:
+        if shared_view is not None:
+            shared_view.close()
@@ -0,0 +1,132 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+This lists the parabolas and flight phases of files of the receiver.
+
+Copyright (C) 2026 Daniel Maier (University of Greifswald),
+                   Daniel Mohr (University of Greifswald),
+                   Thomas Villatte (Novespace)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import argparse
+
+from novespace_stream_data.receive import get_index, read_segments
+
+
+def format_ms(milliseconds):
+    """
+    :return: miliseconds since 00:00:00 as hh:mm:ss.f
+    """
+    if milliseconds < 0:
+        return '--:--:--.-'
+    seconds = milliseconds / 1000
+    return (f'{int(seconds // 3600):02d}:{int(seconds % 3600 // 60):02d}:'
+            f'{seconds % 60:04.1f}')
+
+
+def print_phases(index, parabolas=None, announcement=None):
+    """
+    Print the flight phases per parabola.
+
+    :param index: ParabolaIndex
+    :param parabolas: If given, only these parabolas are listed.
+    :param announcement: If given, only this flight phase is listed.
+    """
+    for parabola, segments in index.phases().items():
+        if (parabolas is not None) and (parabola not in parabolas):
+            continue
+        print(f'parabola {parabola}')
+        for segment in segments:
+            if announcement not in (None, segment['announcement']):
+                continue
+            duration = (segment['last_ms'] - segment['first_ms']) % 86400000
+            print(f"  {segment['announcement']:<20} "
+                  f"{format_ms(segment['first_ms'])} - "
+                  f"{format_ms(segment['last_ms'])} "
+                  f"({duration / 1000:.1f} s) "
+                  f"rows {segment['first_row']}-"
+                  f"{segment['first_row'] + segment['rows'] - 1}")
+
+
+def list_parabolas():
+    """
+    This function lists the parabolas and flight phases of files of
+    the receiver (csv-files or binary captures) with their time spans.
+
+    The index (`<file>.index.json`) is built if it does not exist.
+    """
+    description = "This script lists the parabolas and flight phases "
+    description += "of files of the receiver. An index is built next to "
+    description += "every file if necessary."
+    epilog = "Date: 2026-10-17\n"
+    epilog += "License: GPL-3.0-or-later"
+    parser = argparse.ArgumentParser(
+        description=description,
+        epilog=epilog,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        'files',
+        nargs="+",
+        type=str,
+        help='csv-files or binary captures of the receiver',
+        metavar='f')
+    parser.add_argument(
+        '-parabola',
+        nargs="+",
+        default=None,
+        type=int,
+        required=False,
+        dest='parabola',
+        help='only list these parabolas (default: all)',
+        metavar='i')
+    parser.add_argument(
+        '-announcement',
+        nargs="?",
+        default=None,
+        type=str,
+        required=False,
+        dest='announcement',
+        help='only list this flight phase, e. g. "STEADY FLIGHT"',
+        metavar='s')
+    parser.add_argument(
+        '-rows',
+        action='store_true',
+        required=False,
+        dest='rows',
+        help='print the records of the listed flight phases '
+        '(only the records of the phases are read)')
+    parser.add_argument(
+        '-rebuild',
+        action='store_true',
+        required=False,
+        dest='rebuild',
+        help='build the index also if it exists')
+    args = parser.parse_args()
+    for path in args.files:
+        index = get_index(path, rebuild=args.rebuild)
+        if args.rows:
+            segments = [
+                segment for segment in index.segments
+                if ((args.parabola is None) or
+                    (segment['parabola'] in args.parabola)) and
+                (args.announcement in (None, segment['announcement']))]
+            for unixtime, data_str in read_segments(path, segments):
+                print(f'{unixtime};{data_str}')
+        else:
+            print(f'{path}: {index.rows} rows')
+            print_phases(index, args.parabola, args.announcement)
@@ -12,7 +12,107 @@ from pathlib import Path
 from tkinter import filedialog, messagebox
 
 
-from novespace_stream_data.receive import NoSpaStream
+from novespace_stream_data.receive import DisplayBuffer, NoSpaStream
+
+try:
+    import numpy
+    # pylint: disable=ungrouped-imports
+    from novespace_stream_data.analysis import LiveTraces
+except ImportError:
+    # the live plot needs numpy
+    LiveTraces = None
+
+PLOT_COLORS = {'jx': 'red', 'jy': 'green', 'jz': 'blue',
+               'pressure': 'black'}
+PLOT_REGIONS = ((('jx', 'jy', 'jz'), 'g'), (('pressure',), 'mbar'))
+
+
+class LivePlot():
+    """
+    This class plots the traces of
+    :class:`novespace_stream_data.analysis.LiveTraces` on a Tk canvas:
+    the g-levels in the upper and the pressure in the lower half.
+
+    The traces are reduced to the minimum and maximum per pixel column
+    and the line items of the canvas are created once and only get new
+    coordinates, so a refresh costs the same however long the flight is.
+    """
+
+    def __init__(self, master, traces, width=600, height=240):
+        """
+        :param master: parent widget
+        :param traces: instance of LiveTraces
+        :param width: initial width of the canvas
+        :param height: initial height of the canvas
+        """
+        self.traces = traces
+        self.canvas = tk.Canvas(master, width=width, height=height,
+                                background='white')
+        self.lines = {
+            channel: self.canvas.create_line(
+                0, 0, 0, 0, fill=PLOT_COLORS.get(channel, 'gray'))
+            for channel in traces.channels}
+        self.labels = [self.canvas.create_text(2, 2, anchor='nw', text='')
+                       for _ in PLOT_REGIONS]
+        self.drawn = (None, None, None)
+
+    def refresh(self):
+        """
+        Redraw the traces if there are new samples or the canvas was
+        resized.
+        """
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        if (self.drawn == (self.traces.count, width, height)) or \
+                (width < 2):
+            return
+        self.drawn = (self.traces.count, width, height)
+        minima, maxima = self.traces.decimate(width)
+        size = height // len(PLOT_REGIONS)
+        for number, (channels, unit) in enumerate(PLOT_REGIONS):
+            channels = [channel for channel in channels
+                        if channel in self.traces.channels]
+            rows = [self.traces.channels.index(channel)
+                    for channel in channels]
+            self.draw_region(number, size, unit,
+                             dict(zip(channels, minima[rows])),
+                             dict(zip(channels, maxima[rows])))
+
+    def draw_region(self, number, size, unit, minima, maxima):
+        """
+        Update the label and the line items of one region of the plot.
+
+        :param number: number of the region in PLOT_REGIONS
+        :param size: height of a region in pixels
+        :param unit: unit of the values
+        :param minima: dictionary with the minima per column per channel
+        :param maxima: dictionary with the maxima per column per channel
+        """
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        finite = [values[numpy.isfinite(values)]
+                  for values in (*minima.values(), *maxima.values())]
+        if not any(len(values) for values in finite):
+            return
+        low = min(values.min() for values in finite if len(values))
+        high = max(values.max() for values in finite if len(values))
+        self.canvas.coords(self.labels[number], 2, number * size + 2)
+        self.canvas.itemconfig(self.labels[number],
+                               text=f'{low:.2f} .. {high:.2f} {unit}')
+        # y of a value; the label is kept free
+        bottom = (number + 1) * size - 2
+        scale = (size - 20) / ((high - low) or 1.0)
+        for channel, lowest in minima.items():
+            columns = numpy.flatnonzero(numpy.isfinite(lowest))
+            if len(columns) < 2:
+                continue
+            # vertical strokes from minimum to maximum of every column
+            points = numpy.empty((len(columns), 4))
+            points[:, 0] = points[:, 2] = columns
+            points[:, 1] = bottom - scale * (lowest[columns] - low)
+            points[:, 3] = bottom - scale * (
+                maxima[channel][columns] - low)
+            self.canvas.coords(self.lines[channel],
+                               *points.ravel().tolist())
 
 
 class GUINoSpaStream(NoSpaStream):
@@ -23,18 +123,45 @@ class GUINoSpaStream(NoSpaStream):
 
     This stream data was first provided during
     45. DLR parabolic flight campaign in October 2025.
+
+    The received data is handed to the Tk main loop by a
+    :class:`DisplayBuffer` and displayed at a fixed frame rate, so the
+    display never holds up the receiving.
     """
     # pylint: disable = R0902
 
-    def __init__(self, csv_path, inputport=3131, printing=False):
+    def __init__(self, csv_path, inputport=3131, printing=False, *,
+                 frame_rate=10, lines_per_frame=20, scrollback=1000,
+                 summary=False, plot_samples=3000):
         """
         :param csv_path: path to store the data
         :param inputport: port to listen.
         :param printing: If set to True the data is not only logged, but also
                          printed on the console (stdout).
+        :param frame_rate: refreshs of the display per second
+        :param lines_per_frame: only the latest lines received since the
+                                last refresh are displayed
+        :param scrollback: maximal number of lines kept in the text box
+        :param summary: If set to True, only a summary line (g-levels,
+                        parabola, rate) is displayed instead of the data.
+        :param plot_samples: number of the latest samples plotted live
+                             (None disables the plot; it needs numpy)
         """
         super().__init__(csv_path, inputport, printing)
         self.display_data_callback = self.display_data
+        self.display = DisplayBuffer(lines_per_frame)
+        self.frame_interval = max(1, int(1000 / frame_rate))
+        self.scrollback = scrollback
+        self.summary = summary
+        self.root = None
+        self.summary_only = None
+        self.label_summary = None
+        self.check_summary = None
+        self.traces = None
+        self.plot = None
+        if (LiveTraces is not None) and plot_samples:
+            self.traces = LiveTraces(plot_samples)
+            self.add_parsed_handler(self.traces.add_record)
         self.label_directory = None
         self.button_browse = None
         self.label_port = None
@@ -51,6 +178,7 @@ class GUINoSpaStream(NoSpaStream):
         """
         root = tk.Tk()
         root.title("UDP Data Receiver")
+        self.root = root
 
         # Configuration to allow the window to expand
         root.grid_rowconfigure(0, weight=0)  # Leave the first row for labels
@@ -83,6 +211,24 @@ class GUINoSpaStream(NoSpaStream):
         self.text_box.grid(
             row=3, column=0, columnspan=3, pady=10, padx=10, sticky="nsew")
 
+        # Summary of the latest data
+        self.label_summary = tk.Label(root, text="", anchor="w")
+        self.label_summary.grid(
+            row=4, column=0, columnspan=3, pady=5, padx=10, sticky="w")
+
+        self.summary_only = tk.BooleanVar(root, value=self.summary)
+        self.check_summary = tk.Checkbutton(
+            root, text="Show only a summary", variable=self.summary_only)
+        self.check_summary.grid(row=2, column=1, pady=5, padx=10, sticky="w")
+
+        # Live plot of the g-levels and the pressure
+        if self.traces is not None:
+            root.grid_rowconfigure(5, weight=1)
+            self.plot = LivePlot(root, self.traces)
+            self.plot.canvas.grid(
+                row=5, column=0, columnspan=3, pady=10, padx=10,
+                sticky="nsew")
+
         # Start and Stop buttons
         self.button_start = tk.Button(
             root, text="Start data collection", command=self.start_receiving)
@@ -101,6 +247,7 @@ class GUINoSpaStream(NoSpaStream):
         self.label_instruction.grid(row=0, column=0, pady=5, padx=10)
 
         # Start the graphical interface
+        root.after(self.frame_interval, self.refresh_display)
         root.mainloop()
 
     def browse_directory(self):
@@ -152,11 +299,37 @@ class GUINoSpaStream(NoSpaStream):
 
     def display_data(self, data_str):
         """
-        display data in GUI
+        pass data to the display in the GUI
+
+        This is called by the receiving thread; the data is displayed
+        by :meth:`refresh_display`.
+        """
+        self.display.add(data_str)
+
+    def refresh_display(self):
+        """
+        display the data received since the last refresh in the GUI
+
+        This runs in the Tk main loop at the frame rate.
         """
-        # Update the interface with the received data
-        self.text_box.insert(tk.END, f"Data received: {data_str}\n")
-        self.text_box.yview(tk.END)  # Scroll vers la fin de la fenêtre
+        lines, skipped = self.display.take()
+        if lines and not self.summary_only.get():
+            text = ''.join(f"Data received: {line}\n" for line in lines)
+            if skipped:
+                text = f"({skipped} lines not displayed)\n" + text
+            # Update the interface with the received data at once
+            self.text_box.insert(tk.END, text)
+            # keep the scrollback bounded
+            number = int(
+                self.text_box.index('end-1c').split('.', maxsplit=1)[0])
+            if number > self.scrollback:
+                self.text_box.delete(
+                    '1.0', f'{number - self.scrollback}.0')
+            self.text_box.yview(tk.END)  # Scroll vers la fin de la fenêtre
+        self.label_summary.config(text=self.display.get_summary() or "")
+        if self.plot is not None:
+            self.plot.refresh()
+        self.root.after(self.frame_interval, self.refresh_display)
 
 
 def main():
@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Fixtures of the tests.
+"""
+
+import socket
+import time
+
+import pytest
+
+
+def free_ports(number):
+    """
+    :param number: number of ports
+    :return: list of currently free UDP ports
+    """
+    sockets = [socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+               for _ in range(number)]
+    for sock in sockets:
+        sock.bind(('', 0))
+    ports = [sock.getsockname()[1] for sock in sockets]
+    for sock in sockets:
+        sock.close()
+    return ports
+
+
+@pytest.fixture
+def udp_port():
+    """
+    :return: a currently free UDP port
+    """
+    return free_ports(1)[0]
+
+
+@pytest.fixture
+def udp_ports():
+    """
+    :return: two currently free UDP ports
+    """
+    return free_ports(2)
+
+
+@pytest.fixture
+def wait_until():
+    """
+    :return: function waiting until a condition is true (at most timeout
+             seconds) and returning the condition
+    """
+    def wait(condition, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not condition() and (time.monotonic() < deadline):
+            time.sleep(0.01)
+        return condition()
+    return wait
@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Tests of :class:`novespace_stream_data.receive.AsyncNoSpaStream` on
+loopback.
+"""
+
+import asyncio
+import socket
+
+import pytest
+
+from novespace_stream_data.receive import AsyncNoSpaStream
+
+DATAGRAM = '36000000;00:00.0;0.18307;-0.013731;0.950486;19;46.2;944;0;' \
+    'STEADY FLIGHT'
+
+
+async def receive(stream, port, number):
+    """
+    Send datagrams and collect them with the iterator of the stream.
+
+    :return: list of the received records
+    """
+    await stream.start_streaming()
+    received = []
+
+    async def collect():
+        async for record in stream.records():
+            received.append(record)
+            if len(received) == number:
+                break
+    task = asyncio.ensure_future(collect())
+    await asyncio.sleep(0)
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        for _ in range(number):
+            sock.sendto(DATAGRAM.encode(), ('localhost', port))
+    await asyncio.wait_for(task, 5.0)
+    await stream.end_streaming()
+    return received
+
+
+def test_records(tmp_path, udp_port):
+    """
+    Received datagrams are yielded by records and written to the file.
+    """
+    stream = AsyncNoSpaStream(str(tmp_path), udp_port)
+    received = asyncio.run(receive(stream, udp_port, 3))
+    assert [(data_str, port) for _, data_str, port in received] == \
+        [(DATAGRAM, udp_port)] * 3
+    assert not stream.is_running()
+    with open(stream.csv_files[udp_port], encoding='utf-8') as \
+            filedescriptor:
+        assert len(filedescriptor.read().splitlines()) == 4
+
+
+def test_port_in_use(tmp_path, udp_port):
+    """
+    If a later port is in use, the ports opened before are closed.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as blocker:
+        blocker.bind(('', 0))
+        used = blocker.getsockname()[1]
+        stream = AsyncNoSpaStream(str(tmp_path), [udp_port, used])
+        with pytest.raises(OSError):
+            asyncio.run(stream.start_streaming())
+    assert not stream.is_running()
+    assert not stream.writers
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(('', udp_port))
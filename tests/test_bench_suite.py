@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Tests of benchmarks/bench_suite.py.
+"""
+
+import json
+import math
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BENCHMARKS = Path(__file__).parents[1] / 'benchmarks'
+
+sys.path.insert(0, str(BENCHMARKS))
+# pylint: disable=wrong-import-position,import-error
+from bench_suite import finite, flatten, percentile  # noqa: E402
+
+from novespace_stream_data.receive import Histogram  # noqa: E402
+
+
+def test_helpers():
+    """
+    Percentiles, JSON-safe results and flattened keys.
+    """
+    histogram = Histogram((1.0, 2.0))
+    assert math.isnan(percentile(histogram, 0.5))
+    for value in (0.5, 1.5, 1.5, 3.0):
+        histogram.observe(value)
+    assert percentile(histogram, 0.5) == 1.5
+    assert percentile(histogram, 0.99) == 2.0
+    assert finite({'a': [math.nan, 1.0], 'b': {'c': math.inf}}) == \
+        {'a': [None, 1.0], 'b': {'c': None}}
+    assert flatten({'a': {'b': 1, 'steps': [1]}, 'c': 2.5, 'd': 'x'}) == \
+        {'a.b': 1, 'c': 2.5}
+
+
+def test_suite(tmp_path, udp_port):
+    """
+    A short run writes the results as JSON and compares them.
+    """
+    output = tmp_path / 'results.json'
+    command = [sys.executable, str(BENCHMARKS / 'bench_suite.py'),
+               '-benchmarks', 'latency', 'write_path', 'reader',
+               '-rows', '2000', '-duration', '0.3',
+               '-port', str(udp_port - 1)]
+    environment = dict(os.environ, PYTHONPATH=os.pathsep.join(
+        [str(BENCHMARKS.parent / 'src'), os.environ.get('PYTHONPATH', '')]))
+    subprocess.run(command + ['-output', str(output)], check=True,
+                   env=environment, capture_output=True, timeout=120)
+    with open(output, encoding='utf-8') as filedescriptor:
+        results = json.load(filedescriptor)['results']
+    assert results['latency']['rows'] > 0
+    assert results['write_path']['raw_cpu_per_record_us'] > 0
+    assert results['reader']['csv_rows_per_second'] > 0
+    compared = subprocess.run(
+        command + ['-compare', str(output)], check=True, env=environment,
+        capture_output=True, text=True, timeout=120).stdout
+    assert 'compared with version' in compared
@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Tests of the binary capture format
+(:mod:`novespace_stream_data.receive.binary_capture`).
+"""
+
+import os
+
+import pytest
+
+from novespace_stream_data.receive import binary_capture
+from novespace_stream_data.receive import (
+    BinaryCaptureWriter, BufferedCSVWriter, CSV_FIELDNAMES, export_csv,
+    iter_binary_capture, load_binary_capture)
+
+DATAGRAMS = [
+    '34439807;33:59.8;0.18307;-0.013731;0.950486;19;46.2;944;0;'
+    'STEADY FLIGHT',
+    '34439908;33:59.9;0.181535;-0.013477;0.947214;19;46.2;944;0;'
+    'STEADY FLIGHT',
+    # unusual formatting is stored as original datagram
+    '34440006;34:00.0;0.1817250;-0.012534;0.949766;19;46.20;944;1;PULL UP',
+    # not parseable
+    'invalid;datagram',
+    '34440106;34:00.1;1e-05;-0.0;1.8;19;46.2;944;1;PULL UP']
+
+
+def write(writer_class, path, datagrams, **kwargs):
+    """
+    Write datagrams with consecutive timestamps.
+    """
+    writer = writer_class(path, CSV_FIELDNAMES, **kwargs)
+    writer.open()
+    for number, data_str in enumerate(datagrams):
+        writer.write_record(1760428800.0 + number / 10, data_str)
+    writer.close()
+    return writer
+
+
+def test_round_trip(tmp_path):
+    """
+    Every datagram is reproduced exactly.
+    """
+    path = tmp_path / 'capture.nsb'
+    write(BinaryCaptureWriter, path, DATAGRAMS)
+    assert [data_str for _, data_str in iter_binary_capture(path)] == \
+        DATAGRAMS
+    assert [data_str for _, data_str in iter_binary_capture(
+        path, 1, 3)] == DATAGRAMS[1:3]
+
+
+def test_export_equals_csv(tmp_path):
+    """
+    The exported csv file is identical to the one of the csv writer.
+    """
+    write(BinaryCaptureWriter, tmp_path / 'capture.nsb', DATAGRAMS)
+    write(BufferedCSVWriter, tmp_path / 'direct.csv', DATAGRAMS)
+    assert export_csv(tmp_path / 'capture.nsb', tmp_path / 'export.csv',
+                      CSV_FIELDNAMES) == len(DATAGRAMS)
+    with open(tmp_path / 'direct.csv', 'rb') as direct, \
+            open(tmp_path / 'export.csv', 'rb') as exported:
+        assert direct.read() == exported.read()
+
+
+def test_torn_record(tmp_path):
+    """
+    A torn record at the end is removed when appending.
+    """
+    path = tmp_path / 'capture.nsb'
+    write(BinaryCaptureWriter, path, DATAGRAMS[:2])
+    os.truncate(path, os.path.getsize(path) - 5)
+    write(BinaryCaptureWriter, path, DATAGRAMS[2:])
+    assert [data_str for _, data_str in iter_binary_capture(path)] == \
+        DATAGRAMS[:1] + DATAGRAMS[2:]
+
+
+def test_load_binary_capture(tmp_path):
+    """
+    The capture is mapped into typed numpy columns.
+    """
+    pytest.importorskip('numpy')
+    path = tmp_path / 'capture.nsb'
+    write(BinaryCaptureWriter, path, DATAGRAMS)
+    records, strings = load_binary_capture(path)
+    assert len(records) == len(DATAGRAMS)
+    assert records['ms'].tolist()[2:4] == [34440006, -1]
+    assert records['parabola'].tolist() == [0, 0, 1, -1, 1]
+    assert strings[records['announcement'][4]] == 'PULL UP'
+    assert strings[records['raw'][3]] == 'invalid;datagram'
+
+
+def test_bounded_string_ids(tmp_path, monkeypatch):
+    """
+    Original datagrams are not looked up and only MAX_INTERNED strings
+    are, so the memory of the writer is bounded.
+    """
+    monkeypatch.setattr(binary_capture, 'MAX_INTERNED', 2)
+    datagrams = [f'invalid;datagram;{number}' for number in range(5)] + \
+        [DATAGRAMS[0].replace('STEADY FLIGHT', f'PHASE {number % 3}')
+         for number in range(6)]
+    path = tmp_path / 'capture.nsb'
+    writer = write(BinaryCaptureWriter, path, datagrams)
+    assert list(writer.string_ids) == ['', 'PHASE 0']
+    assert [data_str for _, data_str in iter_binary_capture(path)] == \
+        datagrams
+    writer.open()
+    writer.write_record(1760428900.0, datagrams[-1])
+    writer.close()
+    assert len(writer.string_ids) == 2
+    assert [data_str for _, data_str in iter_binary_capture(path)] == \
+        datagrams + datagrams[-1:]
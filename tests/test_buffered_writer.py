@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Tests of :class:`novespace_stream_data.receive.BufferedCSVWriter`.
+"""
+
+import os
+
+from novespace_stream_data.receive import BufferedCSVWriter, CSV_FIELDNAMES
+
+DATAGRAM = '36000000;00:00.0;0.18307;-0.013731;0.950486;19;46.2;944;0;' \
+    'STEADY FLIGHT'
+
+
+def read_lines(path):
+    """
+    :return: lines of a file
+    """
+    with open(path, encoding='utf-8') as filedescriptor:
+        return filedescriptor.read().splitlines()
+
+
+def test_flush_rows(tmp_path):
+    """
+    The rows reach the file after flush_rows records.
+    """
+    path = tmp_path / 'log.csv'
+    writer = BufferedCSVWriter(path, CSV_FIELDNAMES, flush_rows=3,
+                               flush_interval=None)
+    writer.open()
+    assert len(read_lines(path)) == 1
+    writer.write_record(1.5, DATAGRAM)
+    writer.write_record(2.5, DATAGRAM)
+    assert len(read_lines(path)) == 1
+    writer.write_record(3.5, DATAGRAM)
+    assert read_lines(path)[1:] == [f'{unixtime};{DATAGRAM}'
+                                    for unixtime in (1.5, 2.5, 3.5)]
+    writer.close()
+
+
+def test_close_flushes(tmp_path):
+    """
+    Closing flushes pending rows; later records are refused.
+    """
+    path = tmp_path / 'log.csv'
+    writer = BufferedCSVWriter(path, CSV_FIELDNAMES, flush_rows=100)
+    writer.open()
+    assert writer.write_record(1.0, DATAGRAM)
+    writer.close()
+    writer.close()
+    assert not writer.write_record(2.0, DATAGRAM)
+    assert read_lines(path) == [';'.join(CSV_FIELDNAMES),
+                                f'1.0;{DATAGRAM}']
+
+
+def test_offset(tmp_path):
+    """
+    The offset is the size of the file in bytes, also for non-ascii rows.
+    """
+    path = tmp_path / 'log.csv'
+    writer = BufferedCSVWriter(path, CSV_FIELDNAMES)
+    writer.open()
+    writer.write_record(1.0, DATAGRAM.replace('STEADY', 'STÉADY'))
+    writer.close()
+    assert writer.offset == os.path.getsize(path)
+    assert writer.rows_written == 1
+
+
+def test_append(tmp_path):
+    """
+    Opening without header appends to an existing file.
+    """
+    path = tmp_path / 'log.csv'
+    for unixtime, header in ((1.0, True), (2.0, False)):
+        writer = BufferedCSVWriter(path, CSV_FIELDNAMES)
+        writer.open(write_header=header)
+        writer.write_record(unixtime, DATAGRAM)
+        writer.close()
+    assert len(read_lines(path)) == 3
@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Tests of :mod:`novespace_stream_data.receive.bus`.
+"""
+
+import socket
+import threading
+
+from novespace_stream_data.receive import StreamBus, UnixSocketPublisher
+
+DATAGRAM = '36000000;00:00.0;0.18307;-0.013731;0.950486;19;46.2;944;0;' \
+    'STEADY FLIGHT'
+
+
+def test_subscribers():
+    """
+    Every subscriber gets the records in order; a slow subscriber only
+    loses its own entries.
+    """
+    bus = StreamBus()
+    fast = []
+    slow = []
+    release = threading.Event()
+
+    def slow_handler(unixtime, data_str, port):
+        release.wait(5.0)
+        slow.append((unixtime, data_str, port))
+
+    bus.subscribe(lambda *item: fast.append(item), name='fast')
+    bus.subscribe(slow_handler, capacity=2, name='slow')
+    for number in range(10):
+        bus(100.0 + number, DATAGRAM, 3131)
+    statistics = bus.get_statistics()
+    release.set()
+    bus.close()
+    assert fast == [(100.0 + number, DATAGRAM, 3131)
+                    for number in range(10)]
+    assert statistics['published'] == 10
+    assert statistics['subscribers']['fast']['dropped'] == 0
+    assert statistics['subscribers']['slow']['dropped'] >= 7
+    # the latest records are kept (policy drop-oldest)
+    assert slow[-1][0] == 109.0
+    assert not bus.get_statistics()['subscribers']
+
+
+def test_unix_socket_publisher(tmp_path, wait_until):
+    """
+    Connected clients get the records as lines of the csv file.
+    """
+    # pylint: disable=redefined-outer-name
+    path = tmp_path / 'records.sock'
+    publisher = UnixSocketPublisher(path)
+    publisher(100.0, DATAGRAM)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(path))
+        publisher.poll()
+        assert publisher.get_statistics()['clients'] == 1
+        publisher(101.0, DATAGRAM)
+        publisher(102.0, DATAGRAM)
+        received = bytearray()
+        client.settimeout(5.0)
+        while received.count(b'\n') < 2:
+            received += client.recv(4096)
+    assert received.decode().splitlines() == \
+        [f'101.0;{DATAGRAM}', f'102.0;{DATAGRAM}']
+    assert wait_until(lambda: publisher(103.0, DATAGRAM) or
+                      not publisher.clients)
+    assert publisher.get_statistics()['disconnected'] == 1
+    publisher.close()
+    assert not path.exists()
+
+
+def test_slow_client(tmp_path):
+    """
+    A client which does not read is disconnected after max_pending bytes.
+    """
+    path = tmp_path / 'records.sock'
+    publisher = UnixSocketPublisher(path, max_pending=4096)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(path))
+        publisher.poll()
+        for number in range(100000):
+            publisher(100.0 + number, DATAGRAM)
+            if not publisher.clients:
+                break
+        assert publisher.get_statistics()['disconnected'] == 1
+    publisher.close()
@@ -0,0 +1,118 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Tests of the clock alignment
+(:mod:`novespace_stream_data.receive.clock_sync` and
+:mod:`novespace_stream_data.analysis.clock`).
+"""
+
+import numpy
+import pytest
+
+from novespace_stream_data.analysis import (
+    align_clock, fit_clock, read_clock_log)
+from novespace_stream_data.receive import ClockSync
+from novespace_stream_data.receive.clock_sync import theil_sen, wrap_ms
+
+DAY = 86400000
+# local time of the first datagram without delay
+START = 1760428800.0
+DRIFT = 50e-6
+# least network delay in seconds
+DELAY = 0.002
+
+
+@pytest.fixture(name='stream')
+def fixture_stream():
+    """
+    :return: tuple (column ms, local timestamps, local times without
+             jitter) of 10 minutes at 10 Hz over midnight with drift and
+             exponential jitter
+    """
+    generator = numpy.random.default_rng(3)
+    elapsed = numpy.arange(6000) / 10
+    milliseconds = (DAY - 300000 + numpy.arange(6000) * 100) % DAY
+    exact = START + elapsed * (1 + DRIFT) + DELAY
+    unixtime = exact + generator.exponential(0.005, len(elapsed))
+    # some outliers far off
+    unixtime[::500] += 0.5
+    return milliseconds, unixtime, exact
+
+
+def test_theil_sen():
+    """
+    The fit ignores outliers.
+    """
+    points = [(x, 2 * x + 1) for x in range(10)]
+    points[3] = (3, 100)
+    slope, intercept = theil_sen(points)
+    assert slope == pytest.approx(2)
+    assert intercept == pytest.approx(1)
+    assert theil_sen([(1, 5), (1, 7)]) == (0.0, 6)
+
+
+def test_wrap_ms():
+    """
+    Differences are mapped to half a day around midnight.
+    """
+    assert wrap_ms(100) == 100
+    assert wrap_ms(-100) == -100
+    assert wrap_ms(100 - DAY) == 100
+    assert wrap_ms(DAY - 100) == -100
+
+
+def test_clock_sync(stream, tmp_path):
+    """
+    The model converts the stream time to the local time without jitter;
+    the clock log converts the log afterwards.
+    """
+    milliseconds, unixtime, exact = stream
+    clock = ClockSync(tmp_path / 'log.clock.csv')
+    for local, stream_ms in zip(unixtime, milliseconds):
+        clock.add(float(local), int(stream_ms))
+    statistics = clock.get_statistics()
+    clock.close()
+    assert statistics['samples'] == 6000
+    assert statistics['blocks'] == 30
+    assert statistics['drift_ppm'] == pytest.approx(1e6 * DRIFT, abs=2)
+    assert clock.to_local(int(milliseconds[-1])) == \
+        pytest.approx(exact[-1], abs=0.5e-3)
+    assert clock.to_stream(exact[-1]) == \
+        pytest.approx(milliseconds[-1], abs=0.5)
+    models = read_clock_log(tmp_path / 'log.clock.csv')
+    assert len(models['unixtime']) == 60
+    aligned = align_clock({'ms': milliseconds, 'unixtime': unixtime},
+                          models)
+    # the first block is converted without drift
+    assert numpy.abs(aligned - exact)[100:].max() < 1e-3
+
+
+def test_reset():
+    """
+    A jump of the stream time starts a new fit.
+    """
+    clock = ClockSync(max_gap=1000)
+    clock.add(START, 1000)
+    clock.add(START + 0.1, 1100)
+    clock.add(START + 0.2, 50000)
+    assert clock.get_statistics()['resets'] == 1
+    assert clock.get_model()['reference_ms'] == 50000
+    assert ClockSync().to_local(1000) is None
+
+
+def test_fit_clock(stream):
+    """
+    The whole log is fitted at once; invalid rows are ignored.
+    """
+    milliseconds, unixtime, exact = stream
+    milliseconds = milliseconds.copy()
+    milliseconds[7] = -1
+    models = fit_clock(milliseconds, unixtime)
+    assert models['drift_ppm'][0] == pytest.approx(1e6 * DRIFT, abs=2)
+    aligned = align_clock({'ms': milliseconds, 'unixtime': unixtime})
+    assert numpy.isnan(aligned[7])
+    aligned[7] = exact[7]
+    assert numpy.abs(aligned - exact).max() < 1e-3
+    assert fit_clock([-1], [START]) is None
@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Tests of :class:`novespace_stream_data.receive.DisplayBuffer`.
+"""
+
+from novespace_stream_data.receive import (
+    DisplayBuffer, add_sequence, format_summary)
+
+DATAGRAM = '36000000;00:00.0;0.18307;-0.013731;0.950486;19;46.2;944;3;' \
+    'STEADY FLIGHT'
+
+
+def test_take():
+    """
+    Every frame takes the lines added since the last frame.
+    """
+    buffer = DisplayBuffer(lines=5)
+    assert buffer.take() == ([], 0)
+    for number in range(3):
+        buffer.add(f'line {number}')
+    assert buffer.take() == (['line 0', 'line 1', 'line 2'], 0)
+    assert buffer.take() == ([], 0)
+    assert buffer.latest == 'line 2'
+
+
+def test_coalesce():
+    """
+    If the display is slower than the stream, only the latest lines are
+    shown and the older ones are counted as skipped.
+    """
+    buffer = DisplayBuffer(lines=3)
+    for number in range(10):
+        buffer.add(f'line {number}')
+    assert buffer.take() == (['line 7', 'line 8', 'line 9'], 7)
+    buffer.add('line 10')
+    assert buffer.take() == (['line 10'], 0)
+    assert (buffer.received, buffer.shown) == (11, 11)
+
+
+def test_summary():
+    """
+    The summary shows the parabola, the phase and the g-levels of the
+    latest datagram, also with timestamp, port and sequence number.
+    """
+    expected = 'parabola 3  STEADY FLIGHT  jx +0.18  jy -0.01  jz +0.95 g'
+    assert format_summary(DATAGRAM) == expected
+    assert format_summary(f'3131;1760428800.0;{DATAGRAM}', 10.0) == \
+        expected + '  10.0 datagrams/s'
+    assert format_summary(
+        add_sequence(f'1760428800.0;{DATAGRAM}'.encode(), 'a',
+                     1).decode()) == expected
+    assert format_summary('invalid;datagram') is None
+    buffer = DisplayBuffer(rate_interval=0.0)
+    assert buffer.get_summary() is None
+    buffer.add(DATAGRAM)
+    buffer.take()
+    assert buffer.get_summary().startswith(expected)
@@ -0,0 +1,126 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Tests of the crash-safe journal
+(:mod:`novespace_stream_data.receive.journal`).
+"""
+
+import os
+
+from novespace_stream_data.receive import (
+    BufferedCSVWriter, CSV_FIELDNAMES, JournalWriter, export_journal,
+    find_resumable, iter_journal, recover_journal)
+
+DATAGRAMS = [
+    f'{36000000 + 100 * number};00:00.0;0.1;0.0;1.0;19;46.2;944;0;'
+    'STEADY FLIGHT' for number in range(6)]
+
+
+def records(path):
+    """
+    :return: list of tuples (unixtime, datagram) of a journal
+    """
+    return [(unixtime, data_str)
+            for _, _, unixtime, data_str in iter_journal(path)]
+
+
+def crash(path, committed, uncommitted):
+    """
+    Write datagrams to a journal without closing it (like a loss of
+    power after the last commit).
+
+    :return: size of the journal at the last commit
+    """
+    writer = JournalWriter(path, CSV_FIELDNAMES, flush_rows=0,
+                           flush_interval=None)
+    writer.open()
+    for number, data_str in enumerate(committed + uncommitted):
+        writer.write_record(100.0 + number, data_str)
+        if number == len(committed) - 1:
+            writer.flush()
+    size = writer.offset - sum(len(data_str) + 16
+                               for data_str in uncommitted)
+    # the uncommitted records reach the file, but not the commit
+    writer.filedescriptor.flush()
+    writer.filedescriptor.close()
+    os.close(writer.commit_descriptor)
+    return size
+
+
+def test_export(tmp_path):
+    """
+    A closed journal is exported like the csv file of the receiver.
+    """
+    journal = JournalWriter(tmp_path / 'log.nsj', CSV_FIELDNAMES)
+    csv_writer = BufferedCSVWriter(tmp_path / 'log.csv', CSV_FIELDNAMES)
+    for writer in (journal, csv_writer):
+        writer.open()
+        for number, data_str in enumerate(DATAGRAMS):
+            writer.write_record(100.0 + number, data_str)
+        writer.close()
+    assert recover_journal(tmp_path / 'log.nsj') == \
+        (os.path.getsize(tmp_path / 'log.nsj'), True)
+    assert export_journal(tmp_path / 'log.nsj', tmp_path / 'export.csv') \
+        == len(DATAGRAMS)
+    assert (tmp_path / 'export.csv').read_bytes() == \
+        (tmp_path / 'log.csv').read_bytes()
+
+
+def test_torn_tail(tmp_path):
+    """
+    A torn record after the last commit is removed.
+    """
+    path = tmp_path / 'log.nsj'
+    crash(path, DATAGRAMS[:2], DATAGRAMS[2:4])
+    with open(path, 'ab') as filedescriptor:
+        filedescriptor.write(b'\x40\x00\x00\x00torn')
+    size, closed = recover_journal(path)
+    assert not closed
+    assert size == os.path.getsize(path)
+    assert [data_str for _, data_str in records(path)] == DATAGRAMS[:4]
+
+
+def test_corrupt_record(tmp_path):
+    """
+    A corrupt record after the last commit and everything after it is
+    removed; the committed records are kept.
+    """
+    path = tmp_path / 'log.nsj'
+    committed = crash(path, DATAGRAMS[:2], DATAGRAMS[2:5])
+    content = bytearray(path.read_bytes())
+    # flip a byte in the datagram of the second uncommitted record
+    content[committed + 2 * 16 + len(DATAGRAMS[2]) + 5] ^= 0xff
+    path.write_bytes(bytes(content))
+    assert recover_journal(path) == \
+        (committed + 16 + len(DATAGRAMS[2]), False)
+    assert [data_str for _, data_str in records(path)] == DATAGRAMS[:3]
+
+
+def test_torn_header(tmp_path):
+    """
+    A journal with a torn header is started again.
+    """
+    path = tmp_path / 'log.nsj'
+    path.write_bytes(b'NSPAJ')
+    assert recover_journal(path) == (0, False)
+    assert os.path.getsize(path) == 0
+    assert recover_journal(tmp_path / 'missing.nsj') == (0, False)
+
+
+def test_resume(tmp_path):
+    """
+    A journal which was not closed cleanly is found and continued.
+    """
+    path = tmp_path / 'NoveSpa_planedata_1.nsj'
+    crash(path, DATAGRAMS[:2], DATAGRAMS[2:3])
+    assert find_resumable(tmp_path) == path
+    writer = JournalWriter(path, CSV_FIELDNAMES)
+    writer.open()
+    assert writer.resumed
+    writer.write_record(200.0, DATAGRAMS[5])
+    writer.close()
+    assert find_resumable(tmp_path) is None
+    assert records(path) == [(100.0, DATAGRAMS[0]), (101.0, DATAGRAMS[1]),
+                             (102.0, DATAGRAMS[2]), (200.0, DATAGRAMS[5])]
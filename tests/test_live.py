@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Tests of :mod:`novespace_stream_data.analysis.live`.
+"""
+
+import numpy
+
+from novespace_stream_data.analysis import LiveTraces, decimate_minmax
+from novespace_stream_data.receive import add_sequence, parse_record
+
+
+def datagram(number):
+    """
+    :return: datagram with jx = number and pressure = 2 * number
+    """
+    return (f'{36000000 + 100 * number};00:00.0;{number};0.0;1.0;19;46.2;'
+            f'{2 * number};0;STEADY FLIGHT')
+
+
+def test_decimate_minmax():
+    """
+    Peaks are kept; short traces are not decimated.
+    """
+    values = numpy.zeros((2, 100))
+    values[0, 42] = 5.0
+    values[1, 7] = -3.0
+    values[1, 8] = numpy.nan
+    minima, maxima = decimate_minmax(values, 10)
+    assert minima.shape == maxima.shape == (2, 10)
+    assert maxima[0].tolist() == [0, 0, 0, 0, 5, 0, 0, 0, 0, 0]
+    assert minima[1].tolist() == [-3] + [0] * 9
+    minima, maxima = decimate_minmax(values[:, :5], 10)
+    assert minima is maxima
+    assert minima.shape == (2, 5)
+
+
+def test_ring():
+    """
+    The latest samples are kept, oldest first.
+    """
+    traces = LiveTraces(capacity=4, channels=('jx', 'pressure'))
+    for number in range(3):
+        traces(100.0 + number, datagram(number))
+    times, values = traces.get_recent()
+    assert times.tolist() == [100.0, 101.0, 102.0]
+    for number in range(3, 6):
+        traces(100.0 + number, add_sequence(
+            f'3131;{datagram(number)}'.encode(), 'a', number).decode())
+    traces(106.0, 'invalid;datagram')
+    traces.add_record(parse_record(106.0, datagram(6)))
+    times, values = traces.get_recent()
+    assert times.tolist() == [103.0, 104.0, 105.0, 106.0]
+    assert values.tolist() == [[3, 4, 5, 6], [6, 8, 10, 12]]
+    assert traces.invalid == 1
+    minima, maxima = traces.decimate(2)
+    assert minima.tolist() == [[3, 5], [6, 10]]
+    assert maxima.tolist() == [[4, 6], [8, 12]]
@@ -0,0 +1,124 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Tests of the sequence numbers
+(:mod:`novespace_stream_data.receive.sequence`) and of
+:class:`novespace_stream_data.emulate.LoadGenerator`.
+"""
+
+import socket
+
+from novespace_stream_data.emulate import LoadGenerator
+from novespace_stream_data.receive import (
+    MetricsServer, ReceiverMetrics, SequenceTracker, add_sequence,
+    split_sequence)
+from novespace_stream_data.scripts.load_generator import remote_counters
+
+DATAGRAM = '36000000;00:00.0;0.18307;-0.013731;0.950486;19;46.2;944;0;' \
+    'STEADY FLIGHT'
+
+
+def test_split_sequence():
+    """
+    The sequence number is appended and split again.
+    """
+    data = add_sequence(DATAGRAM.encode(), 'a', 17).decode()
+    assert data == f'{DATAGRAM};#a:17'
+    assert split_sequence(data) == ('a', 17)
+    assert split_sequence(DATAGRAM) is None
+    assert split_sequence(f'{DATAGRAM};#a:x') is None
+
+
+def test_tracker():
+    """
+    Gaps are missing until their numbers arrive out of order; repeated
+    numbers are duplicates; streams are counted separately.
+    """
+    tracker = SequenceTracker()
+    for number in (0, 1, 4, 2, 2, 5, 0):
+        tracker.add(3131, 'a', number)
+    tracker.add(3131, 'b', 7)
+    tracker.add(3132, 'a', 0)
+    assert tracker.get_statistics() == {
+        'streams': 3, 'received': 9, 'missing': 1, 'out_of_order': 1,
+        'duplicate': 2}
+
+
+def test_tracker_window():
+    """
+    Only the last window numbers are remembered as missing.
+    """
+    tracker = SequenceTracker(window=2)
+    tracker.add(None, 'a', 0)
+    tracker.add(None, 'a', 5)
+    tracker.add(None, 'a', 1)
+    statistics = tracker.get_statistics()
+    assert (statistics['missing'], statistics['duplicate']) == (4, 1)
+
+
+def bind_consecutive(number, attempts=20):
+    """
+    :return: list of sockets bound to consecutive ports on loopback
+    """
+    for _ in range(attempts):
+        sockets = [socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                   for _ in range(number)]
+        try:
+            sockets[0].bind(('localhost', 0))
+            port = sockets[0].getsockname()[1]
+            for offset, sock in enumerate(sockets[1:], 1):
+                sock.bind(('localhost', port + offset))
+        except OSError:
+            for sock in sockets:
+                sock.close()
+            continue
+        for sock in sockets:
+            sock.settimeout(5.0)
+        return sockets
+    raise OSError('no consecutive free ports')
+
+
+def test_load_generator():
+    """
+    Every stream is sent to its port with continuing sequence numbers.
+    """
+    sockets = bind_consecutive(2)
+    ports = [sock.getsockname()[1] for sock in sockets]
+    generator = LoadGenerator('localhost', ports[0], streams=2, workers=1)
+    assert generator.get_ports() == ports
+    tracker = SequenceTracker()
+    try:
+        results = [generator.run_step(100.0, 0.1) for _ in range(2)]
+        for sock, port in zip(sockets, ports):
+            for _ in range(20):
+                tracker(0.0, sock.recv(1024).decode(), port)
+    finally:
+        generator.close()
+        for sock in sockets:
+            sock.close()
+    assert [result['sent'] for result in results] == [20, 20]
+    assert tracker.get_statistics() == {
+        'streams': 2, 'received': 40, 'missing': 0, 'out_of_order': 0,
+        'duplicate': 0}
+
+
+def test_remote_counters():
+    """
+    The counters of a remote receiver are read from its metrics.
+    """
+    metrics = ReceiverMetrics()
+    statistics = {'received': 12, 'stages': {},
+                  'loss': {'out_of_order': 1, 'duplicate': 2,
+                           'kernel_dropped': 3, 'stage_dropped': 4}}
+    server = MetricsServer(lambda: metrics.render(statistics),
+                           'localhost:0')
+    server.start()
+    try:
+        address = f'localhost:{server.server.server_address[1]}'
+        assert remote_counters(address) == {
+            'received': 12, 'out_of_order': 1, 'duplicate': 2,
+            'dropped': 7}
+    finally:
+        server.stop()
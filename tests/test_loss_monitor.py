@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Tests of :class:`novespace_stream_data.receive.LossMonitor`.
+"""
+
+from novespace_stream_data.receive import LossMonitor, add_sequence
+from novespace_stream_data.receive.loss_monitor import (
+    CALIBRATION, COUNTERS, count_steps)
+
+
+def datagram(milliseconds):
+    """
+    :return: datagram (bytes) with the given stream time
+    """
+    return (f'{milliseconds};00:00.0;0.1;0.0;1.0;19;46.2;944;0;'
+            'STEADY FLIGHT').encode()
+
+
+def monitor_times(times, **kwargs):
+    """
+    :return: statistics of a LossMonitor after the given stream times
+    """
+    monitor = LossMonitor(**kwargs)
+    for milliseconds in times:
+        monitor.add(datagram(milliseconds), 3131)
+    monitor.close()
+    return monitor.get_statistics()
+
+
+def test_count_steps():
+    """
+    Until the interval is known every datagram is one step; then the
+    steps are rounded to intervals and short steps are on time.
+    """
+    clock = [0, 0, None, []]
+    assert [count_steps(clock, 50) for _ in range(CALIBRATION)] == \
+        [1] * CALIBRATION
+    assert clock[2] == 50
+    assert [count_steps(clock, delta)
+            for delta in (10, 50, 70, 149, 500, 0, -50, -120)] == \
+        [1, 1, 1, 3, 10, 0, -1, -2]
+
+
+def test_gaps():
+    """
+    Gaps are missing datagrams, older times out-of-order, equal times
+    duplicates.
+    """
+    statistics = monitor_times([0, 100, 200, 500, 400, 500], interval=100)
+    assert (statistics['received'], statistics['missing'],
+            statistics['out_of_order'], statistics['duplicate']) == \
+        (6, 1, 1, 1)
+
+
+def test_jitter():
+    """
+    Steps shorter than one interval are on time.
+    """
+    statistics = monitor_times([0, 95, 205, 290, 330, 400], interval=100)
+    assert statistics['missing'] == 0
+    assert statistics['duplicate'] == 0
+
+
+def test_inferred_interval():
+    """
+    The interval of a 20 Hz stream is inferred from its first steps.
+    """
+    times = [50 * number for number in range(CALIBRATION + 1)]
+    times += [times[-1] + 150, times[-1] + 200]
+    statistics = monitor_times(times)
+    assert statistics['missing'] == 2
+    assert statistics['received'] == CALIBRATION + 3
+
+
+def test_midnight_and_interruption():
+    """
+    Midnight is no gap; a long gap is an interruption, not a loss.
+    """
+    statistics = monitor_times([86399800, 86399900, 0, 100, 60100, 60200],
+                               interval=100)
+    assert statistics['missing'] == 0
+    assert statistics['interruptions'] == 1
+
+
+def test_sequence_numbers():
+    """
+    Datagrams with sequence numbers are counted by them.
+    """
+    monitor = LossMonitor(interval=100)
+    for number in (0, 1, 3, 3):
+        monitor.add(add_sequence(datagram(0), 'a', number), 3131)
+    monitor.close()
+    statistics = monitor.get_statistics()
+    assert (statistics['missing'], statistics['duplicate']) == (1, 1)
+
+
+def test_stats_log(tmp_path):
+    """
+    A line per second is written to the stats log.
+    """
+    path = tmp_path / 'log.stats.csv'
+    monitor = LossMonitor(path, interval=100)
+    second = monitor.second
+    monitor.add(datagram(0))
+    monitor.add(datagram(300))
+    monitor.add_error()
+    monitor.poll(now=second + 1)
+    monitor.add(datagram(400))
+    monitor.close(stage_dropped=2)
+    with open(path, encoding='ascii') as filedescriptor:
+        header, *rows = filedescriptor.read().splitlines()
+    assert header.split(';') == ['unixtime'] + list(COUNTERS)
+    assert [row.split(';') for row in rows] == [
+        [str(second), '2', '2', '0', '0', '0', '0', '1'],
+        [str(second + 1), '1', '0', '0', '0', '0', '2', '0']]
+    assert monitor.get_statistics()['last_second']['stage_dropped'] == 2
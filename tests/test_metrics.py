@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Tests of :mod:`novespace_stream_data.receive.metrics`.
+"""
+
+import socket
+import time
+
+import pytest
+
+from novespace_stream_data.receive import (
+    BufferedCSVWriter, CSV_FIELDNAMES, Histogram, MetricsServer, NoSpaStream,
+    ReceiverMetrics, read_metrics)
+
+DATAGRAM = '36000000;00:00.0;0.18307;-0.013731;0.950486;19;46.2;944;0;' \
+    'STEADY FLIGHT'
+
+STATISTICS = {'received': 5, 'stages': {'writer': {
+    'fill': 1, 'max_fill': 3, 'capacity': 8}},
+              'loss': {'missing': 2, 'errors': 1}}
+
+
+def test_histogram():
+    """
+    Values are counted in the first bucket they fit; the buckets are
+    rendered cumulative.
+    """
+    histogram = Histogram((1, 2, 5))
+    for value in (0.5, 1, 1.5, 4, 7):
+        histogram.observe(value)
+    assert histogram.counts == [2, 1, 1, 1]
+    assert histogram.render('x', 'help') == [
+        '# HELP x help', '# TYPE x histogram', 'x_bucket{le="1"} 2',
+        'x_bucket{le="2"} 3', 'x_bucket{le="5"} 4', 'x_bucket{le="+Inf"} 5',
+        'x_sum 14.0', 'x_count 5']
+
+
+def test_render():
+    """
+    The counters of the statistics are rendered as samples.
+    """
+    metrics = ReceiverMetrics()
+    metrics.bytes = 300
+    metrics.latency.observe(0.002)
+    lines = metrics.render(STATISTICS, running=False).splitlines()
+    for line in ('novespace_receiver_up 0',
+                 'novespace_receiver_datagrams_total 5',
+                 'novespace_receiver_bytes_total 300',
+                 'novespace_receiver_lost_total{kind="missing"} 2',
+                 'novespace_receiver_lost_total{kind="duplicate"} 0',
+                 'novespace_receiver_lost_total{kind="errors"} 1',
+                 'novespace_receiver_queue_max_fill{stage="writer"} 3',
+                 'novespace_receiver_latency_seconds_count 1'):
+        assert line in lines
+
+
+def test_read_metrics(tmp_path):
+    """
+    The metrics are read from HTTP and Unix stream endpoints.
+    """
+    metrics = ReceiverMetrics()
+    for address in ('localhost:0', str(tmp_path / 'metrics.sock')):
+        server = MetricsServer(lambda: metrics.render(STATISTICS), address)
+        server.start()
+        try:
+            if address.startswith('localhost'):
+                address = f'localhost:{server.server.server_address[1]}'
+            samples = read_metrics(address)
+        finally:
+            server.stop()
+        assert samples['novespace_receiver_datagrams_total'] == 5
+        assert samples[
+            'novespace_receiver_lost_total{kind="missing"}'] == 2
+        assert samples['novespace_receiver_queue_capacity{stage="writer"}'] \
+            == 8
+
+
+def test_flush_latency(tmp_path):
+    """
+    The latency is observed when the records are flushed, not when they
+    are written.
+    """
+    histogram = Histogram()
+    writer = BufferedCSVWriter(tmp_path / 'log.csv', CSV_FIELDNAMES,
+                               flush_rows=2, flush_interval=None,
+                               latency=histogram)
+    writer.open()
+    writer.write_record(time.time() - 0.2, DATAGRAM)
+    assert histogram.count == 0
+    writer.write_record(time.time(), DATAGRAM)
+    assert histogram.count == 2
+    assert histogram.sum >= 0.2
+    writer.write_record(time.time(), DATAGRAM)
+    writer.close()
+    assert histogram.count == 3
+
+
+def test_address_in_use(tmp_path, udp_port):
+    """
+    If the endpoint cannot be started, the opened session is closed.
+    """
+    with socket.socket() as blocker:
+        blocker.bind(('localhost', 0))
+        blocker.listen()
+        stream = NoSpaStream(
+            str(tmp_path), udp_port, stats_log=True,
+            metrics=f'localhost:{blocker.getsockname()[1]}')
+        stream.do_exit = False
+        with pytest.raises(OSError):
+            stream.start_streaming()
+    assert all(sock.fileno() == -1 for sock in stream.sockets)
+    assert not stream.writer.is_open
+    assert stream.loss.closed
+    assert not stream.streaming_running.is_set()
@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Tests of :class:`novespace_stream_data.receive.NoSpaStream` with several
+ports on loopback.
+"""
+
+import socket
+
+import pytest
+
+from novespace_stream_data.receive import NoSpaStream
+
+DATAGRAM = '36000000;00:00.0;0.18307;-0.013731;0.950486;19;46.2;944;0;' \
+    'STEADY FLIGHT'
+
+
+def stream_ports(tmp_path, ports, wait_until, **kwargs):
+    """
+    Send a datagram to every port.
+
+    :return: the ended stream
+    """
+    stream = NoSpaStream(str(tmp_path), ports, **kwargs)
+    stream.do_exit = False
+    stream.start_streaming()
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            for port in ports:
+                sock.sendto(DATAGRAM.encode(), ('localhost', port))
+        assert wait_until(lambda: stream.received == len(ports))
+    finally:
+        stream.end_streaming()
+    return stream
+
+
+def read_rows(path):
+    """
+    :return: lines of a csv file without the header
+    """
+    with open(path, encoding='utf-8') as filedescriptor:
+        return filedescriptor.read().splitlines()[1:]
+
+
+def test_file_per_port(tmp_path, udp_ports, wait_until):
+    """
+    Without tagged every port is written to its own file.
+    """
+    stream = stream_ports(tmp_path, udp_ports, wait_until)
+    assert len(set(stream.csv_files.values())) == 2
+    for port, path in stream.csv_files.items():
+        assert f'_port{port}' in path.name
+        assert [row.split(';', 1)[1] for row in read_rows(path)] == \
+            [DATAGRAM]
+
+
+def test_tagged(tmp_path, udp_ports, wait_until):
+    """
+    With tagged all ports are written to one file with a port column.
+    """
+    stream = stream_ports(tmp_path, udp_ports, wait_until, tagged=True)
+    paths = set(stream.csv_files.values())
+    assert len(paths) == 1
+    with open(paths.pop(), encoding='utf-8') as filedescriptor:
+        header, *rows = filedescriptor.read().splitlines()
+    assert header.split(';')[1] == ' Port'
+    assert sorted(int(row.split(';')[1]) for row in rows) == \
+        sorted(udp_ports)
+
+
+def test_port_in_use(tmp_path, udp_port):
+    """
+    If a later port is in use, the ports bound before are closed.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as blocker:
+        blocker.bind(('', 0))
+        stream = NoSpaStream(str(tmp_path),
+                             [udp_port, blocker.getsockname()[1]])
+        with pytest.raises(OSError):
+            stream.start_streaming()
+    assert not stream.sockets
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(('', udp_port))
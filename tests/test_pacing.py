@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Tests of :class:`novespace_stream_data.emulate.Pacer`.
+
+The tolerances are generous, since the tests may run on a busy machine.
+"""
+
+import time
+
+import pytest
+
+from novespace_stream_data.emulate import Pacer
+
+INTERVAL = 0.005
+
+
+def run(pacer, number, delay_at=None, delay=0.0):
+    """
+    Wait for number deadlines, optionally with one delay (e. g. the
+    process is not scheduled).
+
+    :return: seconds from the first to the last deadline
+    """
+    pacer.start()
+    pacer.wait()
+    start = time.perf_counter()
+    for count in range(1, number):
+        if count == delay_at:
+            time.sleep(delay)
+        # work of reading and sending a datagram
+        time.sleep(INTERVAL / 5)
+        pacer.wait()
+    return time.perf_counter() - start
+
+
+def test_no_drift():
+    """
+    The time of the work does not add up.
+    """
+    elapsed = run(Pacer(INTERVAL), 41)
+    assert elapsed == pytest.approx(40 * INTERVAL, abs=0.05)
+
+
+def test_catch_up():
+    """
+    After a delay the schedule is reached again.
+    """
+    pacer = Pacer(INTERVAL, 'catch-up')
+    elapsed = run(pacer, 41, delay_at=5, delay=10 * INTERVAL)
+    assert elapsed == pytest.approx(40 * INTERVAL, abs=0.05)
+    assert pacer.get_report()['skipped'] == 0
+    assert pacer.get_report()['lateness_max'] >= 9 * INTERVAL
+
+
+def test_skip():
+    """
+    After a delay the missed deadlines are skipped.
+    """
+    pacer = Pacer(INTERVAL, 'skip')
+    elapsed = run(pacer, 41, delay_at=5, delay=10 * INTERVAL)
+    assert elapsed == pytest.approx(50 * INTERVAL, abs=0.05)
+    # a busy machine may delay further deadlines
+    assert pacer.get_report()['skipped'] >= 1
+
+
+def test_offsets():
+    """
+    Explicit offsets give the deadlines relative to the start.
+    """
+    pacer = Pacer(None)
+    pacer.start()
+    start = time.perf_counter()
+    for offset in (0.0, 0.01, 0.03):
+        pacer.wait(offset)
+    assert time.perf_counter() - start == pytest.approx(0.03, abs=0.02)
+    assert pacer.get_report()['sent'] == 3
+
+
+def test_invalid_policy():
+    """
+    Unknown policies are refused.
+    """
+    with pytest.raises(ValueError):
+        Pacer(INTERVAL, 'burst')
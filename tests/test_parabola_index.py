@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Tests of :class:`novespace_stream_data.receive.ParabolaIndex`.
+"""
+
+import pytest
+
+from novespace_stream_data.receive import (
+    BinaryCaptureWriter, BufferedCSVWriter, CSV_FIELDNAMES, JournalWriter,
+    ParabolaIndex, RawCaptureWriter, add_sequence, build_index, get_index,
+    read_segments)
+from novespace_stream_data.receive.parabola_index import (
+    index_path, parse_key)
+
+PHASES = [(0, 'STEADY FLIGHT', 3), (1, 'PULL UP', 2), (1, '0G', 4),
+          (1, 'PULL OUT', 2), (1, 'STEADY FLIGHT', 3)]
+
+
+def datagrams():
+    """
+    :return: list of datagrams of the flight phases PHASES
+    """
+    result = []
+    for parabola, announcement, rows in PHASES:
+        for _ in range(rows):
+            milliseconds = 36000000 + 100 * len(result)
+            result.append(f'{milliseconds};00:00.0;0.1;0.0;1.0;19;46.2;944;'
+                          f'{parabola};{announcement}')
+    return result
+
+
+@pytest.fixture(params=[BufferedCSVWriter, BinaryCaptureWriter,
+                        JournalWriter, RawCaptureWriter])
+def capture(request, tmp_path):
+    """
+    :return: path of a file written with an index
+    """
+    path = tmp_path / f'log{request.param.suffix or ".csv"}'
+    writer = request.param(path, CSV_FIELDNAMES,
+                           index=ParabolaIndex(index_path(path)))
+    writer.open()
+    for number, data_str in enumerate(datagrams()):
+        writer.write_record(1000.0 + number, data_str.encode()
+                            if writer.raw else data_str)
+    writer.close()
+    return path
+
+
+def test_segments(capture):  # pylint: disable=redefined-outer-name
+    """
+    Every run of parabola and announcement is a segment.
+    """
+    index = ParabolaIndex.load(index_path(capture))
+    assert [(segment['parabola'], segment['announcement'], segment['rows'])
+            for segment in index.segments] == PHASES
+    assert index.segments[2]['first_row'] == 5
+    assert index.segments[2]['first_ms'] == 36000500
+    assert index.segments[2]['last_unixtime'] == 1008.0
+    assert sorted(index.phases()) == [0, 1]
+
+
+def test_offline_index(capture):  # pylint: disable=redefined-outer-name
+    """
+    The index built offline equals the index built while writing.
+    """
+    segments = ParabolaIndex.load(index_path(capture)).segments
+    assert build_index(capture).segments == segments
+    assert get_index(capture, rebuild=True).segments == segments
+
+
+def test_read_segments(capture):  # pylint: disable=redefined-outer-name
+    """
+    The records of a phase are read by seeking to its segments.
+    """
+    segments = get_index(capture).find(1, '0G')
+    assert [data_str for _, data_str in read_segments(capture, segments)] \
+        == datagrams()[5:9]
+    assert len(get_index(capture).find(1)) == 4
+
+
+def test_invalid_records():
+    """
+    Invalid records are added to the current segment.
+    """
+    index = ParabolaIndex()
+    index.add(0, 10, 1.0, datagrams()[0])
+    index.add(10, 20, 2.0, 'invalid')
+    index.add(20, 30, 3.0, datagrams()[3])
+    assert [segment['rows'] for segment in index.segments] == [2, 1]
+    assert index.segments[0]['end'] == 20
+    assert index.segments[1]['first_row'] == 2
+
+
+def test_parse_key():
+    """
+    Port, sequence number and bytes are allowed around the datagram.
+    """
+    data_str = datagrams()[5]
+    key = (1, '0G', 36000500)
+    assert parse_key(data_str) == key
+    assert parse_key(f'3131;{data_str}'.encode()) == key
+    assert parse_key(add_sequence(data_str.encode(), 'a', 5).decode()) == \
+        key
+    assert parse_key('invalid') is None
@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Tests of :class:`novespace_stream_data.receive.PhaseDetector`.
+"""
+
+import socket
+import statistics
+
+import pytest
+
+from novespace_stream_data.receive import (
+    PhaseDetector, RollingStatistics, add_sequence, parse_record)
+
+# g-level of the samples of a parabola
+PARABOLA = [1.0] * 5 + [1.8] * 5 + [1.0] * 3 + [0.0] * 5 + [1.0] * 2 + \
+    [1.8] * 5 + [1.0] * 5
+
+
+def datagrams():
+    """
+    :return: list of datagrams of PARABOLA
+    """
+    return [f'{36000000 + 100 * number};00:00.0;0.0;0.0;{jz};19;46.2;944;'
+            f'7;STEADY FLIGHT' for number, jz in enumerate(PARABOLA)]
+
+
+def test_rolling_statistics():
+    """
+    Mean and standard deviation of the last values of the window.
+    """
+    rolling = RollingStatistics(4)
+    values = [0.5, 1.5, 3.0, -2.0, 7.25, 1.0, 0.0]
+    for number, value in enumerate(values):
+        rolling.add(value)
+        window = values[max(0, number - 3):number + 1]
+        assert rolling.mean() == pytest.approx(statistics.fmean(window))
+        assert rolling.std() == pytest.approx(statistics.pstdev(window))
+
+
+def test_phases():
+    """
+    A parabola passes all flight phases in order.
+    """
+    detector = PhaseDetector(window=3)
+    events = [event for event in (detector(1000.0 + number / 10, data_str)
+                                  for number, data_str in
+                                  enumerate(datagrams()))
+              if event is not None]
+    assert [event['phase'] for event in events] == \
+        ['PULL UP', 'INJECTION', '0G', 'PULL OUT', 'STEADY FLIGHT']
+    assert events[0]['previous'] == 'STEADY FLIGHT'
+    assert detector.get_statistics()['events'] == 5
+
+
+def test_typed_records():
+    """
+    Raw and typed records give the same events with integer columns, also
+    with port and sequence number.
+    """
+    raw, typed, tagged = PhaseDetector(), PhaseDetector(), PhaseDetector()
+    for number, data_str in enumerate(datagrams()):
+        unixtime = 1000.0 + number / 10
+        event = raw(unixtime, data_str)
+        other = typed.add_record(parse_record(unixtime, data_str))
+        sequenced = tagged(unixtime, add_sequence(
+            f'3131;{data_str}'.encode(), 'a', number).decode())
+        if event is None:
+            assert other is None
+            assert sequenced is None
+            continue
+        for key in ('phase', 'ms', 'parabola', 'mean'):
+            assert event[key] == other[key] == sequenced[key]
+        assert isinstance(event['ms'], int)
+        assert event['parabola'] == 7
+
+
+def test_invalid():
+    """
+    Datagrams without g-levels are counted as invalid.
+    """
+    detector = PhaseDetector()
+    assert detector(1000.0, '36000000;00:00.0;x;0.0;1.0;19;46;944;0;A') \
+        is None
+    assert detector(1000.0, 'short') is None
+    assert detector.get_statistics()['invalid'] == 2
+
+
+def test_event_socket():
+    """
+    The events are sent as datagrams.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(('localhost', 0))
+        sock.settimeout(5.0)
+        detector = PhaseDetector(
+            window=1, address=f'localhost:{sock.getsockname()[1]}')
+        detector(1000.0, datagrams()[0])
+        detector(1000.1, datagrams()[5])
+        detector.close()
+        unixtime, milliseconds, phase, _, _ = \
+            sock.recv(1024).decode().split(';')
+    assert (float(unixtime), int(milliseconds), phase) == \
+        (1000.1, 36000500, 'PULL UP')
@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Tests of :class:`novespace_stream_data.receive.RingBuffer` and
+:class:`novespace_stream_data.receive.ConsumerStage`.
+"""
+
+from threading import Thread
+
+import pytest
+
+from novespace_stream_data.receive import ConsumerStage, RingBuffer
+
+
+def fill(ring, items):
+    """
+    :return: list of the results of put
+    """
+    return [ring.put(item, timeout=0.01) for item in items]
+
+
+def test_fifo_wraps_around():
+    """
+    The entries are returned in order, also over the end of the slots.
+    """
+    ring = RingBuffer(3)
+    fill(ring, [1, 2])
+    assert ring.get_many(1) == [1]
+    fill(ring, [3, 4])
+    assert ring.get_many() == [2, 3, 4]
+    assert ring.max_fill == 3
+
+
+def test_drop_oldest():
+    """
+    A full buffer overwrites the oldest entries.
+    """
+    ring = RingBuffer(3, 'drop-oldest')
+    assert fill(ring, range(5)) == [True] * 5
+    assert ring.get_many() == [2, 3, 4]
+    assert ring.dropped == 2
+
+
+def test_drop_newest():
+    """
+    A full buffer discards the new entries.
+    """
+    ring = RingBuffer(3, 'drop-newest')
+    assert fill(ring, range(5)) == [True] * 3 + [False] * 2
+    assert ring.get_many() == [0, 1, 2]
+    assert ring.dropped == 2
+
+
+def test_block_timeout():
+    """
+    A full blocking buffer discards an entry after the timeout.
+    """
+    ring = RingBuffer(2, 'block')
+    assert fill(ring, range(3)) == [True, True, False]
+    assert ring.dropped == 1
+
+
+def test_block_waits_for_consumer():
+    """
+    A full blocking buffer waits until the consumer makes space.
+    """
+    ring = RingBuffer(2, 'block')
+    fill(ring, [0, 1])
+    consumer = Thread(target=ring.get_many, args=(1, 1.0))
+    consumer.start()
+    assert ring.put(2, timeout=1.0)
+    consumer.join()
+    assert ring.get_many() == [1, 2]
+    assert ring.dropped == 0
+
+
+def test_close():
+    """
+    After closing, the remaining entries are returned, then None.
+    """
+    ring = RingBuffer(2)
+    ring.put(0)
+    ring.close()
+    assert not ring.put(1)
+    assert ring.get_many() == [0]
+    assert ring.get_many() is None
+
+
+def test_invalid_arguments():
+    """
+    Unknown policies and empty buffers are refused.
+    """
+    with pytest.raises(ValueError):
+        RingBuffer(2, 'drop-all')
+    with pytest.raises(ValueError):
+        RingBuffer(0)
+
+
+def test_consumer_stage():
+    """
+    The stage processes every entry and counts the failing ones.
+    """
+    results = []
+
+    def handler(value):
+        results.append(1 / value)
+
+    stage = ConsumerStage('test', handler, capacity=16)
+    stage.start()
+    for value in (1, 0, 2):
+        stage.put((value,))
+    stage.stop()
+    assert results == [1.0, 0.5]
+    statistics = stage.get_statistics()
+    assert statistics['processed'] == 3
+    assert statistics['errors'] == 1
+    assert statistics['dropped'] == 0
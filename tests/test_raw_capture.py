@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Tests of the raw capture format
+(:mod:`novespace_stream_data.receive.raw_capture`).
+"""
+
+import os
+
+from novespace_stream_data.receive import (
+    BufferedCSVWriter, CSV_FIELDNAMES, NoSpaStream, RawCaptureWriter,
+    export_raw_capture, iter_raw_capture)
+
+DATAGRAMS = [
+    f'{36000000 + 100 * number};00:00.0;0.1;0.0;1.0;19;46.2;944;0;'
+    'STEADY FLIGHT' for number in range(5)]
+
+
+def write(path, datagrams, **kwargs):
+    """
+    Write datagrams (bytes) with consecutive timestamps.
+
+    :return: the closed writer
+    """
+    writer = RawCaptureWriter(path, CSV_FIELDNAMES, **kwargs)
+    writer.open()
+    for number, data in enumerate(datagrams):
+        writer.write_record(100.0 + number, data)
+    writer.close()
+    return writer
+
+
+def test_round_trip(tmp_path):
+    """
+    The datagrams are stored verbatim, also larger than the buffer and
+    not decodable.
+    """
+    path = tmp_path / 'log.nsr'
+    datagrams = [data.encode() for data in DATAGRAMS] + \
+        [b'x' * 200, b'\xff\xfe']
+    writer = write(path, datagrams, buffer_size=128, flush_rows=3)
+    assert writer.offset == os.path.getsize(path)
+    assert [(unixtime, data) for unixtime, data, _ in
+            iter_raw_capture(path)] == \
+        [(100.0 + number, data) for number, data in enumerate(datagrams)]
+
+
+def test_export(tmp_path):
+    """
+    The export equals the csv file of the receiver.
+    """
+    write(tmp_path / 'log.nsr', [data.encode() for data in DATAGRAMS])
+    writer = BufferedCSVWriter(tmp_path / 'log.csv', CSV_FIELDNAMES)
+    writer.open()
+    for number, data_str in enumerate(DATAGRAMS):
+        writer.write_record(100.0 + number, data_str)
+    writer.close()
+    assert export_raw_capture(tmp_path / 'log.nsr',
+                              tmp_path / 'export.csv') == len(DATAGRAMS)
+    assert (tmp_path / 'export.csv').read_bytes() == \
+        (tmp_path / 'log.csv').read_bytes()
+
+
+def test_torn_record(tmp_path):
+    """
+    A torn record at the end is removed when the capture is continued.
+    """
+    path = tmp_path / 'log.nsr'
+    write(path, [data.encode() for data in DATAGRAMS[:2]])
+    with open(path, 'ab') as filedescriptor:
+        filedescriptor.write(b'\x00' * 8 + b'\x40\x00\x00\x00torn')
+    write(path, [data.encode() for data in DATAGRAMS[2:3]])
+    assert [data.decode() for _, data, _ in iter_raw_capture(path)] == \
+        DATAGRAMS[:3]
+    path.write_bytes(b'NSPA')
+    write(path, [])
+    assert not list(iter_raw_capture(path))
+
+
+def test_receiver(tmp_path):
+    """
+    The receiver stores the datagrams without decoding, with the port in
+    front in the tagged layout.
+    """
+    receiver = NoSpaStream(str(tmp_path), [3131, 3132], tagged=True,
+                           capture_format='raw')
+    receiver.csv_file = tmp_path / 'log.csv'
+    receiver.sockets = [None, None]
+    receiver.open_writers()
+    receiver.write_data(100.0, DATAGRAMS[0].encode(), 3132)
+    receiver.close_writer()
+    (path,) = tmp_path.glob('*.nsr')
+    assert [data for _, data, _ in iter_raw_capture(path)] == \
+        [f'3132;{DATAGRAMS[0]}'.encode()]
+
+
+def test_invalid_utf8(tmp_path):
+    """
+    Datagrams which are not utf-8 are stored also with record handlers
+    and exported with replacement characters.
+    """
+    receiver = NoSpaStream(str(tmp_path), 3131, capture_format='raw')
+    receiver.csv_file = tmp_path / 'log.csv'
+    handled = []
+    receiver.add_record_handler(
+        lambda unixtime, data_str, port: handled.append(data_str))
+    receiver.open_writers()
+    receiver.dispatch(100.0, b'\xff\xfe;invalid', 3131)
+    receiver.dispatch(101.0, DATAGRAMS[0].encode(), 3131)
+    receiver.close_writer()
+    assert handled == ['\ufffd\ufffd;invalid', DATAGRAMS[0]]
+    (path,) = tmp_path.glob('*.nsr')
+    assert [data for _, data, _ in iter_raw_capture(path)] == \
+        [b'\xff\xfe;invalid', DATAGRAMS[0].encode()]
+    assert export_raw_capture(path, tmp_path / 'export.csv') == 2
+    assert (tmp_path / 'export.csv').read_text('utf-8').splitlines()[1:] \
+        == ['100.0;\ufffd\ufffd;invalid', f'101.0;{DATAGRAMS[0]}']
@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Tests of :func:`novespace_stream_data.analysis.read_log`.
+"""
+
+import numpy
+import pytest
+
+from novespace_stream_data.analysis import read_log
+from novespace_stream_data.receive import (
+    BinaryCaptureWriter, BufferedCSVWriter, CSV_FIELDNAMES)
+
+DATAGRAMS = [
+    f'{34439807 + 100 * number};33:59.8;0.18307;-0.013731;{number / 10};'
+    f'19;46.2;944;{number // 3};'
+    f'{"STEADY FLIGHT" if number % 3 else "PULL UP"}'
+    for number in range(9)]
+
+
+def write(path, datagrams, writer_class=BufferedCSVWriter):
+    """
+    Write datagrams with consecutive timestamps.
+    """
+    writer = writer_class(path, CSV_FIELDNAMES)
+    writer.open()
+    for number, data_str in enumerate(datagrams):
+        writer.write_record(1000.0 + number, data_str)
+    writer.close()
+
+
+def test_columns(tmp_path):
+    """
+    The columns are parsed into typed arrays.
+    """
+    write(tmp_path / 'log.csv', DATAGRAMS)
+    log = read_log(tmp_path / 'log.csv')
+    assert log['skipped'] == 0
+    assert log['unixtime'].tolist() == [1000.0 + number
+                                        for number in range(9)]
+    assert log['ms'].dtype == numpy.int64
+    assert log['ms'][1] == 34439907
+    assert log['time'][0] == pytest.approx(33 * 60 + 59.8)
+    assert log['jz'].tolist() == pytest.approx(
+        [number / 10 for number in range(9)])
+    assert log['parabola'].tolist() == [0, 0, 0, 1, 1, 1, 2, 2, 2]
+    assert log['announcements'][log['announcement'][:3]].tolist() == \
+        ['PULL UP', 'STEADY FLIGHT', 'STEADY FLIGHT']
+
+
+def test_misaligned_lines(tmp_path):
+    """
+    A line with a missing field followed by a line with an additional
+    field (same number of fields in total) is skipped, not shifted.
+    """
+    datagrams = list(DATAGRAMS)
+    datagrams[2] = datagrams[2].replace(';19;', ';')
+    datagrams[3] = datagrams[3].replace(';19;', ';19;19;')
+    write(tmp_path / 'log.csv', datagrams)
+    log = read_log(tmp_path / 'log.csv')
+    assert log['skipped'] == 2
+    assert log['ms'].tolist() == [34439807 + 100 * number
+                                  for number in (0, 1, 4, 5, 6, 7, 8)]
+    assert (log['temperature'] == 19).all()
+
+
+def test_invalid_values(tmp_path):
+    """
+    Invalid integers are -1, invalid floats NaN.
+    """
+    write(tmp_path / 'log.csv',
+          [DATAGRAMS[0].replace('34439807', 'x').replace('0.18307', 'y')])
+    log = read_log(tmp_path / 'log.csv')
+    assert log['ms'].tolist() == [-1]
+    assert numpy.isnan(log['jx'][0])
+
+
+def test_invalid_datagram_capture(tmp_path):
+    """
+    A datagram of a binary capture which cannot be parsed gives -1 for
+    the integers and NaN for the floats as in the csv file.
+    """
+    write(tmp_path / 'log.nsb', ['invalid;datagram'] + DATAGRAMS[:1],
+          BinaryCaptureWriter)
+    log = read_log(tmp_path / 'log.nsb')
+    assert log['ms'].tolist() == [-1, 34439807]
+    assert log['parabola'].tolist() == [-1, 0]
+    assert numpy.isnan(log['jx'][0])
+
+
+def test_chunks(tmp_path):
+    """
+    Small chunks give the same result.
+    """
+    write(tmp_path / 'log.csv', DATAGRAMS)
+    whole = read_log(tmp_path / 'log.csv')
+    chunked = read_log(tmp_path / 'log.csv', chunk_size=100)
+    for name in ('unixtime', 'ms', 'jz', 'parabola'):
+        assert chunked[name].tolist() == whole[name].tolist()
+
+
+def test_binary_capture(tmp_path):
+    """
+    A binary capture gives the same columns as the csv file.
+    """
+    write(tmp_path / 'log.csv', DATAGRAMS)
+    write(tmp_path / 'log.nsb', DATAGRAMS, BinaryCaptureWriter)
+    csv_log = read_log(tmp_path / 'log.csv')
+    capture_log = read_log(tmp_path / 'log.nsb')
+    for name in ('unixtime', 'ms', 'time', 'jx', 'jz', 'parabola'):
+        assert capture_log[name].tolist() == \
+            pytest.approx(csv_log[name].tolist())
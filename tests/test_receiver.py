@@ -0,0 +1,135 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Tests of :class:`novespace_stream_data.receive.BatchReceiver` and of the
+receiving loop of :class:`novespace_stream_data.receive.NoSpaStream` on
+loopback.
+"""
+
+import errno
+import socket
+
+import pytest
+
+from novespace_stream_data.receive import BatchReceiver, NoSpaStream
+
+DATAGRAM = '36000000;00:00.0;0.18307;-0.013731;0.950486;19;46.2;944;0;' \
+    'STEADY FLIGHT'
+
+
+def send(port, datagrams):
+    """
+    Send datagrams to a port on loopback.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        for data in datagrams:
+            sock.sendto(data, ('localhost', port))
+
+
+def test_batch_receiver(udp_port, wait_until):
+    """
+    Queued datagrams are received in order and at most batch_size at once.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(('localhost', udp_port))
+        receiver = BatchReceiver(sock, batch_size=3)
+        datagrams = [b'%d' % number for number in range(5)]
+        send(udp_port, datagrams)
+        received = []
+        assert wait_until(lambda: received.extend(receiver.receive()) or
+                          len(received) == 5)
+        assert [data for _, data, _ in received] == datagrams
+        assert receiver.batches >= 2
+        unixtimes = [unixtime for unixtime, _, _ in received]
+        assert unixtimes == sorted(unixtimes)
+
+
+def test_truncated(udp_port, wait_until):
+    """
+    Too large datagrams are truncated and counted.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(('localhost', udp_port))
+        receiver = BatchReceiver(sock, max_datagram_size=4)
+        send(udp_port, [b'0123456789'])
+        received = []
+        assert wait_until(lambda: received.extend(receiver.receive()) or
+                          received)
+        assert received[0][1] == b'0123'
+        assert receiver.truncated == 1
+
+
+@pytest.mark.parametrize('options', [{}, {'batch_size': 8},
+                                     {'queue_size': 16}])
+def test_invalid_datagram(tmp_path, udp_port, wait_until, options):
+    """
+    A datagram which is not utf-8 is counted as error; the other
+    datagrams of the same batch are written.
+    """
+    stream = NoSpaStream(str(tmp_path), udp_port, **options)
+    stream.do_exit = False
+    stream.start_streaming()
+    try:
+        send(udp_port, [DATAGRAM.encode(), b'\xff\xfe;invalid',
+                        DATAGRAM.encode()])
+        assert wait_until(lambda: stream.received == 3)
+    finally:
+        stream.end_streaming()
+    with open(stream.csv_file, encoding='utf-8') as filedescriptor:
+        rows = filedescriptor.read().splitlines()[1:]
+    assert [row.split(';', 1)[1] for row in rows] == [DATAGRAM] * 2
+    assert stream.get_statistics()['loss']['errors'] == 1
+
+
+def test_write_error(tmp_path, udp_port, wait_until, monkeypatch):
+    """
+    A write error (e. g. a full disk) is counted; the receiving goes on.
+    """
+    stream = NoSpaStream(str(tmp_path), udp_port)
+    stream.do_exit = False
+    stream.start_streaming()
+    write_data = stream.write_data
+
+    def full_disk(unixtime, data, port=None):
+        if data == b'full':
+            raise OSError(errno.ENOSPC, 'No space left on device')
+        write_data(unixtime, data, port)
+
+    monkeypatch.setattr(stream, 'write_data', full_disk)
+    try:
+        send(udp_port, [b'full', DATAGRAM.encode()])
+        assert wait_until(lambda: stream.received == 2)
+        assert stream.streaming_running.is_set()
+    finally:
+        stream.end_streaming()
+    with open(stream.csv_file, encoding='utf-8') as filedescriptor:
+        rows = filedescriptor.read().splitlines()[1:]
+    assert [row.split(';', 1)[1] for row in rows] == [DATAGRAM]
+    assert stream.get_statistics()['loss']['errors'] == 1
+
+
+def test_end_streaming(tmp_path, udp_port, wait_until, monkeypatch):
+    """
+    The receiving thread has ended before the session is closed, which
+    happens exactly once.
+    """
+    stream = NoSpaStream(str(tmp_path), udp_port, stats_log=True)
+    stream.do_exit = False
+    stream.start_streaming()
+    calls = []
+    close = stream.loss.close
+
+    def close_once(*args):
+        calls.append(stream.streaming_thread.is_alive())
+        close(*args)
+
+    monkeypatch.setattr(stream.loss, 'close', close_once)
+    send(udp_port, [DATAGRAM.encode()])
+    assert wait_until(lambda: stream.received == 1)
+    stream.end_streaming()
+    assert calls == [False]
+    assert not stream.streaming_running.is_set()
+    with open(stream.csv_file, encoding='utf-8') as filedescriptor:
+        assert len(filedescriptor.read().splitlines()) == 2
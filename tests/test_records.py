@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Tests of the typed records (:mod:`novespace_stream_data.receive.records`).
+"""
+
+from novespace_stream_data.receive import (
+    RecordColumns, RecordParser, add_sequence, parse_record)
+
+DATAGRAM = '36000000;33:59.8;0.18307;-0.013731;0.950486;19;46.2;944;3;' \
+    'STEADY FLIGHT'
+
+
+def test_parse_record():
+    """
+    The fields are typed; port, sequence number and timestamp in front
+    are allowed.
+    """
+    record = parse_record(100.0, DATAGRAM, 3131)
+    assert (record.unixtime, record.port, record.ms, record.time,
+            record.jx, record.jy, record.jz, record.temperature,
+            record.humidity, record.pressure, record.parabola,
+            record.announcement) == \
+        (100.0, 3131, 36000000, 2039.8, 0.18307, -0.013731, 0.950486,
+         19.0, 46.2, 944.0, 3, 'STEADY FLIGHT')
+    for data_str in (f'3131;{DATAGRAM}',
+                     add_sequence(DATAGRAM.encode(), 'a', 1).decode()):
+        assert repr(parse_record(100.0, data_str, 3131)) == repr(record)
+    assert parse_record(100.0, 'invalid;datagram') is None
+    assert not hasattr(record, '__dict__')
+
+
+def test_columns():
+    """
+    Records are stored as rows of preallocated columns.
+    """
+    columns = RecordColumns(capacity=2)
+    record = parse_record(100.0, DATAGRAM)
+    assert not columns.append(record)
+    assert columns.append(parse_record(101.0, DATAGRAM, 3132))
+    assert len(columns) == 2
+    assert columns.column('unixtime').tolist() == [100.0, 101.0]
+    # an unknown port is stored as -1
+    assert columns.column('port').tolist() == [-1, 3132]
+    assert columns.column('parabola').tolist() == [3, 3]
+    assert columns.column('announcement') == ['STEADY FLIGHT'] * 2
+    columns.clear()
+    assert len(columns) == 0
+    assert columns.column('ms').tolist() == []
+
+
+def test_parser():
+    """
+    The handlers get every record and full batches; flush passes the
+    pending batch.
+    """
+    parser = RecordParser(batch_size=2)
+    records = []
+    batches = []
+    parser.add_record_handler(records.append)
+    parser.add_batch_handler(
+        lambda batch: batches.append(batch.column('unixtime').tolist()))
+    for number in range(3):
+        parser(100.0 + number, DATAGRAM)
+    assert parser(103.0, 'invalid;datagram') is None
+    parser.flush()
+    parser.flush()
+    assert [record.unixtime for record in records] == [100.0, 101.0, 102.0]
+    assert batches == [[100.0, 101.0], [102.0]]
+    assert parser.get_statistics() == {'parsed': 3, 'invalid': 1,
+                                       'batches': 2}
@@ -0,0 +1,155 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Tests of :class:`novespace_stream_data.emulate.Replay`.
+"""
+
+import signal
+import socket
+import threading
+
+import pytest
+
+from novespace_stream_data.emulate import Replay
+from novespace_stream_data.emulate.replay import (
+    DAY, index_lines, parse_start_time)
+from novespace_stream_data.scripts.novespace_emulator import (
+    NovespaceStreamEmulator)
+
+LINES = [
+    b'86399800;59:59.8;0.1;0.0;1.0;19;46.2;944;0;STEADY FLIGHT',
+    b'86399900;59:59.9;0.1;0.0;1.0;19;46.2;944;0;STEADY FLIGHT',
+    # after midnight
+    b'0;00:00.0;0.1;0.0;1.8;19;46.2;944;1;PULL UP',
+    b'invalid',
+    b'200;00:00.2;0.1;0.0;1.8;19;46.2;944;1;PULL UP']
+
+
+@pytest.fixture
+def recording(tmp_path):
+    """
+    :return: path of a recording with CRLF line endings and an empty line
+    """
+    path = tmp_path / 'recording.csv'
+    path.write_bytes(b'\r\n'.join(LINES[:3] + [b''] + LINES[3:]) + b'\r\n')
+    return path
+
+
+def test_parse_start_time():
+    """
+    Times of day are converted to miliseconds since 00:00:00.
+    """
+    assert parse_start_time('09:33:59.8') == 34439800
+    assert parse_start_time('09:34') == 34440000
+    assert parse_start_time('34439807') == 34439807
+
+
+def test_index(recording):  # pylint: disable=redefined-outer-name
+    """
+    The times continue after midnight; an invalid time is the one of the
+    line before; empty lines are ignored.
+    """
+    starts, lengths, times = index_lines(recording.read_bytes())
+    assert list(times) == [86399800, 86399900, DAY, DAY, DAY + 200]
+    content = recording.read_bytes()
+    assert [content[start:start + length]
+            for start, length in zip(starts, lengths)] == LINES
+
+
+def test_index_chunks(recording):  # pylint: disable=redefined-outer-name
+    """
+    The index does not depend on the chunk size.
+    """
+    content = recording.read_bytes()
+    assert index_lines(content, 7) == index_lines(content)
+
+
+def test_schedule(recording):  # pylint: disable=redefined-outer-name
+    """
+    The datagrams are scheduled at their recorded times.
+    """
+    with Replay(recording) as replay:
+        schedule = [(offset, bytes(message))
+                    for offset, message in replay.schedule(speed=2.0)]
+    assert [message for _, message in schedule] == LINES
+    assert [offset for offset, _ in schedule] == \
+        pytest.approx([0.0, 0.05, 0.1, 0.1, 0.2])
+
+
+def test_loops(recording):  # pylint: disable=redefined-outer-name
+    """
+    Every further replay starts one mean interval after the last datagram.
+    """
+    with Replay(recording) as replay:
+        offsets = [offset for offset, message in replay.schedule(loops=2)
+                   if not message.release()]
+    assert offsets[5:] == pytest.approx(
+        [offset + 0.5 for offset in offsets[:5]])
+
+
+def test_find_start(recording):  # pylint: disable=redefined-outer-name
+    """
+    The replay starts at a time of day or at a parabola.
+    """
+    with Replay(recording) as replay:
+        assert replay.find_start() == 0
+        assert replay.find_start(start_time=86399850) == 1
+        assert replay.find_start(start_time=100) == 4
+        assert replay.find_start(parabola=1) == 2
+        assert replay.find_start(parabola=2) == len(replay)
+
+
+@pytest.mark.parametrize('preload', [False, True])
+def test_messages(recording, preload):  # pylint: disable=redefined-outer-name
+    """
+    Mapped and preloaded recordings give the original bytes as slices of
+    one buffer without copies.
+    """
+    with Replay(recording, preload) as replay:
+        messages = [replay.message(index) for index in range(len(replay))]
+        assert [bytes(message) for message in messages] == LINES
+        assert all(message.obj is replay.view.obj for message in messages)
+        for message in messages:
+            message.release()
+
+
+def test_emulator(recording, udp_port, monkeypatch):
+    # pylint: disable=redefined-outer-name
+    """
+    The emulator sends every line of a preloaded recording unchanged.
+    """
+    monkeypatch.setattr(signal, 'signal', lambda *_: None)
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(('localhost', udp_port))
+        sock.settimeout(5.0)
+        NovespaceStreamEmulator(
+            str(recording), port=udp_port, sleeptime=0.001, preload=True)()
+        assert [sock.recv(1024) for _ in LINES] == LINES
+
+
+def test_stop_schedule(recording):  # pylint: disable=redefined-outer-name
+    """
+    A mapped recording is closed after an endless schedule is left.
+    """
+    with Replay(recording) as replay:
+        for number, _ in enumerate(replay.schedule(loops=0)):
+            if number == 7:
+                break
+
+
+def test_stop_emulator(recording, udp_port, monkeypatch):
+    # pylint: disable=redefined-outer-name
+    """
+    Stopping an endless replay ends cleanly with the report.
+    """
+    monkeypatch.setattr(signal, 'signal', lambda *_: None)
+    emulator = NovespaceStreamEmulator(
+        str(recording), port=udp_port, sleeptime=0.001, loops=0)
+    timer = threading.Timer(0.2, emulator.stop_event.set)
+    timer.start()
+    emulator()
+    timer.join()
+    assert emulator.streaming_not_running.is_set()
+    assert emulator.pacer.get_report()['sent'] > len(LINES)
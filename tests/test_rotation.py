@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Tests of :class:`novespace_stream_data.receive.RotatingWriter`.
+"""
+
+import gzip
+import json
+
+from novespace_stream_data.receive import (
+    BinaryCaptureWriter, BufferedCSVWriter, CSV_FIELDNAMES, RotatingWriter,
+    find_segments, iter_binary_capture)
+
+
+def datagram(number, parabola=0):
+    """
+    :return: datagram with the given number and parabola
+    """
+    return (f'{36000000 + 100 * number};00:00.0;0.1;0.0;1.0;19;46.2;944;'
+            f'{parabola};STEADY FLIGHT')
+
+
+def write(path, records, writer_class=BufferedCSVWriter, **kwargs):
+    """
+    Write records (tuples unixtime, datagram) with a RotatingWriter.
+
+    :return: manifest
+    """
+    writer = RotatingWriter(writer_class, path, CSV_FIELDNAMES, **kwargs)
+    writer.open()
+    for unixtime, data_str in records:
+        assert writer.write_record(unixtime, data_str)
+    writer.close()
+    writer.close()
+    assert not writer.write_record(0.0, datagram(0))
+    with open(path.with_suffix('.manifest.json'),
+              encoding='utf-8') as filedescriptor:
+        return json.load(filedescriptor)['segments']
+
+
+def test_max_seconds(tmp_path):
+    """
+    A new segment with its own header starts after max_seconds.
+    """
+    segments = write(tmp_path / 'log.csv',
+                     [(100.0 + number, datagram(number))
+                      for number in range(7)], max_seconds=3)
+    assert [segment['name'] for segment in segments] == \
+        ['log_0001.csv', 'log_0002.csv', 'log_0003.csv']
+    assert [segment['rows'] for segment in segments] == [3, 3, 1]
+    assert [segment['first_unixtime'] for segment in segments] == \
+        [100.0, 103.0, 106.0]
+    assert all(segment['closed'] for segment in segments)
+    lines = (tmp_path / 'log_0002.csv').read_text('utf-8').splitlines()
+    assert lines == [';'.join(CSV_FIELDNAMES)] + \
+        [f'{100.0 + number};{datagram(number)}' for number in (3, 4, 5)]
+    assert segments[1]['bytes'] == (tmp_path / 'log_0002.csv').stat().st_size
+
+
+def test_max_bytes_and_parabola(tmp_path):
+    """
+    Segments start after max_bytes and when the parabola changes.
+    """
+    records = [(100.0 + number, datagram(number)) for number in range(6)]
+    segments = write(tmp_path / 'size.csv', records, max_bytes=300)
+    assert [segment['rows'] for segment in segments] == [3, 3]
+    records = [(100.0 + number, datagram(number, number // 2))
+               for number in range(5)]
+    segments = write(tmp_path / 'parabola.csv', records,
+                     per_parabola=True)
+    assert [segment['parabolas'] for segment in segments] == \
+        [[0, 0], [1, 1], [2, 2]]
+
+
+def test_compression(tmp_path):
+    """
+    Closed segments are compressed; the manifest lists all compressed
+    files of a binary capture.
+    """
+    path = tmp_path / 'log.nsb'
+    records = [(100.0 + number, datagram(number)) for number in range(4)]
+    segments = write(path, records, BinaryCaptureWriter, max_seconds=2,
+                     compression='gzip')
+    assert [segment['compressed'] for segment in segments] == \
+        ['log_0001.nsb.gz', 'log_0002.nsb.gz']
+    for segment in segments:
+        assert segment['compressed'] in segment['compressed_files']
+        assert len(segment['compressed_files']) == 2
+        assert not (tmp_path / segment['name']).exists()
+    for name in segments[1]['compressed_files']:
+        with gzip.open(tmp_path / name) as source:
+            (tmp_path / name[:-3]).write_bytes(source.read())
+    assert list(iter_binary_capture(tmp_path / 'log_0002.nsb')) == \
+        records[2:]
+
+
+def test_find_segments(tmp_path):
+    """
+    The segments overlapping a time range are found in the manifest.
+    """
+    path = tmp_path / 'log.csv'
+    write(path, [(100.0 + number, datagram(number))
+                 for number in range(6)], max_seconds=2,
+          compression='gzip')
+    found = find_segments(path.with_suffix('.manifest.json'), 102.5, 103.5)
+    assert [(found_path.name, segment['rows'])
+            for found_path, segment in found] == [('log_0002.csv.gz', 2)]
+    assert len(find_segments(path.with_suffix('.manifest.json'))) == 3
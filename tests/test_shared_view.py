@@ -0,0 +1,135 @@
+# SPDX-FileCopyrightText: 2026 Daniel Maier, Daniel Mohr, Thomas Villatte
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Tests of the live view in shared memory
+(:mod:`novespace_stream_data.receive.shared_view`).
+"""
+
+import os
+import sys
+import threading
+from multiprocessing import resource_tracker, shared_memory
+
+import pytest
+
+from novespace_stream_data.receive import (
+    SharedView, SharedViewReader, parse_record)
+from novespace_stream_data.receive.shared_view import HEADER, SEQUENCE
+
+
+def record(number):
+    """
+    :return: Record with ms, jx and parabola derived from the number
+    """
+    return parse_record(
+        100.0 + number,
+        f'{36000000 + 100 * number};00:00.0;{number};0.0;1.0;19;46.2;944;'
+        f'{number % 7};STEADY FLIGHT', 3131)
+
+
+def reregister(name):
+    """
+    Register a block again with the resource tracker: before python 3.13
+    a reader unregisters it, but here the writer in the same process
+    still owns it.
+    """
+    if sys.version_info < (3, 13):
+        resource_tracker.register(f'/{name}', 'shared_memory')
+
+
+@pytest.fixture(name='view')
+def fixture_view():
+    """
+    :return: tuple (SharedView, SharedViewReader) with a capacity of 4
+    """
+    name = f'novespace_stream_data_test_{os.getpid()}'
+    view = SharedView(name, capacity=4)
+    reader = SharedViewReader(name)
+    reregister(name)
+    yield view, reader
+    reader.close()
+    view.close()
+
+
+def test_latest_and_recent(view):
+    """
+    The latest record and the recent records are read, oldest first.
+    """
+    view, reader = view
+    assert reader.latest() is None
+    assert not reader.recent()
+    for number in range(3):
+        view.add_record(record(number))
+    assert repr(reader.latest()) == repr(record(2))
+    assert [repr(entry) for entry in reader.recent()] == \
+        [repr(record(number)) for number in range(3)]
+    for number in range(3, 10):
+        view.add_record(record(number))
+    assert reader.count == 10
+    assert [entry.ms for entry in reader.recent()] == \
+        [36000000 + 100 * number for number in range(6, 10)]
+    assert [entry.ms for entry in reader.recent(2)] == \
+        [36000800, 36000900]
+
+
+def test_seqlock(view):
+    """
+    A slot which is being written is not read; an overwritten slot is
+    left out of the recent records.
+    """
+    view, reader = view
+    for number in range(5):
+        view.add_record(record(number))
+    (sequence,) = SEQUENCE.unpack_from(view.buffer, HEADER.size)
+    SEQUENCE.pack_into(view.buffer, HEADER.size, sequence + 1)
+    assert reader.latest() is None
+    SEQUENCE.pack_into(view.buffer, HEADER.size, sequence)
+    assert reader.latest().ms == 36000400
+    # the ring slot of record 1 is written again in the next round
+    SEQUENCE.pack_into(view.buffer, HEADER.size + 128 * 2, 4)
+    assert [entry.ms for entry in reader.recent()] == \
+        [36000200, 36000300, 36000400]
+
+
+def test_concurrent_writer(view):
+    """
+    A reader never gets a record mixed of two writes.
+    """
+    view, reader = view
+    stop = threading.Event()
+
+    def write():
+        number = 0
+        while not stop.is_set():
+            view.add_record(record(number))
+            number += 1
+
+    thread = threading.Thread(target=write)
+    thread.start()
+    try:
+        for _ in range(2000):
+            latest = reader.latest()
+            if latest is not None:
+                number = round(latest.jx)
+                assert latest.ms == 36000000 + 100 * number
+                assert latest.parabola == number % 7
+    finally:
+        stop.set()
+        thread.join()
+
+
+def test_invalid_block():
+    """
+    A shared memory block of another program is refused.
+    """
+    name = f'novespace_stream_data_other_{os.getpid()}'
+    memory = shared_memory.SharedMemory(name, True, 256)
+    try:
+        with pytest.raises(ValueError):
+            SharedViewReader(name)
+        reregister(name)
+    finally:
+        memory.close()
+        memory.unlink()